@@ -0,0 +1,260 @@
+#! /usr/bin/python3
+"""
+Live table of the translation builds of many engines.
+
+A single listing request (`translation_builds_get_all_builds_created_after`) refreshes every
+build at once and discovers new ones. The listing is repeated with an adaptive interval: it is
+shortened whenever something changed and doubled when nothing did or the request failed.
+Builds that are still pending or active are also long-polled with `min_revision` through a
+BuildWatcher, which keeps one poll pending for every such build, so their rows update as soon
+as the server reports a change.
+"""
+import argparse
+import datetime
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Set
+
+import requests
+from serval_auth_module import ServalBearerAuth
+from serval_build_watcher import TERMINAL_BUILD_STATES, BuildEvent, BuildWatcher
+from serval_client import RemoteCaller
+from serval_client_module import TranslationBuild
+
+
+class BuildDashboard:
+    def __init__(
+        self,
+        client: RemoteCaller,
+        created_after: str,
+        engine_ids: Optional[Iterable[str]] = None,
+        max_watches: int = 1000,
+        min_interval: float = 5,
+        max_interval: float = 120,
+    ):
+        self._client = client
+        self._created_after = created_after
+        self._engine_ids: Optional[Set[str]] = (
+            set(engine_ids) if engine_ids is not None else None
+        )
+        self._watcher = BuildWatcher(
+            client, max_watches=max_watches, on_event=self._on_event
+        )
+        self._lock = threading.Lock()
+        self._builds: Dict[str, TranslationBuild] = {}
+        self._errors: Dict[str, str] = {}
+        self._watches: Dict[str, "Future[TranslationBuild]"] = {}
+        self._changed = False
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+
+    def _include(self, build: TranslationBuild) -> bool:
+        return self._engine_ids is None or build.engine.id in self._engine_ids
+
+    def _update(self, build: TranslationBuild) -> bool:
+        """Stores the build unless a newer revision is already known; returns whether it changed."""
+        with self._lock:
+            current = self._builds.get(build.id)
+            if current is not None and current.revision >= build.revision:
+                return False
+            self._builds[build.id] = build
+            self._errors.pop(build.id, None)
+            self._changed = True
+            return True
+
+    def _on_event(self, event: BuildEvent) -> None:
+        self._update(event.build)
+
+    def _on_watch_done(self, build_id: str, future: "Future[TranslationBuild]") -> None:
+        with self._lock:
+            del self._watches[build_id]
+        if not future.cancelled() and future.exception() is not None:
+            # The next refresh starts a new watch if the build is still running.
+            with self._lock:
+                self._errors[build_id] = str(future.exception())
+
+    def refresh(self) -> bool:
+        """
+        Lists the builds, starts watching the unfinished ones and adapts the refresh interval.
+
+        :return: True if any build was added or changed since the previous refresh
+        """
+        try:
+            builds = self._client.translation_builds_get_all_builds_created_after(
+                self._created_after
+            )
+        except requests.RequestException:
+            self.interval = min(self.interval * 2, self.max_interval)
+            raise
+        for build in builds:
+            if not self._include(build):
+                continue
+            self._update(build)
+            if build.state in TERMINAL_BUILD_STATES:
+                continue
+            with self._lock:
+                if build.id in self._watches:
+                    continue
+                future = self._watcher.watch(build.engine.id, build.id)
+                self._watches[build.id] = future
+            future.add_done_callback(
+                lambda f, build_id=build.id: self._on_watch_done(build_id, f)
+            )
+        with self._lock:
+            changed, self._changed = self._changed, False
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        return changed
+
+    def snapshot(self) -> List[TranslationBuild]:
+        """Returns the latest known state of every build, oldest first."""
+        with self._lock:
+            return sorted(self._builds.values(), key=lambda b: b.date_created or "")
+
+    def error(self, build_id: str) -> Optional[str]:
+        with self._lock:
+            return self._errors.get(build_id)
+
+    @property
+    def active_watches(self) -> int:
+        with self._lock:
+            return len(self._watches)
+
+    def close(self) -> None:
+        self._watcher.close()
+
+    def __enter__(self) -> "BuildDashboard":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def format_table(dashboard: BuildDashboard, active_only: bool) -> str:
+    header = (
+        f"{'ENGINE':<26} {'BUILD':<26} {'STATE':<10} {'PROGRESS':>8} "
+        f"{'QUEUE':>5} {'REV':>5}  PHASES"
+    )
+    lines = [header]
+    for build in dashboard.snapshot():
+        if active_only and build.state in TERMINAL_BUILD_STATES:
+            continue
+        progress = f"{build.progress * 100:.1f}%" if build.progress is not None else "-"
+        queue_depth = build.queue_depth if build.queue_depth is not None else "-"
+        phases = " > ".join(
+            phase.stage
+            + (f" {phase.step}/{phase.step_count}" if phase.step_count else "")
+            for phase in build.phases or []
+        )
+        line = (
+            f"{build.engine.id:<26} {build.id:<26} {build.state:<10} {progress:>8} "
+            f"{queue_depth:>5} {build.revision:>5}  {phases or '-'}"
+        )
+        error = dashboard.error(build.id)
+        if error is not None:
+            line += f"  (watch failed: {error})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Show a live table of the translation builds of many engines"
+    )
+    parser.add_argument(
+        "--engine-id",
+        action="append",
+        default=None,
+        help="Only show builds of this engine (can be repeated; if none is provided, all engines are shown)",
+    )
+    parser.add_argument(
+        "--since-hours",
+        type=float,
+        default=24,
+        help="Show builds created in the last this many hours",
+    )
+    parser.add_argument(
+        "--max-watches",
+        type=int,
+        default=1000,
+        help="Maximum number of builds long-polled at once; each holds a connection",
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=5,
+        help="Seconds between build listings while builds are changing",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=120,
+        help="Upper bound of the seconds between build listings when nothing changes",
+    )
+    parser.add_argument(
+        "--refresh", type=float, default=2, help="Seconds between redraws of the table"
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="Also show finished builds"
+    )
+    parser.add_argument(
+        "--client-id",
+        default="",
+        help="Serval client id (if none is provided env var SERVAL_CLIENT_ID will be used)",
+    )
+    parser.add_argument(
+        "--client-secret",
+        default="",
+        help="Serval client secret (if none is provided env var SERVAL_CLIENT_SECRET will be used)",
+    )
+    args = parser.parse_args()
+
+    serval_auth = ServalBearerAuth(
+        client_id=args.client_id, client_secret=args.client_secret
+    )
+    client = RemoteCaller(
+        url_prefix=os.environ.get("SERVAL_HOST_URL"), auth=serval_auth
+    )
+
+    created_after = (
+        datetime.datetime.now(datetime.timezone.utc)
+        - datetime.timedelta(hours=args.since_hours)
+    ).strftime("%Y-%m-%dT%H:%M:%SZ")
+    with BuildDashboard(
+        client,
+        created_after,
+        engine_ids=args.engine_id,
+        max_watches=args.max_watches,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+    ) as dashboard:
+        next_refresh = 0.0
+        status = ""
+        try:
+            while True:
+                if time.monotonic() >= next_refresh:
+                    try:
+                        dashboard.refresh()
+                        status = ""
+                    except requests.RequestException as e:
+                        status = f"Failed to list builds: {e}"
+                    next_refresh = time.monotonic() + dashboard.interval
+                # Clear the terminal and redraw the table from the top.
+                print("\x1b[2J\x1b[H", end="")
+                print(format_table(dashboard, active_only=not args.all))
+                print(
+                    f"\n{dashboard.active_watches} builds watched, next listing in "
+                    f"{max(next_refresh - time.monotonic(), 0):.0f}s. {status}"
+                )
+                time.sleep(args.refresh)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
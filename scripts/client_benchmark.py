@@ -0,0 +1,359 @@
+import argparse
+import contextlib
+import gc
+import json
+import random
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List
+
+import requests
+import serval_client_module
+from serval_client import (
+    _FROM_OBJ_BY_TYPE,
+    _TO_JSONABLE_BY_TYPE,
+    RemoteCaller,
+    from_obj,
+    to_jsonable,
+    trusted_from_obj,
+)
+from serval_client_module import (
+    AlignedWordPair,
+    Phrase,
+    Pretranslation,
+    TranslationResult,
+    WordAlignment,
+    WordGraphArc,
+)
+from serval_client_support import _JSON_CODECS, get_json_codec
+from serval_columns import AlignedWordPairColumns, WordGraphArcColumns
+
+SLOTTED_MODELS = [Pretranslation, WordAlignment, AlignedWordPair, WordGraphArc, TranslationResult, Phrase]
+
+
+def make_pretranslations(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "textId": "MAT",
+            "sourceRefs": [f"MAT {i // 30 + 1}:{i % 30 + 1}"],
+            "targetRefs": [f"MAT {i // 30 + 1}:{i % 30 + 1}"],
+            "refs": [f"MAT {i // 30 + 1}:{i % 30 + 1}"],
+            "translation": "In the beginning was the Word, and the Word was with God.",
+        }
+        for i in range(count)
+    ]
+
+
+def make_word_alignments(count: int, pairs_per_segment: int = 12) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    return [
+        {
+            "textId": "MAT",
+            "sourceRefs": [f"MAT {i // 30 + 1}:{i % 30 + 1}"],
+            "targetRefs": [f"MAT {i // 30 + 1}:{i % 30 + 1}"],
+            "refs": [f"MAT {i // 30 + 1}:{i % 30 + 1}"],
+            "sourceTokens": ["Βίβλος", "γενέσεως", "Ἰησοῦ", "Χριστοῦ"] * 3,
+            "targetTokens": ["The", "book", "of", "the", "genealogy"] * 3,
+            "alignment": [
+                {"sourceIndex": j, "targetIndex": j, "score": rng.random()}
+                for j in range(pairs_per_segment)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def make_aligned_word_pairs(count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    return [
+        {"sourceIndex": i % 40, "targetIndex": (i * 7) % 40, "score": rng.random()}
+        for i in range(count)
+    ]
+
+
+def make_word_graph_arcs(count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    return [
+        {
+            "prevState": i,
+            "nextState": i + 1,
+            "score": -rng.random() * 10,
+            "targetTokens": ["the", "book"],
+            "confidences": [rng.random(), rng.random()],
+            "sourceSegmentStart": i % 4,
+            "sourceSegmentEnd": i % 4 + 1,
+            "alignment": [{"sourceIndex": 0, "targetIndex": 1}],
+            "sources": [["Smt"], ["Smt"]],
+        }
+        for i in range(count)
+    ]
+
+
+def make_translation_results(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "translation": "the book of the genealogy of Jesus Christ",
+            "sourceTokens": ["Βίβλος", "γενέσεως", "Ἰησοῦ", "Χριστοῦ"],
+            "targetTokens": ["the", "book", "of", "the", "genealogy", "of", "Jesus", "Christ"],
+            "confidences": [0.5] * 8,
+            "sources": [["Smt"]] * 8,
+            "alignment": [{"sourceIndex": j // 2, "targetIndex": j} for j in range(8)],
+            "phrases": [{"sourceSegmentStart": 0, "sourceSegmentEnd": 4, "targetSegmentCut": 8}],
+        }
+        for _ in range(count)
+    ]
+
+
+def chained_from_obj(obj: Any, expected: List[type], path: str = "") -> Any:
+    """Replicates the former from_obj, which found the converter by walking an if-chain of types."""
+    exp = expected[0]
+    if exp == float:
+        return float(obj)
+    if exp in [bool, int, str, list, dict]:
+        if not isinstance(obj, exp):
+            raise ValueError(f"Expected object of type {exp} at {path!r}, but got {type(obj)}.")
+    if exp in [bool, int, float, str]:
+        return obj
+    if exp == list:
+        lst = []
+        for i, value in enumerate(obj):
+            lst.append(chained_from_obj(value, expected=expected[1:], path="{}[{}]".format(path, i)))
+        return lst
+    if exp == dict:
+        return {
+            key: chained_from_obj(value, expected=expected[1:], path="{}[{!r}]".format(path, key))
+            for key, value in obj.items()
+        }
+    for typ, func in _FROM_OBJ_BY_TYPE.items():
+        if exp == typ:
+            return func(obj, path=path)
+    raise ValueError(f"Unexpected `expected` type: {exp}")
+
+
+def chained_to_jsonable(obj: Any, expected: List[type], path: str = "") -> Any:
+    """Replicates the former to_jsonable, which found the converter by walking an if-chain of types."""
+    exp = expected[0]
+    if not isinstance(obj, exp):
+        raise ValueError(f"Expected object of type {exp} at path {path!r}, but got {type(obj)}.")
+    if exp in (bool, int, float, str):
+        return obj
+    if exp == list:
+        lst = []
+        for i, value in enumerate(obj):
+            lst.append(chained_to_jsonable(value, expected=expected[1:], path="{}[{}]".format(path, i)))
+        return lst
+    if exp == dict:
+        return {
+            key: chained_to_jsonable(value, expected=expected[1:], path="{}[{!r}]".format(path, key))
+            for key, value in obj.items()
+        }
+    for typ, func in _TO_JSONABLE_BY_TYPE.items():
+        if exp == typ:
+            assert isinstance(obj, typ)
+            return func(obj, path=path)
+    raise ValueError(f"Unexpected `expected` type: {exp}")
+
+
+@contextlib.contextmanager
+def chained_dispatch():
+    """Temporarily installs the if-chain dispatchers so that nested conversions use them as well."""
+    saved = serval_client_module.from_obj, serval_client_module.to_jsonable
+    serval_client_module.from_obj = chained_from_obj
+    serval_client_module.to_jsonable = chained_to_jsonable
+    try:
+        yield
+    finally:
+        serval_client_module.from_obj, serval_client_module.to_jsonable = saved
+
+
+def unslotted(cls: type) -> type:
+    """Returns a copy of a generated model class that keeps its attributes in a per-instance __dict__."""
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in cls.__slots__ and name not in ("__slots__", "__dict__", "__weakref__")
+    }
+    return type(cls.__name__, (), namespace)
+
+
+@contextlib.contextmanager
+def unslotted_models() -> Iterator[None]:
+    """Temporarily makes the converters create instances of the unslotted model classes."""
+    saved = {cls.__name__: cls for cls in SLOTTED_MODELS}
+    for name, cls in saved.items():
+        replacement = unslotted(cls)
+        setattr(serval_client_module, name, replacement)
+        # Nested fields are converted by looking up the (replaced) class in the dispatch table.
+        _FROM_OBJ_BY_TYPE[replacement] = _FROM_OBJ_BY_TYPE[cls]
+    try:
+        yield
+    finally:
+        for name, cls in saved.items():
+            replacement = getattr(serval_client_module, name)
+            del _FROM_OBJ_BY_TYPE[replacement]
+            setattr(serval_client_module, name, cls)
+
+
+def allocated(func: Callable[[], Any]) -> int:
+    """Returns the number of bytes still allocated for the result of func."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def run(name: str, func: Callable[[], Any], repeat: int) -> float:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"  {name:<28} {best * 1000:10.1f} ms")
+    return best
+
+
+def bench_dispatch(count: int, repeat: int) -> None:
+    for model, payload in (
+        (Pretranslation, make_pretranslations(count)),
+        (WordAlignment, make_word_alignments(count)),
+    ):
+        print(f"List[{model.__name__}] x {count}")
+        with chained_dispatch():
+            chained = run("from_obj (if-chain)", lambda: chained_from_obj(payload, [list, model]), repeat)
+        table = run("from_obj (dispatch table)", lambda: from_obj(payload, [list, model]), repeat)
+        print(f"  speedup: {chained / table:.2f}x")
+
+        objs = from_obj(payload, [list, model])
+        with chained_dispatch():
+            chained = run("to_jsonable (if-chain)", lambda: chained_to_jsonable(objs, [list, model]), repeat)
+        table = run("to_jsonable (dispatch table)", lambda: to_jsonable(objs, [list, model]), repeat)
+        print(f"  speedup: {chained / table:.2f}x")
+
+
+def bench_memory(count: int) -> None:
+    per = 100_000 / count
+    print(f"Memory per 100k records (measured over {count})")
+    for model, payload in (
+        (Pretranslation, make_pretranslations(count)),
+        (WordAlignment, make_word_alignments(count)),
+        (AlignedWordPair, make_aligned_word_pairs(count)),
+        (WordGraphArc, make_word_graph_arcs(count)),
+        (TranslationResult, make_translation_results(count)),
+    ):
+        with unslotted_models():
+            before = allocated(lambda: from_obj(payload, [list, model]))
+        after = allocated(lambda: from_obj(payload, [list, model]))
+        print(
+            f"  {model.__name__:<20} __dict__ {before * per / 2**20:8.1f} MiB"
+            f"   __slots__ {after * per / 2**20:8.1f} MiB   ({after / before:.0%})"
+        )
+        columns_type = {AlignedWordPair: AlignedWordPairColumns, WordGraphArc: WordGraphArcColumns}.get(model)
+        if columns_type is not None:
+
+            def to_columns():
+                columns = columns_type()
+                for obj in payload:
+                    columns.append_jsonable(obj)
+                return columns
+
+            size = allocated(to_columns)
+            print(f"  {model.__name__ + ' columns':<20} {size * per / 2**20:17.1f} MiB   ({size / before:.0%})")
+
+
+def bench_trusted(count: int, repeat: int) -> None:
+    for model, payload in (
+        (Pretranslation, make_pretranslations(count)),
+        (WordAlignment, make_word_alignments(count)),
+        (TranslationResult, make_translation_results(count)),
+    ):
+        print(f"List[{model.__name__}] x {count}")
+        trusted_from_obj(payload[:1], [list, model])  # compiles the converters
+        checked = run("from_obj (validated)", lambda: from_obj(payload, [list, model]), repeat)
+        trusted = run("trusted_from_obj", lambda: trusted_from_obj(payload, [list, model]), repeat)
+        print(
+            f"  {count / checked:,.0f} -> {count / trusted:,.0f} records/s, speedup: {checked / trusted:.2f}x"
+        )
+
+
+class CannedAdapter(requests.adapters.BaseAdapter):
+    """Answers every request with the same JSON body, so that client calls run without a server."""
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.body = body
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers["Content-Type"] = "application/json"
+        resp._content = self.body
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def bench_codecs(count: int, repeat: int) -> None:
+    for name, payload, call in (
+        (
+            "Pretranslation",
+            make_pretranslations(count),
+            lambda client: client.translation_engines_get_all_pretranslations("engine", "corpus"),
+        ),
+        (
+            "WordAlignment",
+            make_word_alignments(count),
+            lambda client: client.word_alignment_engines_get_all_word_alignments("engine", "corpus"),
+        ),
+    ):
+        body = json.dumps(payload).encode("utf-8")
+        session = requests.Session()
+        session.mount("http://", CannedAdapter(body))
+        print(f"List[{name}] x {count} ({len(body) / 2**20:.1f} MiB)")
+        for codec_name in _JSON_CODECS:
+            try:
+                codec = get_json_codec(codec_name)
+            except ImportError:
+                print(f"  {codec_name:<28} not installed")
+                continue
+            run(f"{codec_name} loads", lambda: codec.loads(body), repeat)
+            run(f"{codec_name} dumps", lambda: codec.dumps(payload), repeat)
+            # The whole listing call: request, decoding and conversion to model objects.
+            client = RemoteCaller(url_prefix="http://serval.test/api/v1", session=session, json_codec=codec)
+            run(f"{codec_name} listing call", lambda: call(client), repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for the generated Serval client (no server required)"
+    )
+    parser.add_argument(
+        "--count", type=int, default=50_000, help="Number of records in the synthetic listings"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of timed repetitions (the best one is reported)"
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["dispatch", "memory", "trusted", "codec"],
+        action="append",
+        help="Benchmark to run (can be repeated; if none is provided, all are run)",
+    )
+    args = parser.parse_args()
+
+    suites = args.suite or ["dispatch", "memory", "trusted", "codec"]
+    if "dispatch" in suites:
+        bench_dispatch(args.count, args.repeat)
+    if "memory" in suites:
+        bench_memory(args.count)
+    if "trusted" in suites:
+        bench_trusted(args.count, args.repeat)
+    if "codec" in suites:
+        bench_codecs(args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,84 @@
 # %%
+import datetime
 import os
-import time
 
-import pandas as pd
+import requests
 from serval_auth_module import ServalBearerAuth
-from serval_client_module import RemoteCaller
+from serval_bulk_delete import (
+    Checkpoint,
+    delete_files,
+    select_files_from_csv,
+    select_files_from_mongo,
+)
+from serval_client import RemoteCaller
+from serval_client_support import RetryPolicy
+
+# If True, only the number of files that would be deleted is reported.
+DRY_RUN = True
+# Maximum number of deletes started per second and waiting for a response.
+DELETES_PER_SECOND = 20
+MAX_IN_FLIGHT = 8
+# Ids of the files that have been deleted; rerunning skips them.
+CHECKPOINT_PATH = "deleted_files.jsonl"
+# Files are selected from this export, or from MongoDB if MONGO_CONNECTION_STRING is set.
+FILES_CSV_PATH = "prod_serval.data_files.files.csv"
+NAME_PATTERN = "[0-9]+_[0-9]+"
+# Only files older than this are deleted (None for no age limit).
+MIN_AGE_DAYS = None
 
 # %%
 
 serval_auth = ServalBearerAuth()
-client = RemoteCaller(url_prefix=os.environ.get("SERVAL_HOST_URL"), auth=serval_auth)
-
-# %%
-files_df = pd.read_csv("prod_serval.data_files.files.csv")
+session = requests.Session()
+session.auth = serval_auth
+adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(MAX_IN_FLIGHT, 10))
+session.mount("http://", adapter)
+session.mount("https://", adapter)
+# Deletes are idempotent, so throttled (429) and unavailable (503) responses are retried.
+client = RemoteCaller(
+    url_prefix=os.environ.get("SERVAL_HOST_URL"),
+    auth=serval_auth,
+    session=session,
+    retry_policy=RetryPolicy(),
+)
 
 # %%
 owner = os.environ.get("SERVAL_CLIENT_ID")
 print(owner)
-files_df = files_df[files_df["owner"] == f"{owner}@clients"]
-print(f"{len(files_df)} files with client {owner} as owner.")
-files_df = files_df[files_df["name"].str.contains("[0-9]+_[0-9]+")]
-num_of_files_to_delete = len(files_df)
-print(f"{num_of_files_to_delete} files with name pattern [0-9]+_[0-9]+.")
+created_before = (
+    datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=MIN_AGE_DAYS)
+    if MIN_AGE_DAYS is not None
+    else None
+)
+if "MONGO_CONNECTION_STRING" in os.environ:
+    file_ids = select_files_from_mongo(
+        os.environ["MONGO_CONNECTION_STRING"],
+        f"{owner}@clients",
+        NAME_PATTERN,
+        created_before,
+    )
+else:
+    file_ids = select_files_from_csv(
+        FILES_CSV_PATH, f"{owner}@clients", NAME_PATTERN, created_before
+    )
 
 # %%
-for i in range(num_of_files_to_delete):
-    file_id = files_df.iloc[i]["_id"]
-    print(f"Deleting file {i} with id {file_id}.")
-    client.data_files_get(file_id)
-    # client.data_files_delete(file_id)
-    # wait 0.1 seconds
-    time.sleep(0.1)
+# The ids are selected lazily while the files are deleted.
+with Checkpoint(CHECKPOINT_PATH) as checkpoint:
+    stats = delete_files(
+        client,
+        file_ids,
+        checkpoint,
+        rate=DELETES_PER_SECOND,
+        max_in_flight=MAX_IN_FLIGHT,
+        dry_run=DRY_RUN,
+    )
+if DRY_RUN:
+    print(
+        f"Dry run: {stats.total} files with client {owner} as owner and name pattern "
+        f"{NAME_PATTERN}, {stats.total - stats.skipped} of them would be deleted."
+    )
+else:
+    print(stats)
 
 # %%
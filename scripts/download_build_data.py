@@ -1,11 +1,139 @@
 import argparse
-import os
-from serval_client_module import RemoteCaller, TranslationBuild
-from serval_auth_module import ServalBearerAuth
-from dateutil.parser import parse
+import contextlib
 import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional, Set
 from zipfile import ZipFile
 
+import requests
+from dateutil.parser import parse
+from serval_auth_module import ServalBearerAuth
+from serval_client import RemoteCaller
+from serval_client_module import TranslationBuild
+from serval_client_support import STREAM_CHUNK_SIZE, RetryPolicy
+
+
+class Spool:
+    """
+    Directory of downloaded payloads with a manifest of the completed downloads.
+
+    Payloads are only recorded in the manifest once they have been fully written, so a run that
+    is interrupted can be restarted with the same directory without fetching them again.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self.directory / "manifest.jsonl"
+        self._lock = threading.Lock()
+        self._keys: Set[str] = set()
+        if self._manifest_path.exists():
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line is incomplete if the run was killed while writing it.
+                        continue
+                    self._keys.add(entry["key"])
+
+    def _record(self, key: str) -> None:
+        with self._lock:
+            self._keys.add(key)
+            with open(self._manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key}) + "\n")
+
+    def _path(self, key: str) -> Path:
+        return self.directory / "data" / key
+
+    def fetch_file(self, key: str, download: Callable[[], BinaryIO]) -> Path:
+        path = self._path(key)
+        if key in self._keys and path.exists():
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.part")
+        with contextlib.closing(download()) as src, open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+        os.replace(tmp_path, path)
+        self._record(key)
+        return path
+
+    def fetch_text(self, key: str, fetch: Callable[[], str]) -> Path:
+        path = self._path(key)
+        if key in self._keys and path.exists():
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.part")
+        tmp_path.write_text(fetch(), encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._record(key)
+        return path
+
+
+class ArchiveWriter:
+    """Writes entries to a zip file from a single background thread."""
+
+    def __init__(self, zip_path: str):
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._zip_obj = ZipFile(zip_path, "w")
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="zip-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        with self._zip_obj:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                if self._error is not None:
+                    continue
+                kind, arcname, payload = item
+                try:
+                    if kind == "file":
+                        with open(payload, "rb") as src, self._zip_obj.open(
+                            arcname, "w", force_zip64=True
+                        ) as dst:
+                            shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+                    else:
+                        self._zip_obj.writestr(arcname, payload)
+                except BaseException as e:
+                    self._error = e
+
+    def add_file(self, arcname: str, path: Path) -> None:
+        self._queue.put(("file", arcname, path))
+
+    def add_str(self, arcname: str, data: str) -> None:
+        self._queue.put(("str", arcname, data))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def resolve_futures(value: Any) -> Any:
+    if isinstance(value, Future):
+        return value.result()
+    if isinstance(value, list):
+        return [resolve_futures(v) for v in value]
+    if isinstance(value, dict):
+        return {k: resolve_futures(v) for k, v in value.items()}
+    return value
+
 
 def main():
     parser = argparse.ArgumentParser(description="Zip engine data and corpora data")
@@ -28,23 +156,49 @@ def main():
     parser.add_argument(
         "--output", default="engine_data.zip", help="Output zip filename"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files and USFM books to download concurrently",
+    )
+    parser.add_argument(
+        "--spool-dir",
+        default=None,
+        help="Directory to download into before zipping; rerunning with the same directory resumes an interrupted run (if none is provided, a temporary directory is used)",
+    )
     args = parser.parse_args()
 
     serval_auth = ServalBearerAuth(
         client_id=args.client_id, client_secret=args.client_secret
     )
+    session = requests.Session()
+    session.auth = serval_auth
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(args.jobs, 10))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     client = RemoteCaller(
-        url_prefix=os.environ.get("SERVAL_HOST_URL"), auth=serval_auth
+        url_prefix=os.environ.get("SERVAL_HOST_URL"),
+        auth=serval_auth,
+        session=session,
+        retry_policy=RetryPolicy(),
     )
 
     engine = client.translation_engines_get(args.engine_id)
     builds: list[TranslationBuild]
+    finished_builds = [
+        b
+        for b in client.translation_engines_get_all_builds(args.engine_id)
+        if b.date_finished is not None
+    ]
+    finished_builds.sort(key=lambda b: parse(b.date_finished), reverse=True)
     if args.build_id is None:
-        builds = client.translation_engines_get_all_builds(args.engine_id)
-        builds.sort(key=lambda b: parse(b.date_finished), reverse=True)
-        builds = builds[: min(10, len(builds))]
+        builds = finished_builds[: min(10, len(finished_builds))]
     else:
         builds = [client.translation_engines_get_build(args.engine_id, args.build_id)]
+    # The pretranslated USFM is generated from the engine's last finished build, so a spooled
+    # copy is only reused while that is still the last build.
+    usfm_build_id = finished_builds[0].id if finished_builds else "none"
     corpora = client.translation_engines_get_all_corpora(args.engine_id)
     corpora_objs = []
     parallel_corpora = client.translation_engines_get_all_parallel_corpora(
@@ -52,60 +206,93 @@ def main():
     )
     parallel_corpora_objs = []
     pretranslation_objs = []
-    with ZipFile(args.output, "w") as zip_obj:
+    with contextlib.ExitStack() as stack:
+        spool = Spool(
+            args.spool_dir
+            if args.spool_dir is not None
+            else stack.enter_context(tempfile.TemporaryDirectory())
+        )
+        writer = stack.enter_context(ArchiveWriter(args.output))
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=args.jobs))
+
+        # Each data file is downloaded and stored in the archive once, at the location of its first
+        # reference. The metadata of every reference records the archive path of the stored entry.
+        stored_files: Dict[str, "Future[Dict]"] = {}
+
+        def store_file(arcdir: str, file_id: str) -> Dict:
+            file_meta = client.data_files_get(file_id).to_jsonable()
+            path = spool.fetch_file(
+                f"files/{file_id}/{file_meta['revision']}",
+                lambda: client.data_files_download(file_id),
+            )
+            arcname = f"{arcdir}/{file_meta['name']}"
+            writer.add_file(arcname, path)
+            return {**file_meta, "path": arcname}
+
+        def add_file(arcdir: str, file_id: str, text_id: str) -> "Future[Dict]":
+            if file_id not in stored_files:
+                stored_files[file_id] = executor.submit(store_file, arcdir, file_id)
+            reference: "Future[Dict]" = Future()
+
+            # Completed when the stored file is, without occupying a worker in the meantime.
+            def resolve(stored: "Future[Dict]") -> None:
+                error = stored.exception()
+                if error is not None:
+                    reference.set_exception(error)
+                else:
+                    reference.set_result({**stored.result(), "textId": text_id})
+
+            stored_files[file_id].add_done_callback(resolve)
+            return reference
+
+        def add_pretranslated_usfm(arcdir: str, corpus_id: str, text_id: str, label: str):
+            def task():
+                try:
+                    path = spool.fetch_text(
+                        f"usfm/{args.engine_id}/{usfm_build_id}/{corpus_id}/{text_id}.usfm",
+                        lambda: client.translation_engines_get_pretranslated_usfm(
+                            args.engine_id, corpus_id, text_id
+                        ),
+                    )
+                    writer.add_file(f"{arcdir}/pretranslated_usfm/{text_id}.usfm", path)
+                except Exception as e:
+                    print(
+                        f"Failed to get usfm for {text_id} (engine={args.engine_id}, {label}={corpus_id}) due to exception {e}"
+                    )
+
+            return executor.submit(task)
+
+        usfm_futures = []
+
         # MONOLINGUAL CORPORA (DEPRECATED)
         for corpus in corpora:
             obj = corpus.to_jsonable()
-            obj["sourceFilesMeta"] = []
-            for f in corpus.source_files:
-                file_id = f.file.id
-                file_data = client.data_files_download(file_id)
-                file_meta = client.data_files_get(file_id)
-                zip_obj.writestr(
-                    f"corpora/{corpus.id}/src/{file_meta.name}",
-                    file_data.read(),
-                )
-                file_meta = file_meta.to_jsonable()
-                file_meta["textId"] = f.text_id
-                obj["sourceFilesMeta"].append(file_meta)
-
-            obj["targetFilesMeta"] = []
-            for f in corpus.target_files:
-                file_id = f.file.id
-                file_data = client.data_files_download(file_id)
-                file_meta = client.data_files_get(file_id)
-                zip_obj.writestr(
-                    f"corpora/{corpus.id}/trg/{file_meta.name}",
-                    file_data.read(),
-                )
-                file_meta = file_meta.to_jsonable()
-                file_meta["textId"] = f.text_id
-                obj["targetFilesMeta"].append(file_meta)
+            obj["sourceFilesMeta"] = [
+                add_file(f"corpora/{corpus.id}/src", f.file.id, f.text_id)
+                for f in corpus.source_files
+            ]
+            obj["targetFilesMeta"] = [
+                add_file(f"corpora/{corpus.id}/trg", f.file.id, f.text_id)
+                for f in corpus.target_files
+            ]
 
             del obj["sourceFiles"]
             del obj["targetFiles"]
 
             corpora_objs.append(obj)
 
-            pretranslations = client.translation_engines_get_all_pretranslations(
+            pretranslation_ids = set()
+            for pretranslation in client.translation_engines_iter_all_pretranslations(
                 args.engine_id, corpus.id
-            )
-            pretranslation_ids = set(map(lambda x: x.text_id, pretranslations))
+            ):
+                pretranslation_ids.add(pretranslation.text_id)
+                pretranslation_objs.append(pretranslation.to_jsonable())
             for pretranslation_id in pretranslation_ids:
-                try:
-                    usfm_text = client.translation_engines_get_pretranslated_usfm(
-                        args.engine_id, corpus.id, pretranslation_id
-                    )
-                    zip_obj.writestr(
-                        f"corpora/{corpus.id}/pretranslated_usfm/{pretranslation_id}.usfm",
-                        usfm_text,
-                    )
-                except Exception as e:
-                    print(
-                        f"Failed to get usfm for {pretranslation_id} (engine={args.engine_id}, corpus={corpus.id}) due to exception {e}"
+                usfm_futures.append(
+                    add_pretranslated_usfm(
+                        f"corpora/{corpus.id}", corpus.id, pretranslation_id, "corpus"
                     )
-
-            pretranslation_objs += list(map(lambda p: p.to_jsonable(), pretranslations))
+                )
 
         # PARALLEL CORPORA
         for corpus in parallel_corpora:
@@ -118,18 +305,14 @@ def main():
                 source_corpus_meta["url"] = source_corpus.url
                 source_corpus_meta["language"] = source_corpus.language
                 source_corpus_meta["revision"] = source_corpus.revision
-                source_corpus_meta["files"] = []
-                for f in source_corpus.files:
-                    file_id = f.file.id
-                    file_data = client.data_files_download(file_id)
-                    file_meta = client.data_files_get(file_id)
-                    zip_obj.writestr(
-                        f"parallel-corpora/{corpus.id}/src/{source_corpus.id}/{file_meta.name}",
-                        file_data.read(),
+                source_corpus_meta["files"] = [
+                    add_file(
+                        f"parallel-corpora/{corpus.id}/src/{source_corpus.id}",
+                        f.file.id,
+                        f.text_id,
                     )
-                    file_meta = file_meta.to_jsonable()
-                    file_meta["textId"] = f.text_id
-                    source_corpus_meta["files"].append(file_meta)
+                    for f in source_corpus.files
+                ]
                 obj["sourceCorporaMeta"].append(source_corpus_meta)
 
             obj["targetCorporaMeta"] = []
@@ -140,52 +323,42 @@ def main():
                 target_corpus_meta["url"] = target_corpus.url
                 target_corpus_meta["language"] = target_corpus.language
                 target_corpus_meta["revision"] = target_corpus.revision
-                target_corpus_meta["files"] = []
-                for f in target_corpus.files:
-                    file_id = f.file.id
-                    file_data = client.data_files_download(file_id)
-                    file_meta = client.data_files_get(file_id)
-                    zip_obj.writestr(
-                        f"parallel-corpora/{corpus.id}/trg/{file_meta.name}",
-                        file_data.read(),
-                    )
-                    file_meta = file_meta.to_jsonable()
-                    file_meta["textId"] = f.text_id
-                    target_corpus_meta["files"].append(file_meta)
-                obj["targetCorporaMeta"].append(source_corpus_meta)
+                target_corpus_meta["files"] = [
+                    add_file(f"parallel-corpora/{corpus.id}/trg", f.file.id, f.text_id)
+                    for f in target_corpus.files
+                ]
+                obj["targetCorporaMeta"].append(target_corpus_meta)
 
             del obj["sourceCorpora"]
             del obj["targetCorpora"]
 
             parallel_corpora_objs.append(obj)
 
-            pretranslations = client.translation_engines_get_all_pretranslations(
+            pretranslation_ids = set()
+            for pretranslation in client.translation_engines_iter_all_pretranslations(
                 args.engine_id, corpus.id
-            )
-            pretranslation_ids = set(map(lambda x: x.text_id, pretranslations))
+            ):
+                pretranslation_ids.add(pretranslation.text_id)
+                pretranslation_objs.append(pretranslation.to_jsonable())
             for pretranslation_id in pretranslation_ids:
-                try:
-                    usfm_text = client.translation_engines_get_pretranslated_usfm(
-                        args.engine_id, corpus.id, pretranslation_id
-                    )
-                    zip_obj.writestr(
-                        f"parallel-corpora/{corpus.id}/pretranslated_usfm/{pretranslation_id}.usfm",
-                        usfm_text,
-                    )
-                except Exception as e:
-                    print(
-                        f"Failed to get usfm for {pretranslation_id} (engine={args.engine_id}, parallel_corpus={corpus.id}) due to exception {e}"
+                usfm_futures.append(
+                    add_pretranslated_usfm(
+                        f"parallel-corpora/{corpus.id}",
+                        corpus.id,
+                        pretranslation_id,
+                        "parallel_corpus",
                     )
-
-            pretranslation_objs += list(map(lambda p: p.to_jsonable(), pretranslations))
+                )
 
         meta = {}
         meta["engineMeta"] = engine.to_jsonable()
         meta["builds"] = list(map(lambda b: b.to_jsonable(), builds))
-        meta["corpora"] = corpora_objs
-        meta["parallel-corpora"] = parallel_corpora_objs
+        meta["corpora"] = resolve_futures(corpora_objs)
+        meta["parallel-corpora"] = resolve_futures(parallel_corpora_objs)
         meta["pretranslations"] = pretranslation_objs
-        zip_obj.writestr(f"engine_meta.json", json.dumps(meta, indent=1))
+        for future in usfm_futures:
+            future.result()
+        writer.add_str(f"engine_meta.json", json.dumps(meta, indent=1))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Derives the parts of the Serval client that follow the API from the module generated by swagger_to.
+
+Run it from this directory every time serval_client_module.py has been regenerated, e.g.:
+
+    swagger_to_py_client.py --swagger_path swagger.json --outpath serval_client_module.py
+    python generate_client_operations.py
+
+It makes two changes, both of which can be repeated on a fresh generation:
+
+* The high-volume model classes in serval_client_module.py get `__slots__`, so that their
+  instances do not carry a `__dict__`.
+* serval_client_operations.py is (re)written. It holds a table of the operations of the API and
+  the mixins `RemoteCallerOperations` and `AsyncRemoteCallerOperations`, which have the methods of
+  the generated `RemoteCaller` (same signatures and docstrings), but send their requests through
+  the `_call` of the client classes in serval_client.py and serval_async_client_module.py.
+
+Nothing in either file is edited by hand.
+"""
+
+import argparse
+import ast
+import os
+import re
+import sys
+import typing
+from typing import List, Optional
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Model classes of which millions of instances can be alive, e.g. when listing word alignments.
+SLOTTED_MODELS = ("TranslationResult", "AlignedWordPair", "Phrase", "WordGraphArc", "Pretranslation", "WordAlignment")
+
+HEADER = '''#!/usr/bin/env python3
+# Automatically generated file by generate_client_operations.py. DO NOT EDIT OR APPEND ANYTHING!
+"""
+Implements the remote calls of the Serval API on top of the transport of a client class.
+
+The methods mirror `serval_client_module.RemoteCaller`, but hand the request to `self._call`,
+which sends it and converts the response as described by the `Operation`.
+"""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+'''
+
+MIXIN_DOCSTRING = '''    """
+    Remote calls of the Serval API.
+
+    The client class provides `_to_jsonable(obj, expected)`, which converts request bodies, and
+    `_call(operation, url, params=None, json=None, data=None, files=None)`, which sends the
+    request and returns the converted response.
+    """
+'''
+
+REQUEST_ARGUMENTS = ("params", "json", "data", "files")
+
+
+def _camel_case(name: str) -> str:
+    return re.sub(r"_([a-z0-9])", lambda match: match.group(1).upper(), name)
+
+
+def _wrap(items: List[str], indent: str, width: int = 100) -> List[str]:
+    """Joins the items with commas into lines of at most `width` characters."""
+    lines = []  # type: List[str]
+    line = ""
+    for item in items:
+        if line and len(indent) + len(line) + len(item) + 2 > width:
+            lines.append(indent + line.rstrip())
+            line = ""
+        line += item + ", "
+    lines.append(indent + line[:-2])
+    return lines
+
+
+def slot_models(source: str) -> str:
+    """Returns the source of the generated module with `__slots__` added to SLOTTED_MODELS."""
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    # Insert from the bottom up, so that the line numbers of the classes above stay valid.
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef) and node.name in SLOTTED_MODELS]
+    missing = set(SLOTTED_MODELS) - {node.name for node in classes}
+    if missing:
+        raise ValueError("Model classes not found: {}".format(", ".join(sorted(missing))))
+
+    for node in sorted(classes, key=lambda node: node.lineno, reverse=True):
+        first = node.body[0]
+        if isinstance(first, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__slots__" for target in first.targets
+        ):
+            continue
+        init = next(item for item in node.body if isinstance(item, ast.FunctionDef) and item.name == "__init__")
+        names = [repr(arg.arg) for arg in init.args.args[1:]]
+        slots = "    __slots__ = ({})\n".format(", ".join(names))
+        if len(slots) > 101:
+            slots = "    __slots__ = (\n{})\n".format("\n".join(_wrap(names, " " * 8)))
+        lines.insert(node.lineno, slots + "\n")
+    return "".join(lines)
+
+
+class _Operation:
+    """A method of the generated RemoteCaller, split into what is kept and what is described."""
+
+    def __init__(self, source: str, function: ast.FunctionDef) -> None:
+        self.name = function.name
+        lines = source.splitlines()
+        body = function.body[1:]  # without the docstring
+        request_index = next(
+            i
+            for i, statement in enumerate(body)
+            if isinstance(statement, ast.Assign)
+            and isinstance(statement.value, ast.Call)
+            and ast.unparse(statement.value.func) == "self.session.request"
+        )
+        request = body[request_index].value
+        keywords = {keyword.arg: keyword.value for keyword in request.keywords}
+
+        # The signature, the docstring and the statements that build the URL and the arguments.
+        start = function.lineno - 1
+        if function.decorator_list:
+            raise ValueError("Unexpected decorator on {}".format(self.name))
+        prologue = lines[start : body[request_index].lineno - 1]
+        while prologue and not prologue[-1].strip():
+            prologue.pop()
+        self.prologue = [re.sub(r"(?<![\w.])to_jsonable\(", "self._to_jsonable(", line) for line in prologue]
+
+        self.http_method = ast.literal_eval(keywords["method"]).upper()
+        self.arguments = [(name, ast.unparse(keywords[name])) for name in REQUEST_ARGUMENTS if name in keywords]
+        self.stream = "stream" in keywords
+        self.url_template = self._url_template(body)
+        self.expected = self._expected(body[request_index + 1 :])
+
+        self.names = {node.id for node in ast.walk(function) if isinstance(node, ast.Name)}
+        self.names |= {
+            node.value
+            for node in ast.walk(function)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.isidentifier()
+        }
+
+    def _url_template(self, body: List[ast.stmt]) -> str:
+        assignment = next(
+            statement
+            for statement in body
+            if isinstance(statement, ast.Assign) and ast.unparse(statement.targets[0]) == "url"
+        )
+        value = assignment.value
+        if isinstance(value, ast.BinOp):
+            parts = [value.right]  # self.url_prefix + '/api/...'
+        else:
+            parts = value.args[0].elts[1:]  # "".join([self.url_prefix, '/api/...', str(id), ...])
+        template = ""
+        for part in parts:
+            if isinstance(part, ast.Constant):
+                template += part.value
+            else:
+                template += "{" + _camel_case(part.args[0].id) + "}"
+        return template
+
+    def _expected(self, tail: List[ast.stmt]) -> Optional[str]:
+        """Returns the source of the expected types of the response, or None for the raw body."""
+        for node in ast.walk(ast.Module(body=tail, type_ignores=[])):
+            if isinstance(node, ast.Call) and ast.unparse(node.func) == "from_obj":
+                return ast.unparse(next(keyword.value for keyword in node.keywords if keyword.arg == "expected"))
+        return None
+
+    def table_entry(self) -> List[str]:
+        lines = [
+            "    {!r}: Operation(".format(self.name),
+            "        name={!r},".format(self.name),
+            "        http_method={!r},".format(self.http_method),
+            "        url_template={!r},".format(self.url_template),
+        ]
+        if self.stream:
+            lines.append("        expected={},".format(self.expected))
+            lines.append("        stream=True),")
+        else:
+            lines.append("        expected={}),".format(self.expected))
+        return lines
+
+    def method(self, asynchronous: bool) -> List[str]:
+        lines = list(self.prologue)
+        if asynchronous:
+            lines[0] = lines[0].replace("    def ", "    async def ", 1)
+        lines.append("")
+        call = "return await self._call(" if asynchronous else "return self._call("
+        lines.append("        " + call)
+        lines.append("            OPERATIONS[{!r}],".format(self.name))
+        lines.append("            url,")
+        for name, value in self.arguments:
+            lines.append("            {}={},".format(name, value))
+        lines.append("        )")
+        return lines
+
+
+def generate_operations(source: str) -> str:
+    """Returns the source of serval_client_operations.py for the given generated module."""
+    tree = ast.parse(source)
+    remote_caller = next(
+        node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "RemoteCaller"
+    )
+    operations = [
+        _Operation(source, node)
+        for node in remote_caller.body
+        if isinstance(node, ast.FunctionDef) and node.name != "__init__"
+    ]
+
+    model_classes = {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
+    used = set()
+    for operation in operations:
+        used |= operation.names
+    models = sorted(used & model_classes)
+    typing_names = used & set(typing.__all__)
+
+    out = [HEADER]
+    if any("json.dumps(" in line for operation in operations for line in operation.prologue):
+        out.append("import json")
+    # The stubs of the mixins use these as well.
+    typing_names = sorted(set(typing_names) | {"Any", "BinaryIO", "Dict", "List", "Optional"})
+    out.append("from typing import {}".format(", ".join(typing_names)))
+    out.append("")
+    out.append("from serval_client_module import (")
+    out.extend("    {},".format(name) for name in models)
+    out.append(")")
+    out.append("from serval_client_support import Operation")
+    out.append("")
+    out.append("")
+    out.append("# The remote calls by method name.")
+    out.append("OPERATIONS = {")
+    for operation in operations:
+        out.extend(operation.table_entry())
+    out.append("}  # type: Dict[str, Operation]")
+
+    for class_name, asynchronous in (("RemoteCallerOperations", False), ("AsyncRemoteCallerOperations", True)):
+        out.append("")
+        out.append("")
+        out.append("class {}:".format(class_name))
+        out.append(MIXIN_DOCSTRING)
+        if asynchronous:
+            out.append("    async def _call(")
+        else:
+            out.append("    def _call(")
+        out.append("            self,")
+        out.append("            operation: Operation,")
+        out.append("            url: str,")
+        out.append("            params: Optional[Dict[str, str]] = None,")
+        out.append("            json: Any = None,")
+        out.append("            data: Optional[Dict[str, str]] = None,")
+        out.append("            files: Optional[Dict[str, BinaryIO]] = None) -> Any:")
+        out.append("        raise NotImplementedError()")
+        out.append("")
+        out.append("    def _to_jsonable(self, obj: Any, expected: List[type]) -> Any:")
+        out.append("        raise NotImplementedError()")
+        for operation in operations:
+            out.append("")
+            out.extend(operation.method(asynchronous))
+
+    return "\n".join(out) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--module",
+        default=os.path.join(SCRIPTS_DIR, "serval_client_module.py"),
+        help="The module generated by swagger_to; its models are slotted in place",
+    )
+    parser.add_argument(
+        "--output",
+        default=os.path.join(SCRIPTS_DIR, "serval_client_operations.py"),
+        help="Where to write the operations module",
+    )
+    args = parser.parse_args()
+
+    with open(args.module, "r", encoding="utf-8") as f:
+        source = f.read()
+
+    slotted = slot_models(source)
+    if slotted != source:
+        with open(args.module, "w", encoding="utf-8") as f:
+            f.write(slotted)
+        print(f"Slotted the models in {args.module}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(generate_operations(slotted))
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#! /usr/bin/python3
+"""
+Asynchronous HTTP load generator for the Serval API.
+
+Two modes are supported:
+* open loop: requests are started at a constant rate regardless of how fast the server answers.
+  Latencies are measured from the scheduled start, so queueing behind a slow server is included.
+* closed loop: a fixed number of workers each send a request as soon as the previous one finished.
+
+Several scenarios can be mixed in a single run; each one gets its own latency histogram.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import aiohttp
+from serval_auth_module import ServalBearerAuth
+
+PERCENTILES = {"p50": 50.0, "p90": 90.0, "p99": 99.0, "p999": 99.9}
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    url: str
+    body: Optional[bytes] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    weight: float = 1.0
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with a relative precision of about 1%.
+
+    Memory use is independent of the number of recorded requests.
+    """
+
+    _BASE = math.log(1.01)
+
+    def __init__(self):
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        micros = max(seconds * 1e6, 1.0)
+        bucket = int(math.log(micros) / self._BASE)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        if self.count == 0:
+            return math.nan
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # Report the upper bound of the bucket, capped at the largest recorded value.
+                return min(math.exp((bucket + 1) * self._BASE) / 1e6, self.max)
+        return self.max
+
+    def summary_ms(self) -> Dict[str, float]:
+        if self.count == 0:
+            return {}
+        summary = {
+            "min": self.min * 1000,
+            "mean": self.total / self.count * 1000,
+            "max": self.max * 1000,
+        }
+        for name, percent in PERCENTILES.items():
+            summary[name] = self.percentile(percent) * 1000
+        return {name: round(value, 3) for name, value in summary.items()}
+
+
+class ScenarioStats:
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.status_counts: Dict[str, int] = {}
+        self.errors = 0
+
+    def record(self, status: str, seconds: float):
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if not status.startswith("2"):
+            self.errors += 1
+        self.latency.record(seconds)
+
+
+async def _send(
+    session: aiohttp.ClientSession,
+    scenario: Scenario,
+    stats: ScenarioStats,
+    start: float,
+    timeout: float,
+):
+    try:
+        async with session.request(
+            scenario.method,
+            scenario.url,
+            data=scenario.body,
+            headers=scenario.headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            await resp.read()
+            status = str(resp.status)
+    except asyncio.TimeoutError:
+        status = "timeout"
+    except aiohttp.ClientError as e:
+        status = type(e).__name__
+    stats.record(status, time.perf_counter() - start)
+
+
+async def run_load(
+    scenarios: List[Scenario],
+    duration: float,
+    rate: Optional[float] = None,
+    concurrency: int = 20,
+    connections: Optional[int] = None,
+    timeout: float = 30.0,
+    verify_ssl: bool = True,
+) -> Dict:
+    """
+    Runs the scenarios against the server and returns the results as a JSON-able dict.
+
+    :param scenarios: requests to send; each request picks a scenario at random by weight
+    :param duration: length of the run in seconds
+    :param rate: requests per second in open-loop mode; if None, closed-loop mode is used
+    :param concurrency: number of workers in closed-loop mode
+    :param connections: maximum number of connections (defaults to concurrency)
+    :param timeout: per-request timeout in seconds
+    :param verify_ssl: whether to verify the server certificates
+    """
+    stats = {scenario.name: ScenarioStats() for scenario in scenarios}
+    weights = [scenario.weight for scenario in scenarios]
+    rng = random.Random(0)
+
+    def pick() -> Scenario:
+        return rng.choices(scenarios, weights)[0]
+
+    connector = aiohttp.TCPConnector(
+        limit=connections or concurrency, ssl=None if verify_ssl else False
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        began = time.perf_counter()
+        deadline = began + duration
+        if rate is not None:
+            tasks = []
+            interval = 1 / rate
+            i = 0
+            while True:
+                scheduled = began + i * interval
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                scenario = pick()
+                tasks.append(
+                    asyncio.create_task(
+                        _send(session, scenario, stats[scenario.name], scheduled, timeout)
+                    )
+                )
+                i += 1
+            await asyncio.gather(*tasks)
+        else:
+
+            async def worker():
+                while time.perf_counter() < deadline:
+                    scenario = pick()
+                    await _send(
+                        session,
+                        scenario,
+                        stats[scenario.name],
+                        time.perf_counter(),
+                        timeout,
+                    )
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - began
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "mode": "open" if rate is not None else "closed",
+        "rate": rate,
+        "concurrency": concurrency if rate is None else None,
+        "duration": round(elapsed, 3),
+        "scenarios": {
+            scenario.name: {
+                "method": scenario.method,
+                "url": scenario.url,
+                "requests": stats[scenario.name].latency.count,
+                "errors": stats[scenario.name].errors,
+                "throughput": round(stats[scenario.name].latency.count / elapsed, 3),
+                "status_counts": stats[scenario.name].status_counts,
+                "latency_ms": stats[scenario.name].latency.summary_ms(),
+            }
+            for scenario in scenarios
+        },
+    }
+
+
+def print_results(results: Dict):
+    for name, result in results["scenarios"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name}: {result['requests']} requests, {result['errors']} errors, "
+            f"{result['throughput']} req/s, status {result['status_counts']}"
+        )
+        if latency:
+            print(
+                "  latency (ms): "
+                + ", ".join(f"{k} {latency[k]}" for k in ["min", "mean", *PERCENTILES, "max"])
+            )
+
+
+def append_results(path: str, results: Dict):
+    """Appends the results as one JSON line, so that runs can be compared over time."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(results) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send load to a single Serval endpoint")
+    parser.add_argument("url", help="Full URL of the endpoint")
+    parser.add_argument("--method", default="GET", help="HTTP method")
+    parser.add_argument("--body", default=None, help="Request body (sent as JSON)")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to run")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Requests per second (open loop); if not provided, closed loop is used",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=20, help="Workers (closed loop) or connections"
+    )
+    parser.add_argument(
+        "--results", default=None, help="File to append the JSON results to"
+    )
+    args = parser.parse_args()
+
+    headers = {
+        "accept": "application/json",
+        "authorization": "Bearer " + ServalBearerAuth().get_token(),
+    }
+    if args.body is not None:
+        headers["content-type"] = "application/json"
+    scenario = Scenario(
+        name=f"{args.method} {args.url}",
+        method=args.method,
+        url=args.url,
+        body=args.body.encode("utf-8") if args.body is not None else None,
+        headers=headers,
+    )
+    results = asyncio.run(
+        run_load(
+            [scenario],
+            args.duration,
+            rate=args.rate,
+            concurrency=args.concurrency,
+        )
+    )
+    print_results(results)
+    if args.results:
+        append_results(args.results, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,366 +1,415 @@
 #! /usr/bin/python3
+import argparse
+import asyncio
+import concurrent.futures
 import json
-import os, stat, time
-import urllib3
-import shutil
-import random
-import string
+import os, time
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+import requests
 from tqdm import tqdm
+from load_generator import Scenario, append_results, print_results, run_load
+from serval_auth_module import ServalBearerAuth
+from serval_build_watcher import BuildEvent, BuildWatcher
+from serval_client import RemoteCaller
+from serval_client_module import (
+    PretranslateCorpusConfig,
+    TranslationBuildConfig,
+    TranslationCorpusConfig,
+    TranslationCorpusFileConfig,
+    TranslationEngineConfig,
+)
+from serval_client_support import RetryPolicy
+
+
+class RateLimiter:
+    """Spaces out calls across threads so that at most `rate` of them start per second."""
+
+    def __init__(self, rate: Optional[float]):
+        self._interval = 1 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        time.sleep(start - now)
+
+
+class EngineLedger:
+    """
+    Append-only file of the engines created by a run.
+
+    Each engine is recorded as soon as it is created, so the engines of a run that crashed can
+    still be deleted later with --cleanup.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def add(self, engine_id: str, engine_type: str):
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": engine_id, "type": engine_type}) + "\n")
+
+    def load(self) -> Dict[str, str]:
+        if not os.path.exists(self.path):
+            return {}
+        engine_types: Dict[str, str] = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                engine_types[entry["id"]] = entry["type"]
+        return engine_types
+
+    def replace(self, engine_types: Dict[str, str]):
+        if not engine_types:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for engine_id, engine_type in engine_types.items():
+                f.write(json.dumps({"id": engine_id, "type": engine_type}) + "\n")
+        os.replace(tmp_path, self.path)
+
+
+def run_concurrently(
+    func: Callable, items: Iterable, workers: int, rate_limiter: RateLimiter, desc: str
+) -> List:
+    """
+    Calls func for each item on a worker pool and returns the results in completion order.
+
+    The first exception raised by func is re-raised once the calls in progress have finished;
+    the calls that have not started yet are cancelled.
+    """
+
+    def call(item):
+        rate_limiter.wait()
+        return func(item)
+
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(call, item) for item in items]
+        try:
+            for future in tqdm(
+                concurrent.futures.as_completed(futures), total=len(futures), desc=desc
+            ):
+                results.append(future.result())
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+    return results
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Load test a Serval instance")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Number of concurrent requests used to create and delete engines",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=50,
+        help="Maximum number of engines created or deleted per second (0 for no limit)",
+    )
+    parser.add_argument(
+        "--ledger",
+        default="load_testing_engines.jsonl",
+        help="File recording the ids of the created engines",
+    )
+    parser.add_argument(
+        "--closed-loop",
+        action="store_true",
+        help="Keep a fixed number of requests in flight instead of sending them at a constant rate",
+    )
+    parser.add_argument(
+        "--results",
+        default="load_testing_results.jsonl",
+        help="File to append the JSON results of each load run to",
+    )
+    parser.add_argument(
+        "--cleanup",
+        action="store_true",
+        help="Only delete the engines recorded in the ledger by a previous run",
+    )
+    args = parser.parse_args()
+
     start = time.time()
-    SERVAL_AUTH_URL = os.environ.get("SERVAL_AUTH_URL")
-    SERVAL_CLIENT_ID = os.environ.get("SERVAL_CLIENT_ID")
-    SERVAL_CLIENT_SECRET = os.environ.get("SERVAL_CLIENT_SECRET")
     REQUESTS_PER_SECOND = 5
     NUM_CONCURRENT_CONNECTIONS = 20
+    LOAD_DURATION = 60
+    SMT_BUILD_TIMEOUT = 40 * 60
+    NMT_BUILD_TIMEOUT = 2 * 60 * 60
     NUM_NMT_ENGINES_TO_ADD = 10_000
     NUM_SMT_ENGINES_TO_ADD = 500
 
-    base_url = "localhost"  # "https://qa-int.serval-api.org"
-
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    base_url = "http://localhost"  # "https://qa-int.serval-api.org"
 
     print("Fetching authorization token...")
-    data = {
-        "client_id": f"{SERVAL_CLIENT_ID}",
-        "client_secret": f"{SERVAL_CLIENT_SECRET}",
-        "audience": "https://serval-api.org/",
-        "grant_type": "client_credentials",
-    }
-
-    encoded_data = json.dumps(data).encode("utf-8")
-
-    http = (
-        urllib3.PoolManager()
-    )  # Use the following parameters if base_url is not localhost: cert_reqs='CERT_NONE', assert_hostname=False
-    r: urllib3.response.HTTPResponse = http.request(
-        "POST",
-        f"{SERVAL_AUTH_URL}/oauth/token",
-        body=encoded_data,
-        headers={"content-type": "application/json"},
+    # The auth refreshes the token when it expires, so the provisioning, the load runs and the
+    # cleanup of a long run all send a valid one.
+    auth = ServalBearerAuth()
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=args.workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    client = RemoteCaller(
+        url_prefix=base_url, auth=auth, session=session, retry_policy=RetryPolicy()
     )
-    access_token = json.loads(r.data.decode("utf-8"))["access_token"]
+
+    ledger = EngineLedger(args.ledger)
+    rate_limiter = RateLimiter(args.rate)
+
+    def delete_engine(engine_id) -> bool:
+        try:
+            client.translation_engines_delete(engine_id)
+        except requests.HTTPError as e:
+            # The engine is already gone if an earlier cleanup got to it.
+            if e.response.status_code != 404:
+                print(f"Failed to delete engine {engine_id}: {e}")
+                return False
+        except requests.RequestException as e:
+            print(f"Failed to delete engine {engine_id}: {e}")
+            return False
+        return True
+
+    def delete_file(file_id: str):
+        try:
+            client.data_files_delete(file_id)
+        except requests.RequestException as e:
+            print(f"Failed to delete file {file_id}: {e}")
+
+    def delete_recorded_engines():
+        engine_types = ledger.load()
+        deleted = run_concurrently(
+            lambda engine_id: (engine_id, delete_engine(engine_id)),
+            list(engine_types),
+            args.workers,
+            rate_limiter,
+            "Deleting engines",
+        )
+        for engine_id, ok in deleted:
+            if ok:
+                del engine_types[engine_id]
+        # Keep the engines that could not be deleted for the next --cleanup.
+        ledger.replace(engine_types)
+
+    if args.cleanup:
+        delete_recorded_engines()
+        return
 
     src_id = ""
     trg_id = ""
 
-    print("Setting up bombardier...")
-    bombardier_path_to_exe = "load_testing_data/bombardier-linux-amd64"
-    if not os.path.exists(bombardier_path_to_exe):
-        with http.request(
-            "GET",
-            "https://github.com/codesenberg/bombardier/releases/download/v1.2.6/bombardier-linux-amd64",
-            preload_content=False,
-        ) as r, open(bombardier_path_to_exe, "wb") as out_file:
-            shutil.copyfileobj(r, out_file)
-
-    os.chmod(bombardier_path_to_exe, mode=stat.S_IXUSR)
+    def print_build_event(event: BuildEvent):
+        build = event.build
+        phase = build.phases[-1].stage if build.phases else "-"
+        print(
+            f"Build {build.id} of engine {event.engine_id}: state={build.state}, "
+            f"progress={build.progress}, phase={phase}, queue depth={build.queue_depth}"
+        )
+
+    watcher = BuildWatcher(client, on_event=print_build_event)
+
+    def start_build(engine_id: str, build_config: TranslationBuildConfig) -> str:
+        try:
+            r = client.translation_engines_start_build(engine_id, build_config)
+        except requests.HTTPError as e:
+            raise Exception(
+                f"Received response of {e.response.status_code} while trying to build engine; cannot continue testing!"
+            )
+        return json.loads(r)["id"]
+
+    def wait_for_build(engine_id: str, build_id: str, timeout: float):
+        try:
+            build = watcher.wait(engine_id, build_id, timeout)
+        except concurrent.futures.TimeoutError:
+            print(
+                "Engine is taking too long to build to continue testing. Cancelling build..."
+            )
+            client.translation_engines_cancel_build(engine_id)
+            raise Exception(
+                "Engine is taking too long to build to continue testing. Cancelling build..."
+            )
+        if build.state != "Completed":
+            raise Exception(
+                f"Build of engine {engine_id} finished in state {build.state}; cannot continue testing!"
+            )
+
+    def bombard(*scenarios: Scenario):
+        for scenario in scenarios:
+            scenario.headers = {
+                "authorization": f"Bearer {auth.get_token()}",
+                "accept": "application/json",
+                **({"content-type": "application/json"} if scenario.body else {}),
+            }
+        results = asyncio.run(
+            run_load(
+                list(scenarios),
+                LOAD_DURATION,
+                rate=None if args.closed_loop else REQUESTS_PER_SECOND,
+                concurrency=NUM_CONCURRENT_CONNECTIONS,
+                verify_ssl=False,
+            )
+        )
+        print_results(results)
+        append_results(args.results, results)
+
     try:
         print("Bombarding get all translation engines endpoint...")
-        os.system(
-            "./"
-            + bombardier_path_to_exe
-            + f' --print r -k -l -d 60s -r {REQUESTS_PER_SECOND} -c {NUM_CONCURRENT_CONNECTIONS} -H "authorization: Bearer {access_token}" -H "accept: application/json" -m "GET"  "{base_url}/api/v1/translation/engines"'
-        )
+        bombard(Scenario("get_all_engines", "GET", f"{base_url}/api/v1/translation/engines"))
 
         print("Posting engines to DB...")
-        nmt_engine_ids: set[str] = set()
-        smt_engine_ids: set[str] = set()
 
-        def post_nmt_engine():
-            r: urllib3.response.HTTPResponse = http.request(
-                "POST",
-                f"{base_url}/api/v1/translation/engines",
-                body=json.dumps(
-                    {
-                        "name": "load_testing_engine",
-                        "targetLanguage": "en_Latn",
-                        "sourceLanguage": "ell_Grek",
-                        "type": "Nmt",
-                    }
-                ).encode("utf-8"),
-                headers={
-                    "content-type": "application/json",
-                    "accept": "application/json",
-                    "authorization": f"Bearer {access_token}",
-                },
-            )
-            nmt_engine_ids.add(json.loads(r.data.decode("utf-8"))["id"])
+        def post_engine(engine_type: str) -> str:
+            try:
+                r = client.translation_engines_create(
+                    TranslationEngineConfig(
+                        name="load_testing_engine",
+                        source_language="ell_Grek",
+                        target_language="en_Latn",
+                        type=engine_type,
+                    )
+                )
+            except requests.HTTPError as e:
+                raise Exception(
+                    f"Received response of {e.response.status_code} while trying to create "
+                    f"a {engine_type} engine: {e.response.text}"
+                ) from e
+            engine_id = json.loads(r)["id"]
+            ledger.add(engine_id, engine_type)
+            return engine_id
 
         print("Posting NMT")
-        for _ in tqdm(range(NUM_NMT_ENGINES_TO_ADD)):
-            post_nmt_engine()
-
-        def post_smt_engine():
-            r: urllib3.response.HTTPResponse = http.request(
-                "POST",
-                f"{base_url}/api/v1/translation/engines",
-                body=json.dumps(
-                    {
-                        "name": "load_testing_engine",
-                        "targetLanguage": "en_Latn",
-                        "sourceLanguage": "ell_Grek",
-                        "type": "SmtTransfer",
-                    }
-                ).encode("utf-8"),
-                headers={
-                    "content-type": "application/json",
-                    "accept": "application/json",
-                    "authorization": f"Bearer {access_token}",
-                },
+        nmt_engine_ids: set[str] = set(
+            run_concurrently(
+                post_engine,
+                ["Nmt"] * NUM_NMT_ENGINES_TO_ADD,
+                args.workers,
+                rate_limiter,
+                "Posting NMT",
             )
-            smt_engine_ids.add(json.loads(r.data.decode("utf-8"))["id"])
+        )
 
         print("Posting SMT")
-        for _ in tqdm(range(NUM_SMT_ENGINES_TO_ADD)):
-            post_smt_engine()
+        smt_engine_ids: set[str] = set(
+            run_concurrently(
+                post_engine,
+                ["SmtTransfer"] * NUM_SMT_ENGINES_TO_ADD,
+                args.workers,
+                rate_limiter,
+                "Posting SMT",
+            )
+        )
 
         # use bombadier get
         print("Bombarding get all translation engines endpoint after adding docs...")
-        os.system(
-            "./"
-            + bombardier_path_to_exe
-            + f' --print r -k -l -d 60s -r {REQUESTS_PER_SECOND} -c {NUM_CONCURRENT_CONNECTIONS} -H "authorization: Bearer {access_token}" -H "accept: application/json" -m "GET"  "{base_url}/api/v1/translation/engines"'
+        bombard(
+            Scenario(
+                "get_all_engines_after_adding_engines",
+                "GET",
+                f"{base_url}/api/v1/translation/engines",
+            )
         )
         # add necessary files
         print("Adding corpus to smt engine...")
-        with open("load_testing_data/testsrc.txt", "r") as src_file:
-            src_data = src_file.read()
-            r: urllib3.response.HTTPResponse = http.request_encode_body(
-                "POST",
-                f"{base_url}/api/v1/files",
-                fields={
-                    "file": ("testsrc.txt", src_data, "text/plain"),
-                    "format": "Text",
-                },
-                headers={
-                    "accept": "application/json",
-                    "authorization": f"Bearer {access_token}",
-                },
-                encode_multipart=True,
-            )
-            src_id = json.loads(r.data.decode("utf-8"))["id"]
-
-        with open("load_testing_data/testtarg.txt", "r") as targ_file:
-            targ_data = targ_file.read()
-            r: urllib3.response.HTTPResponse = http.request(
-                "POST",
-                f"{base_url}/api/v1/files",
-                fields={
-                    "file": ("testtarg.txt", targ_data, "text/plain"),
-                    "format": "Text",
-                },
-                headers={
-                    "accept": "application/json",
-                    "authorization": f"Bearer {access_token}",
-                },
-            )
-            trg_id = json.loads(r.data.decode("utf-8"))["id"]
+        with open("load_testing_data/testsrc.txt", "rb") as src_file:
+            src_id = json.loads(client.data_files_create(src_file, "Text"))["id"]
+
+        with open("load_testing_data/testtarg.txt", "rb") as targ_file:
+            trg_id = json.loads(client.data_files_create(targ_file, "Text"))["id"]
+
+        corpus_config = TranslationCorpusConfig(
+            source_language="ell_Grek",
+            target_language="en_Latn",
+            source_files=[TranslationCorpusFileConfig(file_id=src_id, text_id="all")],
+            target_files=[TranslationCorpusFileConfig(file_id=trg_id, text_id="all")],
+        )
 
         print("Building an SMT engine for bombardment...")
         # add corpora and build an smt
         smt_id = list(smt_engine_ids)[0]
-        http.request(
-            "POST",
-            f"{base_url}/api/v1/translation/engines/{smt_id}/corpora",
-            body=json.dumps(
-                {
-                    "sourceLanguage": "ell_Grek",
-                    "targetLanguage": "en_Latn",
-                    "sourceFiles": [{"fileId": src_id, "textId": "all"}],
-                    "targetFiles": [{"fileId": trg_id, "textId": "all"}],
-                }
-            ).encode("utf-8"),
-            headers={
-                "content-type": "application/json",
-                "accept": "application/json",
-                "authorization": f"Bearer {access_token}",
-            },
-        )
-        # corpus_id = json.loads(r.data.decode('utf-8'))['id']
-        r: urllib3.response.HTTPResponse = http.request(
-            "POST",
-            f"{base_url}/api/v1/translation/engines/{smt_id}/builds",
-            body=json.dumps({}).encode("utf-8"),
-            headers={
-                "authorization": f"Bearer {access_token}",
-                "content-type": "application/json",
-            },
-        )
-
-        # waiting for build
-        is_built = False
-        retry_index = 0
-        while not is_built:
-            r: urllib3.response.HTTPResponse = http.request(
-                "GET",
-                f"{base_url}/api/v1/translation/engines/{smt_id}/current-build",
-                headers={"authorization": f"Bearer {access_token}"},
-            )
-            is_built = r.status == 204
-            if r.status // 100 != 2:
-                raise Exception(
-                    f"Received response of {r.status} while trying to build engine; cannot continue testing!"
-                )
-            if retry_index > 15:
-                r: urllib3.response.HTTPResponse = http.request(
-                    "POST",
-                    f"{base_url}/api/v1/translation/engines/{smt_id}/current-build/cancel",
-                    headers={"authorization": f"Bearer {access_token}"},
-                )
+        client.translation_engines_add_corpus(smt_id, corpus_config)
+        build_id = start_build(smt_id, TranslationBuildConfig())
 
-                print(
-                    "Engine is taking too long to build to continue testing. Cancelling build..."
-                )
-                raise Exception(
-                    "Engine is taking too long to build to continue testing. Cancelling build..."
-                )
-            time.sleep(60 if retry_index == 0 else 20 * retry_index)
-            retry_index += 1
+        wait_for_build(smt_id, build_id, SMT_BUILD_TIMEOUT)
 
-        segment_file_name = (
-            "".join(random.choices(string.ascii_letters, k=24)) + ".json"
-        )
-        f = open(segment_file_name, "w", encoding="utf-8")
-        f.write(json.dumps("Βίβλος γενέσεως Ἰησοῦ Χριστοῦ"))
-        f.flush()
-        f.close()
+        segment = json.dumps("Βίβλος γενέσεως Ἰησοῦ Χριστοῦ").encode("utf-8")
 
         # bombard get word graph
         print("Bombarding word graph endpoint...")
-        os.system(
-            "./"
-            + bombardier_path_to_exe
-            + f' --print r -k -l -d 60s -r {REQUESTS_PER_SECOND} -c {NUM_CONCURRENT_CONNECTIONS} -H "authorization: Bearer {access_token}" -H "accept: application/json" -H "content-type: application/json" -m "POST"  "{base_url}/api/v1/translation/engines/{smt_id}/get-word-graph" '
-            + f'-f "{segment_file_name}"'
+        word_graph_scenario = Scenario(
+            "get_word_graph",
+            "POST",
+            f"{base_url}/api/v1/translation/engines/{smt_id}/get-word-graph",
+            body=segment,
         )
+        bombard(word_graph_scenario)
 
-        os.remove(segment_file_name)
-
-        nmt_id = list(nmt_engine_ids)[0]
-
-        print("Building NMT engine...")
-        r: urllib3.response.HTTPResponse = http.request(
+        print("Bombarding translate endpoint...")
+        translate_scenario = Scenario(
+            "translate",
             "POST",
-            f"{base_url}/api/v1/translation/engines/{nmt_id}/corpora",
-            body=json.dumps(
-                {
-                    "sourceLanguage": "ell_Grek",
-                    "targetLanguage": "en_Latn",
-                    "sourceFiles": [{"fileId": src_id, "textId": "all"}],
-                    "targetFiles": [{"fileId": trg_id, "textId": "all"}],
-                }
-            ).encode("utf-8"),
-            headers={
-                "content-type": "application/json",
-                "accept": "application/json",
-                "authorization": f"Bearer {access_token}",
-            },
+            f"{base_url}/api/v1/translation/engines/{smt_id}/translate",
+            body=segment,
         )
+        bombard(translate_scenario)
 
-        corpus_id = json.loads(r.data.decode("utf-8"))["id"]
+        print("Bombarding word graph and translate endpoints together...")
+        bombard(word_graph_scenario, translate_scenario)
 
-        r: urllib3.response.HTTPResponse = http.request(
-            "POST",
-            f"{base_url}/api/v1/translation/engines/{nmt_id}/builds",
-            body=json.dumps(
-                {
-                    "pretranslate": [{"corpusId": corpus_id, "textIds": ["all"]}],
-                    "options": '{"max_steps":10}',
-                }
+        nmt_id = list(nmt_engine_ids)[0]
+
+        print("Building NMT engine...")
+        corpus_id = json.loads(
+            client.translation_engines_add_corpus(nmt_id, corpus_config)
+        )["id"]
+        build_id = start_build(
+            nmt_id,
+            TranslationBuildConfig(
+                pretranslate=[
+                    PretranslateCorpusConfig(corpus_id=corpus_id, text_ids=["all"])
+                ],
+                options='{"max_steps":10}',
             ),
-            headers={
-                "authorization": f"Bearer {access_token}",
-                "content-type": "application/json",
-            },
         )
 
-        # waiting for build
-        is_built = False
-        retry_index = 0
-        while not is_built:
-            r: urllib3.response.HTTPResponse = http.request(
-                "GET",
-                f"{base_url}/api/v1/translation/engines/{nmt_id}/current-build",
-                headers={"authorization": f"Bearer {access_token}"},
-            )
-            is_built = r.status == 204
-            if r.status // 100 != 2:
-                raise Exception(
-                    f"Received response of {r.status} while trying to build engine; cannot continue testing!"
-                )
-            if retry_index > 15:
-                print(
-                    "Engine is taking too long to build to continue testing. Cancelling build..."
-                )
-                r: urllib3.response.HTTPResponse = http.request(
-                    "POST",
-                    f"{base_url}/api/v1/translation/engines/{nmt_id}/current-build/cancel",
-                    headers={"authorization": f"Bearer {access_token}"},
-                )
-                raise Exception(
-                    "Engine is taking too long to build to continue testing. Cancelling build..."
-                )
-            time.sleep(240 if retry_index == 0 else 60 * retry_index)
-            retry_index += 1
+        wait_for_build(nmt_id, build_id, NMT_BUILD_TIMEOUT)
 
         print("Bombarding pretranslation endpoint...")
         # bombard get pretrans
-        os.system(
-            "./"
-            + bombardier_path_to_exe
-            + f' --print r -k -l -d 60s -r {REQUESTS_PER_SECOND} -c {NUM_CONCURRENT_CONNECTIONS} -H "authorization: Bearer {access_token}" -H "accept: application/json" -m "GET"  "{base_url}/api/v1/translation/engines/{nmt_id}/corpora/{corpus_id}/pretranslations" '
+        bombard(
+            Scenario(
+                "get_pretranslations",
+                "GET",
+                f"{base_url}/api/v1/translation/engines/{nmt_id}/corpora/{corpus_id}/pretranslations",
+            )
         )
     except Exception as e:
         print("Something went wrong:", str(e) if str(e) != "" else "[No information]")
     finally:
-        # cleanup files, smt, nmt, bombardier
+        # cleanup files, smt, nmt
         print("Cleaning up...")
+        watcher.close()
         print("Deleting added translation engines...")
+        delete_recorded_engines()
 
-        def delete_engine(engine_id):
-            r: urllib3.response.HTTPResponse = http.request(
-                "DELETE",
-                f"{base_url}/api/v1/translation/engines/{engine_id}",
-                body=json.dumps({"id": engine_id}).encode("utf-8"),
-                headers={
-                    "content-type": "application/json",
-                    "authorization": f"Bearer {access_token}",
-                },
-            )
-            if r.status != 200:
-                print(f"Failed to delete engine {engine_id}")
-
-        for engine_id in tqdm(nmt_engine_ids):
-            delete_engine(engine_id)
-        for engine_id in tqdm(smt_engine_ids):
-            delete_engine(engine_id)
-
-        r: urllib3.response.HTTPResponse = http.request(
-            "DELETE",
-            f"{base_url}/api/v1/files/{src_id}",
-            headers={
-                "content-type": "application/json",
-                "authorization": f"Bearer {access_token}",
-            },
-        )
-        if r.status != 200:
-            print(f"Failed to delete file {src_id}")
-
-        r: urllib3.response.HTTPResponse = http.request(
-            "DELETE",
-            f"{base_url}/api/v1/files/{trg_id}",
-            headers={
-                "content-type": "application/json",
-                "authorization": f"Bearer {access_token}",
-            },
-        )
-        if r.status != 200:
-            print(f"Failed to delete file {trg_id}")
+        if src_id:
+            delete_file(src_id)
+        if trg_id:
+            delete_file(trg_id)
 
-        os.remove(bombardier_path_to_exe)
         print("Finished testing in", round((time.time() - start) / 60, 2), "minutes.")
 
 
@@ -1,9 +1,122 @@
-from serval_client_module import RemoteCaller
+from serval_client import RemoteCaller
+from serval_client_module import DataFile
+from serval_client_support import STREAM_CHUNK_SIZE, RetryPolicy
 from serval_auth_module import ServalBearerAuth
 import argparse
+import contextlib
+import json
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import requests
 from tqdm import tqdm
+from usfm_store import UsfmStore, sync_store
+
+INDEX_FILE_NAME = "index.json"
+
+
+def local_path(output_dir: Path, file: DataFile) -> Path:
+    return output_dir / f"{file.name}_{file.id}"
+
+
+def load_index(output_dir: Path) -> Dict[str, Dict]:
+    """Returns the index entries of the previous run by file id."""
+    path = output_dir / INDEX_FILE_NAME
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {entry["id"]: entry for entry in json.load(f)["files"]}
+
+
+def write_index(output_dir: Path, entries: Dict[str, Dict]) -> None:
+    path = output_dir / INDEX_FILE_NAME
+    tmp_path = path.with_name(path.name + ".part")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"files": sorted(entries.values(), key=lambda e: e["path"])}, f, indent=1
+        )
+    os.replace(tmp_path, path)
+
+
+def plan_sync(
+    files: List[DataFile], previous_index: Dict[str, Dict], output_dir: Path
+) -> Tuple[List[DataFile], Dict[str, Dict], List[Dict]]:
+    """
+    Compares the files on the server with the index of the previous run.
+
+    :return: the files to download, the index entries that are up to date, and the entries of
+        the files that were removed on the server
+    """
+    to_pull = []
+    up_to_date = {}
+    for file in files:
+        entry = previous_index.get(file.id)
+        if is_up_to_date(entry, file, output_dir):
+            up_to_date[file.id] = entry
+        else:
+            to_pull.append(file)
+    ids = {file.id for file in files}
+    removed = [entry for id, entry in previous_index.items() if id not in ids]
+    return to_pull, up_to_date, removed
+
+
+def is_up_to_date(entry: Optional[Dict], file: DataFile, output_dir: Path) -> bool:
+    """
+    Tells whether the local copy recorded by the index entry matches the file on the server.
+
+    It does if the entry has the revision and name of the file and the local copy still has the
+    recorded size.
+    """
+    return (
+        entry is not None
+        and entry["revision"] == file.revision
+        and entry["name"] == file.name
+        and _local_size(output_dir / entry["path"]) == entry["size"]
+    )
+
+
+def _local_size(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def pull_file(
+    client: RemoteCaller,
+    file: DataFile,
+    output_dir: Path,
+    previous: Optional[Dict],
+    force: bool = False,
+) -> Dict:
+    """
+    Downloads a file unless the local copy matches it and returns its index entry.
+
+    Whether the local copy matches is decided from the index entry of the previous run alone
+    (see is_up_to_date), so an unchanged file costs no request. If force is True, the file is
+    always downloaded.
+    """
+    path = local_path(output_dir, file)
+    entry = {
+        "id": file.id,
+        "name": file.name,
+        "format": file.format,
+        "revision": file.revision,
+        "path": path.name,
+    }
+    if not force and is_up_to_date(previous, file, output_dir):
+        return {**entry, "size": previous["size"], "downloaded": False}
+    tmp_path = path.with_name(path.name + ".part")
+    with contextlib.closing(client.data_files_download(file.id)) as file_data:
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(file_data, f, STREAM_CHUNK_SIZE)
+    os.replace(tmp_path, path)
+    if previous is not None and previous["path"] != path.name:
+        # The file was renamed on the server.
+        (output_dir / previous["path"]).unlink(missing_ok=True)
+    return {**entry, "size": path.stat().st_size, "downloaded": True}
 
 
 def main():
@@ -21,26 +134,99 @@ def main():
     parser.add_argument(
         "--output-dir", default="usfm", help="Output directory for usfm files"
     )
+    parser.add_argument(
+        "--jobs", type=int, default=8, help="Number of files to download concurrently"
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Only download files that are new or changed since the last run (by revision and name) and delete local copies of files that were removed on the server",
+    )
+    parser.add_argument(
+        "--store-dir",
+        default=None,
+        help="Extract the pulled projects into an indexed store in this directory (see usfm_store.py)",
+    )
     args = parser.parse_args()
     serval_auth = ServalBearerAuth(
         client_id=args.client_id, client_secret=args.client_secret
     )
+    session = requests.Session()
+    session.auth = serval_auth
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(args.jobs, 10))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     client = RemoteCaller(
-        url_prefix=os.environ.get("SERVAL_HOST_URL"), auth=serval_auth
+        url_prefix=os.environ.get("SERVAL_HOST_URL"),
+        auth=serval_auth,
+        session=session,
+        retry_policy=RetryPolicy(),
     )
 
     output_dir = Path(args.output_dir)
     if not output_dir.exists():
         output_dir.mkdir()
 
-    all_files = client.data_files_get_all()
-    for file in tqdm(list(filter(lambda f: f.format == "Paratext", all_files))):
+    # The server filters by format; older servers ignore the parameter and return all files.
+    all_files = client.data_files_get_all(format="Paratext")
+    files = [f for f in all_files if f.format == "Paratext"]
+    previous_index = load_index(output_dir)
+    index: Dict[str, Dict] = {}
+    downloaded = 0
+    failed = 0
+    if args.sync:
+        to_pull, index, removed = plan_sync(files, previous_index, output_dir)
+        for entry in removed:
+            (output_dir / entry["path"]).unlink(missing_ok=True)
+            del previous_index[entry["id"]]
+        print(
+            f"{len(to_pull)} files new or changed, {len(index)} unchanged, {len(removed)} removed"
+        )
+    else:
+        to_pull = files
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(
+                pull_file,
+                client,
+                file,
+                output_dir,
+                previous_index.get(file.id),
+                force=args.sync,
+            ): file
+            for file in to_pull
+        }
         try:
-            file_data = client.data_files_download(file.id)
-            with open(output_dir / f"{file.name}_{file.id}", "wb") as f:
-                f.write(file_data.read())
-        except Exception as e:
-            print(f"Failed to download file {file.name} because of exception {e}")
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                file = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"Failed to download file {file.name} because of exception {e}")
+                    continue
+                downloaded += entry.pop("downloaded")
+                index[file.id] = entry
+        finally:
+            # Record what was pulled so far, also if the run is interrupted.
+            for future in futures:
+                future.cancel()
+            # Files that were not pulled (again) keep their previous entry, as their local
+            # copies were left as they were.
+            unchanged = {
+                f.id: previous_index[f.id]
+                for f in files
+                if f.id in previous_index and f.id not in index
+            }
+            write_index(output_dir, {**unchanged, **index})
+    print(
+        f"{downloaded} files downloaded, {len(index) - downloaded} already up to date, {failed} failed"
+    )
+
+    if args.store_dir is not None:
+        with UsfmStore(args.store_dir) as store:
+            extracted, removed = sync_store(store, args.output_dir, args.jobs)
+        print(f"{extracted} projects extracted into the store, {removed} removed")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,20 @@
 import argparse
+import contextlib
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
+import requests
 from serval_auth_module import ServalBearerAuth
+from serval_client import RemoteCaller
 from serval_client_module import (
     Corpus,
     CorpusConfig,
     CorpusFileConfig,
     ParallelCorpusFilterConfig,
     PretranslateCorpusConfig,
-    RemoteCaller,
-    ResourceLink,
     TrainingCorpusConfig,
     TranslationBuild,
     TranslationBuildConfig,
@@ -23,6 +25,15 @@ from serval_client_module import (
 )
 
 
+def create_session(auth: requests.auth.AuthBase, jobs: int) -> requests.Session:
+    session = requests.Session()
+    session.auth = auth
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(jobs, 10))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Rerun a build job previously run on the 'source' Serval instance on the 'target' Serval instance."
@@ -73,6 +84,12 @@ def main():
         default="",
         help="Target Serval instance client host url (if none is provided env var SERVAL_HOST_URL will be used)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Maximum number of files and corpora to copy concurrently",
+    )
     parser.add_argument(
         "--build-options",
         default="{}",
@@ -90,7 +107,9 @@ def main():
         auth_url=args.source_client_auth_url,
     )
     source_client = RemoteCaller(
-        url_prefix=args.source_client_host_url, auth=source_serval_auth
+        url_prefix=args.source_client_host_url,
+        auth=source_serval_auth,
+        session=create_session(source_serval_auth, args.jobs),
     )
 
     target_serval_auth = ServalBearerAuth(
@@ -105,6 +124,7 @@ def main():
             else os.environ.get("SERVAL_HOST_URL")
         ),
         auth=target_serval_auth,
+        session=create_session(target_serval_auth, args.jobs),
     )
 
     logger.info(
@@ -133,59 +153,90 @@ def main():
     target_corpus_id_by_source_corpus_id: Dict[str, str] = {}
     target_file_by_source_file_id: Dict[str, Dict] = {}
 
-    def get_or_create_target_corpus(corpus_link: ResourceLink) -> str:
-        corpus: Corpus = source_client.corpora_get(corpus_link.id)
-        target_files = []
-        for file_link in corpus.files:
-            file = source_client.data_files_get(file_link.file.id)
-            if file.id in target_file_by_source_file_id:
-                target_file = target_file_by_source_file_id[file.id]
-            else:
-                file_contents = source_client.data_files_download(file.id)
-                target_file = json.loads(
-                    target_client.data_files_create(
-                        file_contents, file.format, file.name
-                    )
-                )
-                file_contents.close()
-                target_file_by_source_file_id[file.id] = target_file
-            target_files.append(target_file)
-        if corpus.id not in target_corpus_id_by_source_corpus_id:
-            target_corpus = json.loads(
-                target_client.corpora_create(
-                    CorpusConfig(
-                        language=corpus.language,
-                        files=[CorpusFileConfig(file_id=f["id"]) for f in target_files],
-                        name=corpus.name,
-                    )
+    def replicate_file(file_id: str) -> Dict:
+        file = source_client.data_files_get(file_id)
+        # The download is streamed into the upload chunk by chunk.
+        with contextlib.closing(
+            source_client.data_files_download(file.id)
+        ) as file_contents:
+            return json.loads(
+                target_client.data_files_create(file_contents, file.format, file.name)
+            )
+
+    def create_target_corpus(corpus: Corpus) -> str:
+        target_corpus = json.loads(
+            target_client.corpora_create(
+                CorpusConfig(
+                    language=corpus.language,
+                    files=[
+                        CorpusFileConfig(
+                            file_id=target_file_by_source_file_id[f.file.id]["id"]
+                        )
+                        for f in corpus.files
+                    ],
+                    name=corpus.name,
                 )
             )
-            target_corpus_id_by_source_corpus_id[corpus.id] = target_corpus["id"]
-            return target_corpus["id"]
-
-        return target_corpus_id_by_source_corpus_id[corpus.id]
-
-    for source_parallel_corpus in source_parallel_corpora:
-        target_src_corpus_ids = []
-        target_trg_corpus_ids = []
-        for corpus_link in source_parallel_corpus.source_corpora:
-            target_corpus_id = get_or_create_target_corpus(corpus_link)
-            target_src_corpus_ids.append(target_corpus_id)
-        for corpus_link in source_parallel_corpus.target_corpora:
-            target_corpus_id = get_or_create_target_corpus(corpus_link)
-            target_trg_corpus_ids.append(target_corpus_id)
+        )
+        return target_corpus["id"]
+
+    def create_target_parallel_corpus(
+        source_parallel_corpus: TranslationParallelCorpus,
+    ) -> str:
         target_parallel_corpus = json.loads(
             target_client.translation_engines_add_parallel_corpus(
                 target_engine["id"],
                 TranslationParallelCorpusConfig(
-                    source_corpus_ids=target_src_corpus_ids,
-                    target_corpus_ids=target_trg_corpus_ids,
+                    source_corpus_ids=[
+                        target_corpus_id_by_source_corpus_id[c.id]
+                        for c in source_parallel_corpus.source_corpora
+                    ],
+                    target_corpus_ids=[
+                        target_corpus_id_by_source_corpus_id[c.id]
+                        for c in source_parallel_corpus.target_corpora
+                    ],
                 ),
             )
         )
-        target_parallel_corpus_id_by_source_parallel_corpus_id[
-            source_parallel_corpus.id
-        ] = target_parallel_corpus["id"]
+        return target_parallel_corpus["id"]
+
+    # Each stage issues its independent requests concurrently. Corpora and files shared by
+    # several parallel corpora are only replicated once.
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        source_corpus_ids = list(
+            dict.fromkeys(
+                corpus_link.id
+                for source_parallel_corpus in source_parallel_corpora
+                for corpus_link in source_parallel_corpus.source_corpora
+                + source_parallel_corpus.target_corpora
+            )
+        )
+        source_corpora: List[Corpus] = list(
+            executor.map(source_client.corpora_get, source_corpus_ids)
+        )
+
+        source_file_ids = list(
+            dict.fromkeys(
+                file_link.file.id for corpus in source_corpora for file_link in corpus.files
+            )
+        )
+        logger.info(
+            f"Copying {len(source_file_ids)} files of {len(source_corpora)} corpora..."
+        )
+        target_file_by_source_file_id.update(
+            zip(source_file_ids, executor.map(replicate_file, source_file_ids))
+        )
+
+        target_corpus_id_by_source_corpus_id.update(
+            zip(source_corpus_ids, executor.map(create_target_corpus, source_corpora))
+        )
+
+        target_parallel_corpus_id_by_source_parallel_corpus_id.update(
+            zip(
+                [c.id for c in source_parallel_corpora],
+                executor.map(create_target_parallel_corpus, source_parallel_corpora),
+            )
+        )
 
     source_build: TranslationBuild = source_client.translation_engines_get_build(
         args.source_engine_id, args.source_build_id
@@ -0,0 +1,256 @@
+"""
+Columnar NumPy export of word alignments and word graphs.
+
+Alignments are stored as flat int32 index arrays and a float32 score array (NaN when the
+server did not return a score), with an int64 offset array per segment: the pairs of segment `i`
+are at `offsets[i]:offsets[i + 1]`. This allows alignment statistics to be computed without
+Python loops over model objects, and the arrays can be saved to .npz or, if pyarrow is
+installed, to Parquet for fast reloads.
+"""
+import json
+from dataclasses import dataclass
+from typing import Iterable, List
+
+import numpy as np
+from serval_client_module import WordAlignment, WordGraph
+from serval_columns import AlignedWordPairColumns, WordGraphArcColumns
+
+
+@dataclass
+class AlignmentArrays:
+    text_ids: List[str]
+    source_refs: List[List[str]]
+    target_refs: List[List[str]]
+    # Number of source and target tokens of each segment
+    source_length: np.ndarray
+    target_length: np.ndarray
+    offsets: np.ndarray
+    source_index: np.ndarray
+    target_index: np.ndarray
+    score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.text_ids)
+
+    def pair_segments(self) -> np.ndarray:
+        """Returns the index of the segment of every aligned pair."""
+        return np.repeat(
+            np.arange(len(self), dtype=np.int32), np.diff(self.offsets)
+        )
+
+
+@dataclass
+class WordGraphArrays:
+    source_tokens: List[str]
+    initial_state_score: float
+    final_states: np.ndarray
+    prev_state: np.ndarray
+    next_state: np.ndarray
+    score: np.ndarray
+    source_segment_start: np.ndarray
+    source_segment_end: np.ndarray
+    # The target tokens, confidences and sources of arc i are at token_offsets[i]:token_offsets[i + 1]
+    token_offsets: np.ndarray
+    target_tokens: List[str]
+    confidences: np.ndarray
+    sources: List[List[str]]
+    # The aligned pairs of arc i are at alignment_offsets[i]:alignment_offsets[i + 1]
+    alignment_offsets: np.ndarray
+    alignment_source_index: np.ndarray
+    alignment_target_index: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.prev_state)
+
+
+def _index_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.int32)
+
+
+def _score_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float32)
+
+
+def word_alignments_to_arrays(alignments: Iterable[WordAlignment]) -> AlignmentArrays:
+    """
+    Converts word alignments to columnar arrays.
+
+    Accepts any iterable, such as the one returned by
+    `RemoteCaller.word_alignment_engines_iter_all_word_alignments`, so a listing does not have to
+    be materialized as a list first.
+    """
+    text_ids = []
+    source_refs = []
+    target_refs = []
+    source_length = []
+    target_length = []
+    offsets = [0]
+    pairs = AlignedWordPairColumns()
+    for alignment in alignments:
+        text_ids.append(alignment.text_id)
+        source_refs.append(alignment.source_refs)
+        target_refs.append(alignment.target_refs)
+        source_length.append(len(alignment.source_tokens))
+        target_length.append(len(alignment.target_tokens))
+        pairs.extend(alignment.alignment)
+        offsets.append(len(pairs))
+    return AlignmentArrays(
+        text_ids=text_ids,
+        source_refs=source_refs,
+        target_refs=target_refs,
+        source_length=_index_array(source_length),
+        target_length=_index_array(target_length),
+        offsets=np.asarray(offsets, dtype=np.int64),
+        source_index=_index_array(pairs.source_index),
+        target_index=_index_array(pairs.target_index),
+        score=_score_array(pairs.score),
+    )
+
+
+def word_graph_to_arrays(word_graph: WordGraph) -> WordGraphArrays:
+    """Converts a word graph to columnar arrays."""
+    arcs = WordGraphArcColumns.from_list(word_graph.arcs)
+    return WordGraphArrays(
+        source_tokens=word_graph.source_tokens,
+        initial_state_score=word_graph.initial_state_score,
+        final_states=_index_array(word_graph.final_states),
+        prev_state=_index_array(arcs.prev_state),
+        next_state=_index_array(arcs.next_state),
+        score=_score_array(arcs.score),
+        source_segment_start=_index_array(arcs.source_segment_start),
+        source_segment_end=_index_array(arcs.source_segment_end),
+        token_offsets=np.asarray(arcs.token_offsets, dtype=np.int64),
+        target_tokens=arcs.target_tokens,
+        confidences=_score_array(arcs.confidences),
+        sources=arcs.sources,
+        alignment_offsets=np.asarray(arcs.alignment_offsets, dtype=np.int64),
+        alignment_source_index=_index_array(arcs.alignment.source_index),
+        alignment_target_index=_index_array(arcs.alignment.target_index),
+    )
+
+
+def alignment_coverage(arrays: AlignmentArrays) -> np.ndarray:
+    """Returns the fraction of the source tokens of each segment that are aligned to a target token."""
+    width = np.int64(arrays.source_length.max(initial=0)) + 1
+    aligned = np.unique(
+        arrays.pair_segments().astype(np.int64) * width + arrays.source_index
+    )
+    counts = np.bincount(aligned // width, minlength=len(arrays))
+    return counts / np.maximum(arrays.source_length, 1)
+
+
+def _pair_keys(arrays: AlignmentArrays, width: np.int64) -> np.ndarray:
+    segments = arrays.pair_segments().astype(np.int64)
+    return np.unique((segments * width + arrays.source_index) * width + arrays.target_index)
+
+
+def alignment_agreement(a: AlignmentArrays, b: AlignmentArrays) -> np.ndarray:
+    """
+    Returns the Dice agreement of the aligned pairs of each segment, for two alignments of the
+    same segments (e.g. from two engines or two builds). Segments without pairs on either side
+    agree fully.
+    """
+    if len(a) != len(b):
+        raise ValueError(
+            f"Expected alignments of the same segments, but got {len(a)} and {len(b)} segments."
+        )
+    width = np.int64(
+        max(
+            a.source_length.max(initial=0),
+            a.target_length.max(initial=0),
+            b.source_length.max(initial=0),
+            b.target_length.max(initial=0),
+        )
+    ) + 1
+    keys_a = _pair_keys(a, width)
+    keys_b = _pair_keys(b, width)
+    shared = np.intersect1d(keys_a, keys_b, assume_unique=True)
+    n = len(a)
+    count_a = np.bincount(keys_a // (width * width), minlength=n)
+    count_b = np.bincount(keys_b // (width * width), minlength=n)
+    count_shared = np.bincount(shared // (width * width), minlength=n)
+    total = count_a + count_b
+    return np.where(total > 0, 2 * count_shared / np.maximum(total, 1), 1.0)
+
+
+def save_alignments_npz(arrays: AlignmentArrays, path: str) -> None:
+    np.savez(
+        path,
+        text_ids=np.asarray(arrays.text_ids, dtype=str),
+        source_refs=np.asarray([json.dumps(r) for r in arrays.source_refs], dtype=str),
+        target_refs=np.asarray([json.dumps(r) for r in arrays.target_refs], dtype=str),
+        source_length=arrays.source_length,
+        target_length=arrays.target_length,
+        offsets=arrays.offsets,
+        source_index=arrays.source_index,
+        target_index=arrays.target_index,
+        score=arrays.score,
+    )
+
+
+def load_alignments_npz(path: str) -> AlignmentArrays:
+    with np.load(path) as data:
+        return AlignmentArrays(
+            text_ids=data["text_ids"].tolist(),
+            source_refs=[json.loads(r) for r in data["source_refs"]],
+            target_refs=[json.loads(r) for r in data["target_refs"]],
+            source_length=data["source_length"],
+            target_length=data["target_length"],
+            offsets=data["offsets"],
+            source_index=data["source_index"],
+            target_index=data["target_index"],
+            score=data["score"],
+        )
+
+
+def alignments_to_arrow_table(arrays: AlignmentArrays):
+    """Returns a pyarrow Table with one row per segment and the pairs as list columns."""
+    import pyarrow as pa
+
+    def pairs(values: np.ndarray):
+        return pa.LargeListArray.from_arrays(pa.array(arrays.offsets), pa.array(values))
+
+    return pa.table(
+        {
+            "text_id": pa.array(arrays.text_ids, type=pa.string()),
+            "source_refs": pa.array(arrays.source_refs, type=pa.list_(pa.string())),
+            "target_refs": pa.array(arrays.target_refs, type=pa.list_(pa.string())),
+            "source_length": pa.array(arrays.source_length),
+            "target_length": pa.array(arrays.target_length),
+            "source_index": pairs(arrays.source_index),
+            "target_index": pairs(arrays.target_index),
+            "score": pairs(arrays.score),
+        }
+    )
+
+
+def alignments_from_arrow_table(table) -> AlignmentArrays:
+    def pairs(name: str) -> np.ndarray:
+        return table.column(name).combine_chunks().flatten().to_numpy(zero_copy_only=False)
+
+    offsets = table.column("source_index").combine_chunks().offsets.to_numpy()
+    return AlignmentArrays(
+        text_ids=table.column("text_id").to_pylist(),
+        source_refs=table.column("source_refs").to_pylist(),
+        target_refs=table.column("target_refs").to_pylist(),
+        source_length=table.column("source_length").to_numpy(),
+        target_length=table.column("target_length").to_numpy(),
+        offsets=offsets - offsets[0],
+        source_index=pairs("source_index"),
+        target_index=pairs("target_index"),
+        score=pairs("score"),
+    )
+
+
+def write_alignments_parquet(arrays: AlignmentArrays, path: str) -> None:
+    """Writes the alignments to a Parquet file (requires pyarrow)."""
+    import pyarrow.parquet as pq
+
+    pq.write_table(alignments_to_arrow_table(arrays), path)
+
+
+def read_alignments_parquet(path: str) -> AlignmentArrays:
+    """Reads alignments written by write_alignments_parquet (requires pyarrow)."""
+    import pyarrow.parquet as pq
+
+    return alignments_from_arrow_table(pq.read_table(path))
@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Implements an asynchronous client for the Serval API.
+
+`AsyncRemoteCaller` has the method surface of `serval_client.RemoteCaller`, but every method is a
+coroutine executed over a shared, keep-alive `aiohttp` connection pool. The methods come from the
+generated `serval_client_operations`, and the handling of requests and responses (JSON codec,
+checked or trusted conversion, retry policy, result cache and metrics hooks) is shared with the
+synchronous client.
+"""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import asyncio
+import contextlib
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import aiohttp
+import requests.auth
+
+from serval_client import _ITER_ALL_PRETRANSLATIONS, _ITER_ALL_WORD_ALIGNMENTS, _CallerCore
+from serval_client_module import (
+    Pretranslation,
+    SegmentPair,
+    TranslationResult,
+    WordAlignment,
+    WordGraph,
+    pretranslation_from_obj,
+    word_alignment_from_obj,
+)
+from serval_client_operations import AsyncRemoteCallerOperations
+from serval_client_support import (
+    _JSON_HEADERS,
+    JsonCodec,
+    Operation,
+    RequestMetrics,
+    ResultCache,
+    RetryPolicy,
+    SegmentResult,
+    _JsonArrayParser,
+    _body_size,
+)
+
+# Exceptions of aiohttp after which a request is retried like after a connection error.
+_TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+class _HeaderCarrier:
+    """Stands in for a `requests.PreparedRequest` so that `requests` auth objects can set headers."""
+
+    def __init__(self) -> None:
+        self.headers = {}  # type: Dict[str, str]
+
+
+class _AsyncWrappedResponse:
+    """
+    Wrap a streamed `aiohttp.ClientResponse` together with the concurrency slot it occupies.
+
+    The body is not read into memory; consume it with `read` or `iter_chunked` and close the
+    response (or use it as an async context manager) to return the connection to the pool.
+    """
+
+    def __init__(self, response: aiohttp.ClientResponse, release) -> None:
+        self._response = response
+        self._release = release
+
+    def __getattr__(self, item):
+        return getattr(self._response, item)
+
+    async def raise_for_status(self) -> None:
+        if not self._response.ok:
+            await self.aclose()
+            self._response.raise_for_status()
+
+    async def read(self, n: int = -1) -> bytes:
+        return await self._response.content.read(n)
+
+    async def iter_chunked(self, chunk_size: int) -> AsyncIterator[bytes]:
+        async for chunk in self._response.content.iter_chunked(chunk_size):
+            yield chunk
+
+    async def aclose(self) -> None:
+        if self._release is not None:
+            self._response.release()
+            self._release()
+            self._release = None
+
+    async def __aenter__(self) -> '_AsyncWrappedResponse':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+async def _aiter_json_array(resp: aiohttp.ClientResponse, chunk_size: int) -> AsyncIterator[Any]:
+    """
+    Iterates over the elements of the JSON array streamed in the response body.
+
+    :param resp: response whose body has not been read yet
+    :param chunk_size: number of bytes read from the body at a time
+    :return: async iterator over the parsed elements
+    """
+    parser = _JsonArrayParser()
+    async for chunk in resp.content.iter_chunked(chunk_size):
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+async def _acall_many(
+        call: Callable[[str], Awaitable[Any]],
+        segments: Sequence[str],
+        concurrency: int) -> List[SegmentResult]:
+    """
+    Awaits `call` for every segment with up to `concurrency` requests in flight.
+
+    :param call: issues the request for a single segment
+    :param segments: the source segments
+    :param concurrency: maximum number of requests in flight
+    :return: one result per segment, in the order of the segments
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def call_segment(segment: str) -> SegmentResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await call(segment)
+            except Exception as e:
+                return SegmentResult(segment, error=e, latency=time.perf_counter() - start)
+            return SegmentResult(segment, result=result, latency=time.perf_counter() - start)
+
+    return list(await asyncio.gather(*(call_segment(segment) for segment in segments)))
+
+
+class AsyncRemoteCaller(_CallerCore, AsyncRemoteCallerOperations):
+    """Executes the remote calls to the server asynchronously."""
+
+    def __init__(
+        self,
+        url_prefix: str,
+        auth: Optional[requests.auth.AuthBase] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ResultCache] = None,
+        validate: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Optional[Iterable[Callable[[RequestMetrics], None]]] = None,
+        max_concurrency: int = 32,
+        max_connections: int = 100,
+        timeout: Optional[aiohttp.ClientTimeout] = None) -> None:
+        """
+        :param url_prefix: base URL of the Serval instance
+        :param auth: `requests` auth object (e.g. `ServalBearerAuth`) used to set the request headers
+        :param session: externally managed session; if None, one is created on first use
+        :param cache: cache of translation results and word graphs, if any
+        :param validate: whether responses are checked while they are converted
+        :param json_codec: codec of request and response bodies; if None, the fastest installed one
+        :param retry_policy: policy to retry failed requests with, if any
+        :param hooks: called with the RequestMetrics of every call
+        :param max_concurrency: maximum number of requests in flight (including open downloads)
+        :param max_connections: size of the keep-alive connection pool of the created session
+        :param timeout: timeouts of the created session
+        """
+        super().__init__(url_prefix, auth, cache, validate, json_codec, retry_policy, hooks)
+        self.session = session
+        self._owns_session = session is None
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections),
+                timeout=self._timeout or aiohttp.ClientTimeout(total=None, sock_connect=30),
+            )
+        return self.session
+
+    async def _headers(self) -> Dict[str, str]:
+        if self.auth is None:
+            return {}
+        get_cached_token = getattr(self.auth, 'get_cached_token', None)
+        token = get_cached_token() if get_cached_token is not None else None
+        if token is not None:
+            return {'authorization': 'Bearer ' + token}
+        # Refreshing the token is a blocking request to the auth server, so it runs off the event loop.
+        carrier = _HeaderCarrier()
+        await asyncio.to_thread(self.auth, carrier)
+        return carrier.headers
+
+    def _body(
+            self,
+            json: Any,
+            data: Optional[Dict[str, str]],
+            files: Optional[Dict[str, BinaryIO]]) -> Tuple[Any, Dict[str, str]]:
+        """Returns the request body and its headers."""
+        if json is not None:
+            return self.json_codec.dumps(json), _JSON_HEADERS
+        if files is not None:
+            form = aiohttp.FormData()
+            for key, value in (data or {}).items():
+                form.add_field(key, value)
+            for key, file in files.items():
+                form.add_field(key, file, filename=os.path.basename(getattr(file, 'name', key)))
+            return form, {}
+        return data, {}
+
+    async def _send(
+            self,
+            operation: Operation,
+            url: str,
+            metrics: Optional[RequestMetrics],
+            params: Optional[Dict[str, str]],
+            json: Any,
+            data: Optional[Dict[str, str]],
+            files: Optional[Dict[str, BinaryIO]]) -> aiohttp.ClientResponse:
+        body, body_headers = self._body(json, data, files)
+
+        async def send() -> aiohttp.ClientResponse:
+            # The headers are set on every attempt, so that a retry picks up a refreshed token.
+            headers = dict(body_headers)
+            headers.update(await self._headers())
+            if metrics is not None:
+                metrics.attempts += 1
+            return await self._get_session().request(
+                method=operation.http_method,
+                url=url,
+                params=params,
+                data=body,
+                headers=headers)
+
+        if metrics is not None:
+            metrics.bytes_out = _body_size(body)
+        began = time.perf_counter()
+        try:
+            if self.retry_policy is None:
+                resp = await send()
+            else:
+                retryable = self.retry_policy.retryable(operation.http_method, self._idempotent(operation), body)
+                resp = await self.retry_policy.send_async(send, url, retryable, _TRANSIENT_ERRORS)
+        except Exception as e:
+            if metrics is not None:
+                metrics.ttfb = time.perf_counter() - began
+                metrics.error = type(e).__name__
+            raise
+        if metrics is not None:
+            metrics.status = resp.status
+            metrics.ttfb = time.perf_counter() - began
+            metrics.bytes_in = resp.content_length
+        return resp
+
+    @contextlib.asynccontextmanager
+    async def _request(
+            self,
+            operation: Operation,
+            url: str,
+            metrics: Optional[RequestMetrics],
+            params: Optional[Dict[str, str]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, str]] = None,
+            files: Optional[Dict[str, BinaryIO]] = None) -> AsyncIterator[aiohttp.ClientResponse]:
+        async with self._semaphore:
+            resp = await self._send(operation, url, metrics, params, json, data, files)
+            try:
+                yield resp
+            finally:
+                resp.release()
+
+    async def _open(
+            self,
+            operation: Operation,
+            url: str,
+            metrics: Optional[RequestMetrics],
+            params: Optional[Dict[str, str]],
+            json: Any,
+            data: Optional[Dict[str, str]],
+            files: Optional[Dict[str, BinaryIO]]) -> _AsyncWrappedResponse:
+        await self._semaphore.acquire()
+        try:
+            resp = await self._send(operation, url, metrics, params, json, data, files)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return _AsyncWrappedResponse(resp, self._semaphore.release)
+
+    async def _call(
+            self,
+            operation: Operation,
+            url: str,
+            params: Optional[Dict[str, str]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, str]] = None,
+            files: Optional[Dict[str, BinaryIO]] = None) -> Any:
+        metrics = self._metrics(operation)
+        began = time.perf_counter()
+        error = None  # type: Optional[BaseException]
+        try:
+            if operation.stream:
+                wrapped = await self._open(operation, url, metrics, params, json, data, files)
+                await wrapped.raise_for_status()
+                return wrapped
+
+            async with self._request(operation, url, metrics, params, json, data, files) as resp:
+                resp.raise_for_status()
+                body = await resp.read()
+                if metrics is not None:
+                    metrics.bytes_in = len(body)
+                if operation.expected is None:
+                    return body
+                return self._convert(self.json_codec.loads(body), operation.expected, metrics)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._emit(metrics, time.perf_counter() - began, error)
+
+    async def _iter_items(
+            self,
+            operation: Operation,
+            url: str,
+            params: Dict[str, str],
+            item_from_obj: Callable[..., Any],
+            chunk_size: int) -> AsyncIterator[Any]:
+        """Yields the items of the JSON array in the response body as they are received."""
+        metrics = self._metrics(operation)
+        # Only the time spent producing items counts, not the time the consumer holds on to them.
+        elapsed = 0.0
+        began = time.perf_counter()  # type: Optional[float]
+        error = None  # type: Optional[BaseException]
+        try:
+            async with self._request(operation, url, metrics, params=params) as resp:
+                resp.raise_for_status()
+                i = 0
+                async for obj in _aiter_json_array(resp, chunk_size):
+                    item = self._convert_item(obj, i, operation, item_from_obj)
+                    i += 1
+                    elapsed += time.perf_counter() - began
+                    began = None
+                    yield item
+                    began = time.perf_counter()
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if began is not None:
+                elapsed += time.perf_counter() - began
+            self._emit(metrics, elapsed, error)
+
+    async def close(self) -> None:
+        """Closes the connection pool if it was created by this caller."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'AsyncRemoteCaller':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _cached(self, id: str, key: Tuple[Any, ...], call: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns the result of a call on the engine from the cache, or makes and caches the call."""
+        if self.cache is None:
+            return await call()
+
+        revision, generation = self.cache.known_version(id)
+        if revision is None:
+            revision = (await self.translation_engines_get(id)).model_revision
+            self.cache.record_revision(id, revision)
+        cache_key = (id, revision, generation) + key
+        found, cached = self.cache.get(cache_key)
+        if found:
+            return cached
+
+        result = await call()
+        self.cache.put(cache_key, result)
+        return result
+
+    async def translation_engines_translate(
+            self,
+            id: str,
+            segment: str) -> 'TranslationResult':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate.
+
+        The result is served from and stored in the cache of the caller, if any.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The translation result
+        """
+        call = super().translation_engines_translate
+        return await self._cached(id, ('translate', segment), lambda: call(id, segment))
+
+    async def translation_engines_translate_n(
+            self,
+            id: str,
+            n: int,
+            segment: str) -> List['TranslationResult']:
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate/{n}.
+
+        The results are served from and stored in the cache of the caller, if any.
+
+        :param id: The translation engine id
+        :param n: The number of translations to generate
+        :param segment: The source segment
+
+        :return: The translation results
+        """
+        call = super().translation_engines_translate_n
+        return await self._cached(id, ('translate_n', n, segment), lambda: call(id, n, segment))
+
+    async def translation_engines_get_word_graph(
+            self,
+            id: str,
+            segment: str) -> 'WordGraph':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/get-word-graph.
+
+        The result is served from and stored in the cache of the caller, if any.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The word graph result
+        """
+        call = super().translation_engines_get_word_graph
+        return await self._cached(id, ('get_word_graph', segment), lambda: call(id, segment))
+
+    async def translation_engines_train_segment(
+            self,
+            id: str,
+            segment_pair: 'SegmentPair') -> bytes:
+        """
+        Train the engine on a segment pair, see the generated method for details.
+
+        The cached results of the engine are dropped, since the engine learned from the segment.
+
+        :param id: The translation engine id
+        :param segment_pair: The segment pair
+
+        :return: The engine was trained successfully
+        """
+        result = await super().translation_engines_train_segment(id, segment_pair)
+        if self.cache is not None:
+            self.cache.invalidate_engine(id)
+        return result
+
+    async def translation_engines_translate_many(
+            self,
+            id: str,
+            segments: Sequence[str],
+            concurrency: int = 8) -> List[SegmentResult]:
+        """
+        Translate many segments, sending up to `concurrency` requests at a time.
+
+        A failed segment does not stop the others; its error is recorded in its result.
+
+        :param id: The translation engine id
+        :param segments: The source segments
+        :param concurrency: The maximum number of requests in flight
+
+        :return: The translation result of each segment, in input order
+        """
+        return await _acall_many(
+            lambda segment: self.translation_engines_translate(id, segment),
+            segments,
+            concurrency)
+
+    async def translation_engines_translate_n_many(
+            self,
+            id: str,
+            n: int,
+            segments: Sequence[str],
+            concurrency: int = 8) -> List[SegmentResult]:
+        """
+        Generate `n` translations of many segments, sending up to `concurrency` requests at a time.
+
+        :param id: The translation engine id
+        :param n: The number of translations to generate
+        :param segments: The source segments
+        :param concurrency: The maximum number of requests in flight
+
+        :return: The translation results of each segment, in input order
+        """
+        return await _acall_many(
+            lambda segment: self.translation_engines_translate_n(id, n, segment),
+            segments,
+            concurrency)
+
+    async def translation_engines_get_word_graph_many(
+            self,
+            id: str,
+            segments: Sequence[str],
+            concurrency: int = 8) -> List[SegmentResult]:
+        """
+        Get the word graphs of many segments, sending up to `concurrency` requests at a time.
+
+        :param id: The translation engine id
+        :param segments: The source segments
+        :param concurrency: The maximum number of requests in flight
+
+        :return: The word graph result of each segment, in input order
+        """
+        return await _acall_many(
+            lambda segment: self.translation_engines_get_word_graph(id, segment),
+            segments,
+            concurrency)
+
+    def translation_engines_iter_all_pretranslations(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: Optional[str] = None,
+            chunk_size: int = 64 * 1024) -> AsyncIterator['Pretranslation']:
+        """
+        Streams the pretranslations of translation_engines_get_all_pretranslations.
+
+        The response array is parsed incrementally and each pretranslation is yielded as soon as
+        it has been received, so memory use does not grow with the size of the corpus.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id (optional)
+        :param chunk_size: number of bytes read from the response at a time
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._iter_items(
+            _ITER_ALL_PRETRANSLATIONS, url, params, pretranslation_from_obj, chunk_size)
+
+    def word_alignment_engines_iter_all_word_alignments(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: Optional[str] = None,
+            chunk_size: int = 64 * 1024) -> AsyncIterator['WordAlignment']:
+        """
+        Streams the word alignments of word_alignment_engines_get_all_word_alignments.
+
+        The response array is parsed incrementally and each word alignment is yielded as soon as
+        it has been received, so memory use does not grow with the size of the corpus.
+
+        :param id: The engine id
+        :param corpus_id: The corpus id
+        :param text_id: The text id (optional)
+        :param chunk_size: number of bytes read from the response at a time
+
+        :return: The word alignments
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/word-alignments'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._iter_items(
+            _ITER_ALL_WORD_ALIGNMENTS, url, params, word_alignment_from_obj, chunk_size)
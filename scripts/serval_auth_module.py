@@ -1,12 +1,29 @@
+import contextlib
 import json
+import logging
 import os
+import threading
 import time
+from typing import Optional
 
 import requests
 
+# Refresh the token this many seconds before the auth server says it expires.
+TOKEN_EXPIRY_MARGIN = 60
+# Used when the auth server does not report the lifetime of the token.
+DEFAULT_TOKEN_LIFETIME = 20 * 60
+
+logger = logging.getLogger(__name__)
+
 
 class ServalBearerAuth(requests.auth.AuthBase):
-    def __init__(self, client_id="", client_secret="", auth_url=""):
+    def __init__(
+        self,
+        client_id="",
+        client_secret="",
+        auth_url="",
+        token_cache_path: Optional[str] = None,
+    ):
         self.__client_id = (
             client_id if client_id != "" else os.environ.get("SERVAL_CLIENT_ID")
         )
@@ -21,15 +38,36 @@ class ServalBearerAuth(requests.auth.AuthBase):
             auth_url if auth_url != "" else os.environ.get("SERVAL_AUTH_URL")
         )
         assert self.__auth_url is not None
-        self.update_token()
-        self.__last_time_fetched = time.time()
+        self.__token_cache_path = (
+            token_cache_path
+            if token_cache_path is not None
+            else os.environ.get("SERVAL_TOKEN_CACHE")
+        )
+        self.__lock = threading.Lock()
+        self.token = None
+        self.__expires_at = 0.0
+        if not self.__load_cached_token():
+            self.update_token()
 
     def __call__(self, r):
-        if time.time() - self.__last_time_fetched > 20 * 60:
-            self.update_token()
-        r.headers["authorization"] = "Bearer " + self.token
+        r.headers["authorization"] = "Bearer " + self.get_token()
         return r
 
+    def get_cached_token(self) -> Optional[str]:
+        """Returns the access token if it is still valid, or None if it has to be refreshed."""
+        return self.token if time.time() < self.__expires_at else None
+
+    def get_token(self) -> str:
+        """Returns a valid access token, refreshing it at most once per expiry."""
+        token = self.get_cached_token()
+        if token is not None:
+            return token
+        with self.__lock:
+            # Another thread may have refreshed the token while this one was waiting.
+            if time.time() >= self.__expires_at:
+                self.update_token()
+            return self.token
+
     def update_token(self):
         data = {
             "client_id": f"{self.__client_id}",
@@ -46,9 +84,58 @@ class ServalBearerAuth(requests.auth.AuthBase):
                 data=encoded_data,
                 headers={"content-type": "application/json"},
             )
-            self.token = r.json()["access_token"] if r is not None else None
+            body = r.json()
+            self.token = body["access_token"]
+            lifetime = body.get("expires_in", DEFAULT_TOKEN_LIFETIME)
         except Exception as e:
             raise ValueError(
                 f"Token cannot be None. Failed to retrieve token from auth server; responded \
                     with {r.status_code if r is not None else '<unknown>'}. Original exception: {e}"
             )
+        self.__expires_at = time.time() + max(lifetime - TOKEN_EXPIRY_MARGIN, 0)
+        self.__save_cached_token()
+
+    def __load_cached_token(self) -> bool:
+        if not self.__token_cache_path:
+            return False
+        try:
+            with open(self.__token_cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (
+                cached.get("client_id") != self.__client_id
+                or cached.get("auth_url") != self.__auth_url
+                or cached.get("expires_at", 0) <= time.time()
+            ):
+                return False
+            token = cached["access_token"]
+            expires_at = float(cached["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing, unreadable or malformed cache only means a new token is requested.
+            return False
+        self.token = token
+        self.__expires_at = expires_at
+        return True
+
+    def __save_cached_token(self):
+        if not self.__token_cache_path:
+            return
+        cached = {
+            "client_id": self.__client_id,
+            "auth_url": self.__auth_url,
+            "access_token": self.token,
+            "expires_at": self.__expires_at,
+        }
+        tmp_path = f"{self.__token_cache_path}.{os.getpid()}.tmp"
+        # The cache only saves token requests, so failing to write it must not fail the caller.
+        try:
+            # The token grants API access, so keep the cache file private to the user.
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, self.__token_cache_path)
+        except OSError as e:
+            logger.warning(
+                f"Failed to write the token cache {self.__token_cache_path}: {e}"
+            )
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
@@ -0,0 +1,164 @@
+"""
+Watches translation builds by long-polling the build endpoint with `min_revision`.
+
+Each request asks for `min_revision = revision + 1` of the last build seen, so the server answers
+as soon as the build changes (or after up to 40 seconds with 408, which just means nothing
+changed). The long-polls of all watched builds wait together on one event loop, through an
+AsyncRemoteCaller, so every build has its poll pending at all times and no build waits for the
+poll of another one to return.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import aiohttp
+from serval_async_client_module import AsyncRemoteCaller
+from serval_client import RemoteCaller
+from serval_client_module import TranslationBuild
+
+TERMINAL_BUILD_STATES = frozenset({"Completed", "Faulted", "Canceled"})
+
+
+@dataclass
+class BuildEvent:
+    """A change observed in a watched build: kind is "state", "progress" or "phase"."""
+
+    engine_id: str
+    kind: str
+    build: TranslationBuild
+    previous: Optional[TranslationBuild]
+
+
+def build_changes(
+    previous: Optional[TranslationBuild], build: TranslationBuild
+) -> List[str]:
+    """Returns the kinds of change between two observations of the same build."""
+    if previous is None:
+        return ["state"]
+    changes = []
+    if build.state != previous.state:
+        changes.append("state")
+    if build.progress != previous.progress:
+        changes.append("progress")
+    phases = [(p.stage, p.step) for p in build.phases or []]
+    previous_phases = [(p.stage, p.step) for p in previous.phases or []]
+    if phases != previous_phases:
+        changes.append("phase")
+    return changes
+
+
+class BuildWatcher:
+    """
+    Watches translation builds until they reach a terminal state.
+
+    The requests are sent from a thread of the watcher with the auth, JSON codec, retry policy
+    and hooks of `client`. When a build completes, the translations cached by `client` for its
+    engine are dropped, since they came from the previous model. Each watched build holds one connection while its long-poll is
+    pending; at most `max_watches` builds are polled at once, the others as soon as a slot frees
+    up. `on_event` is called from the thread of the watcher and should return quickly, since
+    the polls of the other builds wait for it; an exception raised by it fails the watch.
+    """
+
+    def __init__(
+        self,
+        client: RemoteCaller,
+        max_watches: int = 1000,
+        on_event: Optional[Callable[[BuildEvent], None]] = None,
+    ):
+        self._on_event = on_event
+        self._cache = client.cache
+        self._loop = asyncio.new_event_loop()
+        self._client = AsyncRemoteCaller(
+            url_prefix=client.url_prefix,
+            auth=client.auth,
+            validate=client.validate,
+            json_codec=client.json_codec,
+            retry_policy=client.retry_policy,
+            hooks=client.hooks,
+            max_concurrency=max_watches,
+            max_connections=max_watches,
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="build-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def watch(self, engine_id: str, build_id: str) -> "Future[TranslationBuild]":
+        """
+        Starts watching a build.
+
+        The returned future resolves to the build once it is completed, faulted or canceled.
+        Cancelling the future stops the watch.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The build watcher is closed.")
+            return asyncio.run_coroutine_threadsafe(
+                self._follow(engine_id, build_id), self._loop
+            )
+
+    def wait(
+        self, engine_id: str, build_id: str, timeout: Optional[float] = None
+    ) -> TranslationBuild:
+        """Watches a build and blocks until it finishes (raises TimeoutError after timeout seconds)."""
+        future = self.watch(engine_id, build_id)
+        try:
+            return future.result(timeout)
+        finally:
+            future.cancel()
+
+    async def _follow(self, engine_id: str, build_id: str) -> TranslationBuild:
+        last: Optional[TranslationBuild] = None
+        while True:
+            try:
+                build = await self._client.translation_engines_get_build(
+                    engine_id,
+                    build_id,
+                    min_revision=None if last is None else last.revision + 1,
+                )
+            except aiohttp.ClientResponseError as e:
+                # 408 means the build did not change while the server waited; ask again.
+                if e.status != 408:
+                    raise
+                continue
+            except asyncio.TimeoutError:
+                continue
+
+            if build.state == "Completed" and self._cache is not None:
+                self._cache.invalidate_engine(engine_id)
+            if self._on_event is not None:
+                for kind in build_changes(last, build):
+                    self._on_event(BuildEvent(engine_id, kind, build, last))
+            last = build
+            if build.state in TERMINAL_BUILD_STATES:
+                return build
+
+    async def _shutdown(self) -> None:
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._client.close()
+
+    def close(self) -> None:
+        """Stops all watches; their futures are cancelled."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "BuildWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,234 @@
+"""
+Selection and rate-limited concurrent deletion of data files.
+
+The files to delete are selected from a CSV export of the data_files.files collection, read in
+chunks of the needed columns only, or directly from MongoDB with the filter applied by the
+server. Both yield the ids lazily, so memory use does not grow with the number of files.
+
+Deletes are sent from a bounded thread pool and started at most at the rate of a token
+bucket, so a purge of hundreds of thousands of files runs as fast as the server allows without
+flooding it. A 404 means the file is already gone and counts as deleted. Every processed id is
+appended to a checkpoint file, so an interrupted purge resumes where it stopped.
+"""
+import datetime
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Set
+
+import requests
+from serval_client import RemoteCaller
+
+
+def object_id_bound(created_before: datetime.datetime) -> str:
+    """
+    Returns the smallest ObjectId (as hex) of the documents created at or after the time.
+
+    The first 4 bytes of an ObjectId are its creation time in seconds, so the ids of older
+    documents compare lower, also as hex strings.
+    """
+    return f"{int(created_before.timestamp()):08x}" + "0" * 16
+
+
+def select_files_from_csv(
+    path: str,
+    owner: str,
+    name_pattern: str,
+    created_before: Optional[datetime.datetime] = None,
+    chunksize: int = 500_000,
+) -> Iterator[str]:
+    """
+    Yields the ids of the files in a CSV export of data_files.files that match the filter.
+
+    Only the _id, owner and name columns are parsed, a chunk at a time.
+
+    :param owner: owner of the files, e.g. "<client id>@clients"
+    :param name_pattern: regular expression searched for in the file names
+    :param created_before: only select files created before this time (optional)
+    """
+    import pandas as pd
+
+    bound = object_id_bound(created_before) if created_before is not None else None
+    with pd.read_csv(
+        path, usecols=["_id", "owner", "name"], dtype=str, chunksize=chunksize
+    ) as reader:
+        for chunk in reader:
+            # The owner comparison is cheap and removes most rows before the regex runs.
+            chunk = chunk[chunk["owner"] == owner]
+            mask = chunk["name"].str.contains(name_pattern, regex=True, na=False)
+            if bound is not None:
+                mask &= chunk["_id"] < bound
+            yield from chunk.loc[mask, "_id"].tolist()
+
+
+def select_files_from_mongo(
+    connection_string: str,
+    owner: str,
+    name_pattern: str,
+    created_before: Optional[datetime.datetime] = None,
+    database: str = "prod_serval",
+) -> Iterator[str]:
+    """
+    Yields the ids of the files in data_files.files that match the filter (requires pymongo).
+
+    The filter runs on the server, which uses the index on owner, and only the ids are returned.
+    """
+    import bson
+    import pymongo
+
+    query = {"owner": owner, "name": {"$regex": name_pattern}}
+    if created_before is not None:
+        query["_id"] = {"$lt": bson.ObjectId.from_datetime(created_before)}
+    with pymongo.MongoClient(connection_string) as mongo:
+        files = mongo[database]["data_files.files"]
+        for doc in files.find(query, {"_id": 1}, batch_size=10_000):
+            yield str(doc["_id"])
+
+
+class TokenBucket:
+    """Allows `rate` operations per second on average, with bursts of up to `burst` (thread-safe)."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class Checkpoint:
+    """Append-only file of the ids that have been processed."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.ids: Set[str] = set()
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line is incomplete if the run was killed while writing it.
+                        continue
+                    self.ids.add(entry["id"])
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.ids
+
+    def add(self, id: str, status: str) -> None:
+        with self._lock:
+            self.ids.add(id)
+            self._file.write(json.dumps({"id": id, "status": status}) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class DeletionStats:
+    total: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    already_gone: int = 0
+    failed: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.total} files: {self.skipped} skipped (in checkpoint), {self.deleted} deleted, "
+            f"{self.already_gone} already gone, {self.failed} failed"
+        )
+
+
+def delete_files(
+    client: RemoteCaller,
+    file_ids: Iterable[str],
+    checkpoint: Checkpoint,
+    rate: float = 20,
+    max_in_flight: int = 8,
+    dry_run: bool = False,
+    progress_every: int = 1000,
+) -> DeletionStats:
+    """
+    Deletes the files that are not in the checkpoint yet.
+
+    The session of the client should allow at least `max_in_flight` connections per host. Failed
+    deletes are not checkpointed, so they are tried again by the next run.
+
+    :param rate: maximum number of deletes started per second
+    :param max_in_flight: maximum number of deletes waiting for a response
+    :param dry_run: if True, only the totals are reported and no requests are sent
+    :param progress_every: print the totals after this many processed files
+    """
+    stats = DeletionStats()
+    lock = threading.Lock()
+    bucket = TokenBucket(rate, burst=max_in_flight)
+    # Bounds the queued deletes as well, so the ids can come from a lazy iterable.
+    slots = threading.BoundedSemaphore(max_in_flight * 2)
+
+    def delete(file_id: str) -> str:
+        try:
+            client.data_files_delete(file_id)
+            return "deleted"
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return "already_gone"
+            raise
+
+    def done(file_id: str, future: "Future[str]") -> None:
+        slots.release()
+        error = future.exception()
+        with lock:
+            if error is not None:
+                stats.failed += 1
+            elif future.result() == "deleted":
+                stats.deleted += 1
+            else:
+                stats.already_gone += 1
+            processed = stats.deleted + stats.already_gone + stats.failed
+            if processed % progress_every == 0:
+                print(stats)
+        if error is not None:
+            print(f"Failed to delete file {file_id} because of exception {error}")
+        else:
+            checkpoint.add(file_id, future.result())
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        for file_id in file_ids:
+            stats.total += 1
+            if file_id in checkpoint:
+                stats.skipped += 1
+                continue
+            if dry_run:
+                continue
+            slots.acquire()
+            bucket.acquire()
+            future = executor.submit(delete, file_id)
+            future.add_done_callback(lambda f, file_id=file_id: done(file_id, f))
+    return stats
@@ -0,0 +1,729 @@
+#!/usr/bin/env python3
+"""
+Implements the client for the Serval API.
+
+`RemoteCaller` has the methods of the `RemoteCaller` generated by swagger_to in
+`serval_client_module`, taken over by `serval_client_operations` with their signatures and
+docstrings. Its requests go through a pluggable JSON codec and an optional retry policy, its
+responses are converted with or without checks, and the calls can be reported to metrics hooks.
+Translation results can be cached, uploads and listings are streamed, and segments can be
+translated in batches.
+
+The generated modules are never edited by hand: regenerate them as described in
+generate_client_operations.py. Importing this module replaces the if-chains that the generated
+`from_obj` and `to_jsonable` dispatch on with lookup tables, which the generated converters then
+use for nested values as well.
+"""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import contextlib
+import logging
+import re
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, cast
+
+import requests
+import requests.auth
+import urllib3.filepost
+
+from http.client import HTTPResponse
+
+import serval_client_module
+from serval_client_module import (
+    Pretranslation,
+    SegmentPair,
+    TranslationResult,
+    WordAlignment,
+    WordGraph,
+    pretranslation_from_obj,
+    word_alignment_from_obj,
+)
+from serval_client_operations import OPERATIONS, RemoteCallerOperations
+from serval_client_support import (
+    _JSON_HEADERS,
+    JsonCodec,
+    Operation,
+    RequestMetrics,
+    ResultCache,
+    RetryPolicy,
+    SegmentResult,
+    TrustedConverters,
+    _body_size,
+    _call_many,
+    _content_length,
+    _iter_json_array,
+    _iter_multipart,
+    get_json_codec,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '_', name).lower()
+
+
+def _generated_converters(suffix: str) -> Dict[type, Callable[..., Any]]:
+    """Maps every generated model class to its generated converter, e.g. Corpus to corpus_from_obj."""
+    converters = {}  # type: Dict[type, Callable[..., Any]]
+    for name, value in vars(serval_client_module).items():
+        if isinstance(value, type) and value.__module__ == serval_client_module.__name__:
+            converter = getattr(serval_client_module, _snake_case(name) + suffix, None)
+            if converter is not None:
+                converters[value] = converter
+    return converters
+
+
+# Dispatch tables used by from_obj and to_jsonable, keyed by the expected type.
+_FROM_OBJ_BY_TYPE = _generated_converters('_from_obj')
+_TO_JSONABLE_BY_TYPE = _generated_converters('_to_jsonable')
+
+
+def from_obj(obj: Any, expected: List[type], path: str = '') -> Any:
+    """
+    Checks and converts the given obj along the expected types.
+
+    Behaves like the generated `serval_client_module.from_obj`, but looks the converter of a
+    model class up in a table.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :param path: to the object used for debugging
+    :return: the converted object
+    """
+    if not expected:
+        raise ValueError("`expected` is empty, but at least one type needs to be specified.")
+
+    exp = expected[0]
+
+    if exp == float:
+        if isinstance(obj, int):
+            return float(obj)
+
+        if isinstance(obj, float):
+            return obj
+
+        raise ValueError(
+            'Expected object of type int or float at {!r}, but got {}.'.format(path, type(obj)))
+
+    if exp in [bool, int, str, list, dict]:
+        if not isinstance(obj, exp):
+            raise ValueError(
+                'Expected object of type {} at {!r}, but got {}.'.format(exp, path, type(obj)))
+
+    if exp in [bool, int, float, str]:
+        return obj
+
+    if exp == list:
+        lst = []  # type: List[Any]
+
+        # Resolve the converter of a list of objects once instead of once per element.
+        item_from_obj = _FROM_OBJ_BY_TYPE.get(expected[1]) if len(expected) == 2 else None
+        if item_from_obj is not None:
+            for i, value in enumerate(obj):
+                lst.append(item_from_obj(value, path='{}[{}]'.format(path, i)))
+
+            return lst
+
+        for i, value in enumerate(obj):
+            lst.append(
+                from_obj(value, expected=expected[1:], path='{}[{}]'.format(path, i)))
+
+        return lst
+
+    if exp == dict:
+        adict = dict()  # type: Dict[str, Any]
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    'Expected a key of type str at path {!r}, got: {}'.format(path, type(key)))
+
+            adict[key] = from_obj(value, expected=expected[1:], path='{}[{!r}]'.format(path, key))
+
+        return adict
+
+    from_obj_for_type = _FROM_OBJ_BY_TYPE.get(exp)
+    if from_obj_for_type is not None:
+        return from_obj_for_type(obj, path=path)
+
+    raise ValueError("Unexpected `expected` type: {}".format(exp))
+
+
+def to_jsonable(obj: Any, expected: List[type], path: str = "") -> Any:
+    """
+    Checks and converts the given object along the expected types to a JSON-able representation.
+
+    Behaves like the generated `serval_client_module.to_jsonable`, but looks the converter of a
+    model class up in a table.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :param path: path to the object used for debugging
+    :return: JSON-able representation of the object
+    """
+    if not expected:
+        raise ValueError("`expected` is empty, but at least one type needs to be specified.")
+
+    exp = expected[0]
+    if not isinstance(obj, exp):
+        raise ValueError('Expected object of type {} at path {!r}, but got {}.'.format(
+            exp, path, type(obj)))
+
+    if exp in (bool, int, float, str):
+        return obj
+
+    if exp == list:
+        lst = []  # type: List[Any]
+        for i, value in enumerate(obj):
+            lst.append(
+                to_jsonable(value, expected=expected[1:], path='{}[{}]'.format(path, i)))
+
+        return lst
+
+    if exp == dict:
+        adict = dict()  # type: Dict[str, Any]
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    'Expected a key of type str at path {!r}, got: {}'.format(path, type(key)))
+
+            adict[key] = to_jsonable(
+                value,
+                expected=expected[1:],
+                path='{}[{!r}]'.format(path, key))
+
+        return adict
+
+    to_jsonable_for_type = _TO_JSONABLE_BY_TYPE.get(exp)
+    if to_jsonable_for_type is not None:
+        return to_jsonable_for_type(obj, path=path)
+
+    raise ValueError("Unexpected `expected` type: {}".format(exp))
+
+
+# The generated converters look up from_obj and to_jsonable in their module for nested values.
+serval_client_module.from_obj = from_obj
+serval_client_module.to_jsonable = to_jsonable
+
+
+_TRUSTED_CONVERTERS = TrustedConverters(_FROM_OBJ_BY_TYPE)
+
+
+def trusted_from_obj(obj: Any, expected: List[type]) -> Any:
+    """
+    Converts the parsed JSON along the expected types like `from_obj`, but without checking it.
+
+    Meant for responses of a trusted server: malformed input raises arbitrary errors (or is
+    accepted) instead of a ValueError with the path of the offending value.
+
+    :param obj: to be converted
+    :param expected: list of types representing the (nested) structure
+    :return: the converted object
+    """
+    return _TRUSTED_CONVERTERS.from_obj(obj, expected)
+
+
+class _StreamedResponse(serval_client_module._WrappedResponse):
+    """Wraps a streamed `requests.Response` like the generated `_WrappedResponse`."""
+
+    # The reading methods are defined on urllib3.HTTPResponse and hence are not routed through
+    # __getattr__. Running them on the wrapper would release the connection only on the wrapper,
+    # and the later close would then close a connection that is back in the pool.
+    def read(self, *args, **kwargs):
+        return self._response.raw.read(*args, **kwargs)
+
+    def read1(self, *args, **kwargs):
+        return self._response.raw.read1(*args, **kwargs)
+
+    def readinto(self, b):
+        return self._response.raw.readinto(b)
+
+    def stream(self, *args, **kwargs):
+        return self._response.raw.stream(*args, **kwargs)
+
+    def __iter__(self):
+        return iter(self._response.raw)
+
+
+# POST requests that only read, and hence may be retried like GET requests.
+_READ_ONLY_OPERATIONS = frozenset([
+    'data_files_download',
+    'translation_engines_translate',
+    'translation_engines_translate_n',
+    'translation_engines_get_word_graph',
+    'word_alignment_engines_align',
+])
+
+
+def _streamed(name: str, operation: Operation) -> Operation:
+    """Describes a method that streams the listing of the operation."""
+    return Operation(name, operation.http_method, operation.url_template, operation.expected[1:], stream=True)
+
+
+_ITER_ALL_PRETRANSLATIONS = _streamed(
+    'translation_engines_iter_all_pretranslations',
+    OPERATIONS['translation_engines_get_all_pretranslations'])
+_ITER_ALL_WORD_ALIGNMENTS = _streamed(
+    'word_alignment_engines_iter_all_word_alignments',
+    OPERATIONS['word_alignment_engines_get_all_word_alignments'])
+
+
+class _CallerCore:
+    """Handles the requests and responses of the remote calls, whatever the transport."""
+
+    def __init__(
+            self,
+            url_prefix: str,
+            auth: Optional[requests.auth.AuthBase],
+            cache: Optional[ResultCache],
+            validate: bool,
+            json_codec: Optional[JsonCodec],
+            retry_policy: Optional[RetryPolicy],
+            hooks: Optional[Iterable[Callable[[RequestMetrics], None]]]) -> None:
+        self.url_prefix = url_prefix
+        self.auth = auth
+        # Opt-in cache of translate, translate_n and get_word_graph results.
+        self.cache = cache
+        # If False, responses are trusted and converted without checks, see trusted_from_obj.
+        self.validate = validate
+        # Encodes request bodies and decodes responses; the fastest installed codec by default.
+        self.json_codec = json_codec if json_codec is not None else get_json_codec()
+        # If set, failed idempotent requests are retried and failing hosts are cut off.
+        self.retry_policy = retry_policy
+        # Called with the RequestMetrics of every call, once it has returned.
+        self.hooks = list(hooks) if hooks is not None else []
+
+    def _to_jsonable(self, obj: Any, expected: List[type]) -> Any:
+        return to_jsonable(obj, expected=expected)
+
+    def _idempotent(self, operation: Operation) -> Optional[bool]:
+        """Tells the retry policy whether the request may be repeated, or None to go by its method."""
+        return True if operation.name in _READ_ONLY_OPERATIONS else None
+
+    def _metrics(self, operation: Operation) -> Optional[RequestMetrics]:
+        """Starts the metrics of a call, or returns None if there is nobody to report them to."""
+        if not self.hooks:
+            return None
+        return RequestMetrics(
+            method=operation.name,
+            url_template=operation.url_template,
+            http_method=operation.http_method)
+
+    def _convert(self, obj: Any, expected: List[type], metrics: Optional[RequestMetrics]) -> Any:
+        """Converts the parsed response, checking it unless the caller trusts the server."""
+        began = time.perf_counter()
+        try:
+            if self.validate:
+                return from_obj(obj=obj, expected=expected)
+            return trusted_from_obj(obj, expected)
+        finally:
+            if metrics is not None:
+                metrics.deserialize += time.perf_counter() - began
+
+    def _convert_item(
+            self,
+            obj: Any,
+            index: int,
+            operation: Operation,
+            item_from_obj: Callable[..., Any]) -> Any:
+        """Converts an item of a streamed listing, see `_convert`."""
+        if self.validate:
+            return item_from_obj(obj, path='[{}]'.format(index))
+        return trusted_from_obj(obj, operation.expected)
+
+    def _emit(self, metrics: Optional[RequestMetrics], latency: float, error: Optional[BaseException]) -> None:
+        if metrics is None:
+            return
+        metrics.latency = latency
+        if metrics.error is None and error is not None:
+            metrics.error = type(error).__name__
+        for hook in self.hooks:
+            # A failing hook must not fail the call it reports on.
+            try:
+                hook(metrics)
+            except Exception:
+                logger.exception('The metrics hook {!r} failed.'.format(hook))
+
+
+class RemoteCaller(_CallerCore, RemoteCallerOperations):
+    """Executes the remote calls to the server."""
+
+    def __init__(
+        self,
+        url_prefix: str,
+        auth: Optional[requests.auth.AuthBase] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[ResultCache] = None,
+        validate: bool = True,
+        json_codec: Optional[JsonCodec] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hooks: Optional[Iterable[Callable[[RequestMetrics], None]]] = None) -> None:
+        """
+        :param url_prefix: base URL of the Serval instance
+        :param auth: `requests` auth object (e.g. `ServalBearerAuth`) of the created session
+        :param session: externally managed session; if None, one is created
+        :param cache: cache of translation results and word graphs, if any
+        :param validate: whether responses are checked while they are converted
+        :param json_codec: codec of request and response bodies; if None, the fastest installed one
+        :param retry_policy: policy to retry failed requests with, if any
+        :param hooks: called with the RequestMetrics of every call
+        """
+        super().__init__(url_prefix, auth, cache, validate, json_codec, retry_policy, hooks)
+        self.session = session
+
+        if not self.session:
+            self.session = requests.Session()
+            self.session.auth = self.auth
+
+    def _send(
+            self,
+            operation: Operation,
+            url: str,
+            on_attempt: Optional[Callable[[], None]] = None,
+            **kwargs: Any) -> requests.Response:
+        if self.retry_policy is None:
+            if on_attempt is not None:
+                on_attempt()
+            return self.session.request(method=operation.http_method, url=url, **kwargs)
+        return self.retry_policy.send(
+            self.session,
+            operation.http_method,
+            url,
+            idempotent=self._idempotent(operation),
+            on_attempt=on_attempt,
+            **kwargs)
+
+    def _request(
+            self,
+            operation: Operation,
+            url: str,
+            metrics: Optional[RequestMetrics],
+            params: Optional[Dict[str, str]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, str]] = None,
+            files: Optional[Dict[str, BinaryIO]] = None,
+            stream: bool = False) -> requests.Response:
+        kwargs = {}  # type: Dict[str, Any]
+        if params is not None:
+            kwargs['params'] = params
+        if json is not None:
+            kwargs['data'] = self.json_codec.dumps(json)
+            kwargs['headers'] = _JSON_HEADERS
+        elif files is not None:
+            boundary = urllib3.filepost.choose_boundary()
+            kwargs['data'] = _iter_multipart(data or {}, files, boundary)
+            kwargs['headers'] = {'Content-Type': 'multipart/form-data; boundary=' + boundary}
+        elif data is not None:
+            kwargs['data'] = data
+        if stream:
+            kwargs['stream'] = True
+
+        if metrics is None:
+            return self._send(operation, url, **kwargs)
+
+        def count_attempt() -> None:
+            metrics.attempts += 1
+
+        metrics.bytes_out = _body_size(kwargs.get('data'))
+        began = time.perf_counter()
+        try:
+            resp = self._send(operation, url, on_attempt=count_attempt, **kwargs)
+        except Exception as e:
+            metrics.ttfb = time.perf_counter() - began
+            metrics.error = type(e).__name__
+            raise
+        metrics.status = resp.status_code
+        metrics.ttfb = resp.elapsed.total_seconds()
+        metrics.bytes_out = _body_size(resp.request.body)
+        metrics.bytes_in = _content_length(resp) if stream else len(resp.content)
+        return resp
+
+    def _call(
+            self,
+            operation: Operation,
+            url: str,
+            params: Optional[Dict[str, str]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, str]] = None,
+            files: Optional[Dict[str, BinaryIO]] = None) -> Any:
+        metrics = self._metrics(operation)
+        began = time.perf_counter()
+        error = None  # type: Optional[BaseException]
+        try:
+            resp = self._request(operation, url, metrics, params, json, data, files, stream=operation.stream)
+
+            if operation.stream:
+                resp.raise_for_status()
+                return cast(HTTPResponse, _StreamedResponse(resp))
+
+            with contextlib.closing(resp):
+                resp.raise_for_status()
+                if operation.expected is None:
+                    return resp.content
+                return self._convert(self.json_codec.loads(resp.content), operation.expected, metrics)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._emit(metrics, time.perf_counter() - began, error)
+
+    def _iter_items(
+            self,
+            operation: Operation,
+            url: str,
+            params: Dict[str, str],
+            item_from_obj: Callable[..., Any],
+            chunk_size: int) -> Iterator[Any]:
+        """Yields the items of the JSON array in the response body as they are received."""
+        metrics = self._metrics(operation)
+        # Only the time spent producing items counts, not the time the consumer holds on to them.
+        elapsed = 0.0
+        began = time.perf_counter()  # type: Optional[float]
+        error = None  # type: Optional[BaseException]
+        try:
+            resp = self._request(operation, url, metrics, params=params, stream=True)
+
+            with contextlib.closing(resp):
+                resp.raise_for_status()
+                for i, obj in enumerate(_iter_json_array(resp, chunk_size)):
+                    item = self._convert_item(obj, i, operation, item_from_obj)
+                    elapsed += time.perf_counter() - began
+                    began = None
+                    yield item
+                    began = time.perf_counter()
+        except GeneratorExit:
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if began is not None:
+                elapsed += time.perf_counter() - began
+            self._emit(metrics, elapsed, error)
+
+    def _cached(self, id: str, key: Tuple[Any, ...], call: Callable[[], Any]) -> Any:
+        """Returns the result of a call on the engine from the cache, or makes and caches the call."""
+        if self.cache is None:
+            return call()
+
+        version = self.cache.engine_version(id, lambda: self.translation_engines_get(id).model_revision)
+        cache_key = (id,) + version + key
+        found, cached = self.cache.get(cache_key)
+        if found:
+            return cached
+
+        result = call()
+        self.cache.put(cache_key, result)
+        return result
+
+    def translation_engines_translate(
+            self,
+            id: str,
+            segment: str) -> 'TranslationResult':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate.
+
+        The result is served from and stored in the cache of the caller, if any.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The translation result
+        """
+        call = super().translation_engines_translate
+        return self._cached(id, ('translate', segment), lambda: call(id, segment))
+
+    def translation_engines_translate_n(
+            self,
+            id: str,
+            n: int,
+            segment: str) -> List['TranslationResult']:
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate/{n}.
+
+        The results are served from and stored in the cache of the caller, if any.
+
+        :param id: The translation engine id
+        :param n: The number of translations to generate
+        :param segment: The source segment
+
+        :return: The translation results
+        """
+        call = super().translation_engines_translate_n
+        return self._cached(id, ('translate_n', n, segment), lambda: call(id, n, segment))
+
+    def translation_engines_get_word_graph(
+            self,
+            id: str,
+            segment: str) -> 'WordGraph':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/get-word-graph.
+
+        The result is served from and stored in the cache of the caller, if any.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The word graph result
+        """
+        call = super().translation_engines_get_word_graph
+        return self._cached(id, ('get_word_graph', segment), lambda: call(id, segment))
+
+    def translation_engines_train_segment(
+            self,
+            id: str,
+            segment_pair: 'SegmentPair') -> bytes:
+        """
+        Train the engine on a segment pair, see the generated method for details.
+
+        The cached results of the engine are dropped, since the engine learned from the segment.
+
+        :param id: The translation engine id
+        :param segment_pair: The segment pair
+
+        :return: The engine was trained successfully
+        """
+        result = super().translation_engines_train_segment(id, segment_pair)
+        if self.cache is not None:
+            self.cache.invalidate_engine(id)
+        return result
+
+    def translation_engines_translate_many(
+            self,
+            id: str,
+            segments: Sequence[str],
+            concurrency: int = 8) -> List[SegmentResult]:
+        """
+        Translate many segments, sending up to `concurrency` requests at a time.
+
+        The requests share the keep-alive connections of the session, so its connection pool
+        should hold at least `concurrency` connections. A failed segment does not stop the others;
+        its error is recorded in its result.
+
+        :param id: The translation engine id
+        :param segments: The source segments
+        :param concurrency: The maximum number of requests in flight
+
+        :return: The translation result of each segment, in input order
+        """
+        return _call_many(
+            lambda segment: self.translation_engines_translate(id, segment),
+            segments,
+            concurrency)
+
+    def translation_engines_translate_n_many(
+            self,
+            id: str,
+            n: int,
+            segments: Sequence[str],
+            concurrency: int = 8) -> List[SegmentResult]:
+        """
+        Generate `n` translations of many segments, sending up to `concurrency` requests at a time.
+
+        See `translation_engines_translate_many` for details.
+
+        :param id: The translation engine id
+        :param n: The number of translations to generate
+        :param segments: The source segments
+        :param concurrency: The maximum number of requests in flight
+
+        :return: The translation results of each segment, in input order
+        """
+        return _call_many(
+            lambda segment: self.translation_engines_translate_n(id, n, segment),
+            segments,
+            concurrency)
+
+    def translation_engines_get_word_graph_many(
+            self,
+            id: str,
+            segments: Sequence[str],
+            concurrency: int = 8) -> List[SegmentResult]:
+        """
+        Get the word graphs of many segments, sending up to `concurrency` requests at a time.
+
+        See `translation_engines_translate_many` for details.
+
+        :param id: The translation engine id
+        :param segments: The source segments
+        :param concurrency: The maximum number of requests in flight
+
+        :return: The word graph result of each segment, in input order
+        """
+        return _call_many(
+            lambda segment: self.translation_engines_get_word_graph(id, segment),
+            segments,
+            concurrency)
+
+    def translation_engines_iter_all_pretranslations(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: Optional[str] = None,
+            chunk_size: int = 64 * 1024) -> Iterator['Pretranslation']:
+        """
+        Streams the pretranslations of translation_engines_get_all_pretranslations.
+
+        The response array is parsed incrementally and each pretranslation is yielded as soon as
+        it has been received, so memory use does not grow with the size of the corpus.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id (optional)
+        :param chunk_size: number of bytes read from the response at a time
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._iter_items(
+            _ITER_ALL_PRETRANSLATIONS, url, params, pretranslation_from_obj, chunk_size)
+
+    def word_alignment_engines_iter_all_word_alignments(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: Optional[str] = None,
+            chunk_size: int = 64 * 1024) -> Iterator['WordAlignment']:
+        """
+        Streams the word alignments of word_alignment_engines_get_all_word_alignments.
+
+        The response array is parsed incrementally and each word alignment is yielded as soon as
+        it has been received, so memory use does not grow with the size of the corpus.
+
+        :param id: The engine id
+        :param corpus_id: The corpus id
+        :param text_id: The text id (optional)
+        :param chunk_size: number of bytes read from the response at a time
+
+        :return: The word alignments
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/word-alignments'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._iter_items(
+            _ITER_ALL_WORD_ALIGNMENTS, url, params, word_alignment_from_obj, chunk_size)
+
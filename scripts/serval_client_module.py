@@ -3048,6 +3048,10 @@ def translation_engine_update_config_to_jsonable(
 
 
 class TranslationResult:
+    __slots__ = (
+        'translation', 'source_tokens', 'target_tokens', 'confidences', 'sources', 'alignment',
+        'phrases')
+
     def __init__(
             self,
             translation: str,
@@ -3202,6 +3206,8 @@ def translation_result_to_jsonable(
 
 
 class AlignedWordPair:
+    __slots__ = ('source_index', 'target_index', 'score')
+
     def __init__(
             self,
             source_index: int,
@@ -3294,6 +3300,8 @@ def aligned_word_pair_to_jsonable(
 
 
 class Phrase:
+    __slots__ = ('source_segment_start', 'source_segment_end', 'target_segment_cut')
+
     def __init__(
             self,
             source_segment_start: int,
@@ -3491,6 +3499,10 @@ def word_graph_to_jsonable(
 
 
 class WordGraphArc:
+    __slots__ = (
+        'prev_state', 'next_state', 'score', 'target_tokens', 'confidences',
+        'source_segment_start', 'source_segment_end', 'alignment', 'sources')
+
     def __init__(
             self,
             prev_state: int,
@@ -4288,6 +4300,8 @@ def translation_corpus_update_config_to_jsonable(
 
 
 class Pretranslation:
+    __slots__ = ('text_id', 'source_refs', 'target_refs', 'translation', 'refs')
+
     def __init__(
             self,
             text_id: str,
@@ -6468,6 +6482,10 @@ def word_alignment_parallel_corpus_update_config_to_jsonable(
 
 
 class WordAlignment:
+    __slots__ = (
+        'text_id', 'source_refs', 'target_refs', 'source_tokens', 'target_tokens', 'alignment',
+        'refs')
+
     def __init__(
             self,
             text_id: str,
@@ -7638,15 +7656,28 @@ class RemoteCaller:
             resp.raise_for_status()
             return resp.content
 
-    def data_files_get_all(self) -> List['DataFile']:
+    def data_files_get_all(
+            self,
+            format: Optional[str] = None) -> List['DataFile']:
         """
         Send a get request to /api/v1/files.
 
+        :param format: Only return files of this format (optional).
+
         :return: A list of all files owned by the client
         """
         url = self.url_prefix + '/api/v1/files'
 
-        resp = self.session.request(method='get', url=url)
+        params = {}  # type: Dict[str, str]
+
+        if format is not None:
+            params['format'] = format
+
+        resp = self.session.request(
+            method='get',
+            url=url,
+            params=params,
+        )
 
         with contextlib.closing(resp):
             resp.raise_for_status()
@@ -0,0 +1,4395 @@
+#!/usr/bin/env python3
+# Automatically generated file by generate_client_operations.py. DO NOT EDIT OR APPEND ANYTHING!
+"""
+Implements the remote calls of the Serval API on top of the transport of a client class.
+
+The methods mirror `serval_client_module.RemoteCaller`, but hand the request to `self._call`,
+which sends it and converts the response as described by the `Operation`.
+"""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import json
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from serval_client_module import (
+    Corpus,
+    CorpusConfig,
+    CorpusFileConfig,
+    DataFile,
+    DeploymentInfo,
+    HealthReport,
+    LanguageInfo,
+    ModelDownloadURL,
+    Pretranslation,
+    Queue,
+    SegmentPair,
+    TranslationBuild,
+    TranslationBuildConfig,
+    TranslationCorpus,
+    TranslationCorpusConfig,
+    TranslationCorpusUpdateConfig,
+    TranslationEngine,
+    TranslationEngineConfig,
+    TranslationEngineUpdateConfig,
+    TranslationParallelCorpus,
+    TranslationParallelCorpusConfig,
+    TranslationParallelCorpusUpdateConfig,
+    TranslationResult,
+    Webhook,
+    WebhookConfig,
+    WordAlignment,
+    WordAlignmentBuild,
+    WordAlignmentBuildConfig,
+    WordAlignmentEngine,
+    WordAlignmentEngineConfig,
+    WordAlignmentParallelCorpus,
+    WordAlignmentParallelCorpusConfig,
+    WordAlignmentParallelCorpusUpdateConfig,
+    WordAlignmentRequest,
+    WordAlignmentResult,
+    WordGraph,
+)
+from serval_client_support import Operation
+
+
+# The remote calls by method name.
+OPERATIONS = {
+    'status_get_health': Operation(
+        name='status_get_health',
+        http_method='GET',
+        url_template='/api/v1/status/health',
+        expected=[HealthReport]),
+    'status_get_ping': Operation(
+        name='status_get_ping',
+        http_method='GET',
+        url_template='/api/v1/status/ping',
+        expected=[HealthReport]),
+    'status_get_deployment_info': Operation(
+        name='status_get_deployment_info',
+        http_method='GET',
+        url_template='/api/v1/status/deployment-info',
+        expected=[DeploymentInfo]),
+    'corpora_get_all': Operation(
+        name='corpora_get_all',
+        http_method='GET',
+        url_template='/api/v1/corpora',
+        expected=[list, Corpus]),
+    'corpora_create': Operation(
+        name='corpora_create',
+        http_method='POST',
+        url_template='/api/v1/corpora',
+        expected=None),
+    'corpora_get': Operation(
+        name='corpora_get',
+        http_method='GET',
+        url_template='/api/v1/corpora/{id}',
+        expected=[Corpus]),
+    'corpora_update': Operation(
+        name='corpora_update',
+        http_method='PATCH',
+        url_template='/api/v1/corpora/{id}',
+        expected=[Corpus]),
+    'corpora_delete': Operation(
+        name='corpora_delete',
+        http_method='DELETE',
+        url_template='/api/v1/corpora/{id}',
+        expected=None),
+    'data_files_get_all': Operation(
+        name='data_files_get_all',
+        http_method='GET',
+        url_template='/api/v1/files',
+        expected=[list, DataFile]),
+    'data_files_create': Operation(
+        name='data_files_create',
+        http_method='POST',
+        url_template='/api/v1/files',
+        expected=None),
+    'data_files_get': Operation(
+        name='data_files_get',
+        http_method='GET',
+        url_template='/api/v1/files/{id}',
+        expected=[DataFile]),
+    'data_files_update': Operation(
+        name='data_files_update',
+        http_method='PATCH',
+        url_template='/api/v1/files/{id}',
+        expected=[DataFile]),
+    'data_files_delete': Operation(
+        name='data_files_delete',
+        http_method='DELETE',
+        url_template='/api/v1/files/{id}',
+        expected=None),
+    'data_files_download': Operation(
+        name='data_files_download',
+        http_method='POST',
+        url_template='/api/v1/files/{id}/contents',
+        expected=None,
+        stream=True),
+    'translation_builds_get_all_builds_created_after': Operation(
+        name='translation_builds_get_all_builds_created_after',
+        http_method='GET',
+        url_template='/api/v1/translation/builds',
+        expected=[list, TranslationBuild]),
+    'translation_engines_get_all': Operation(
+        name='translation_engines_get_all',
+        http_method='GET',
+        url_template='/api/v1/translation/engines',
+        expected=[list, TranslationEngine]),
+    'translation_engines_create': Operation(
+        name='translation_engines_create',
+        http_method='POST',
+        url_template='/api/v1/translation/engines',
+        expected=None),
+    'translation_engines_get': Operation(
+        name='translation_engines_get',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}',
+        expected=[TranslationEngine]),
+    'translation_engines_delete': Operation(
+        name='translation_engines_delete',
+        http_method='DELETE',
+        url_template='/api/v1/translation/engines/{id}',
+        expected=None),
+    'translation_engines_update': Operation(
+        name='translation_engines_update',
+        http_method='PATCH',
+        url_template='/api/v1/translation/engines/{id}',
+        expected=None),
+    'translation_engines_translate': Operation(
+        name='translation_engines_translate',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/translate',
+        expected=[TranslationResult]),
+    'translation_engines_translate_n': Operation(
+        name='translation_engines_translate_n',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/translate/{n}',
+        expected=[list, TranslationResult]),
+    'translation_engines_get_word_graph': Operation(
+        name='translation_engines_get_word_graph',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/get-word-graph',
+        expected=[WordGraph]),
+    'translation_engines_train_segment': Operation(
+        name='translation_engines_train_segment',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/train-segment',
+        expected=None),
+    'translation_engines_add_corpus': Operation(
+        name='translation_engines_add_corpus',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/corpora',
+        expected=None),
+    'translation_engines_get_all_corpora': Operation(
+        name='translation_engines_get_all_corpora',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/corpora',
+        expected=[list, TranslationCorpus]),
+    'translation_engines_update_corpus': Operation(
+        name='translation_engines_update_corpus',
+        http_method='PATCH',
+        url_template='/api/v1/translation/engines/{id}/corpora/{corpusId}',
+        expected=[TranslationCorpus]),
+    'translation_engines_get_corpus': Operation(
+        name='translation_engines_get_corpus',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/corpora/{corpusId}',
+        expected=[TranslationCorpus]),
+    'translation_engines_delete_corpus': Operation(
+        name='translation_engines_delete_corpus',
+        http_method='DELETE',
+        url_template='/api/v1/translation/engines/{id}/corpora/{corpusId}',
+        expected=None),
+    'translation_engines_get_all_corpus_pretranslations': Operation(
+        name='translation_engines_get_all_corpus_pretranslations',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/corpora/{corpusId}/pretranslations',
+        expected=[list, Pretranslation]),
+    'translation_engines_get_corpus_pretranslations_by_text_id': Operation(
+        name='translation_engines_get_corpus_pretranslations_by_text_id',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/corpora/{corpusId}/pretranslations/{textId}',
+        expected=[list, Pretranslation]),
+    'translation_engines_get_corpus_pretranslated_usfm': Operation(
+        name='translation_engines_get_corpus_pretranslated_usfm',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/corpora/{corpusId}/pretranslations/{textId}/usfm',
+        expected=[str]),
+    'translation_engines_add_parallel_corpus': Operation(
+        name='translation_engines_add_parallel_corpus',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora',
+        expected=None),
+    'translation_engines_get_all_parallel_corpora': Operation(
+        name='translation_engines_get_all_parallel_corpora',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora',
+        expected=[list, TranslationParallelCorpus]),
+    'translation_engines_update_parallel_corpus': Operation(
+        name='translation_engines_update_parallel_corpus',
+        http_method='PATCH',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}',
+        expected=[TranslationParallelCorpus]),
+    'translation_engines_get_parallel_corpus': Operation(
+        name='translation_engines_get_parallel_corpus',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}',
+        expected=[TranslationParallelCorpus]),
+    'translation_engines_delete_parallel_corpus': Operation(
+        name='translation_engines_delete_parallel_corpus',
+        http_method='DELETE',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}',
+        expected=None),
+    'translation_engines_get_all_pretranslations': Operation(
+        name='translation_engines_get_all_pretranslations',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}/pretranslations',
+        expected=[list, Pretranslation]),
+    'translation_engines_get_pretranslations_by_text_id': Operation(
+        name='translation_engines_get_pretranslations_by_text_id',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}/pretranslations/{textId}',
+        expected=[list, Pretranslation]),
+    'translation_engines_get_pretranslated_usfm': Operation(
+        name='translation_engines_get_pretranslated_usfm',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}/pretranslations/{textId}/usfm',
+        expected=[str]),
+    'translation_engines_get_all_builds': Operation(
+        name='translation_engines_get_all_builds',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/builds',
+        expected=[list, TranslationBuild]),
+    'translation_engines_start_build': Operation(
+        name='translation_engines_start_build',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/builds',
+        expected=None),
+    'translation_engines_get_build': Operation(
+        name='translation_engines_get_build',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/builds/{buildId}',
+        expected=[TranslationBuild]),
+    'translation_engines_get_current_build': Operation(
+        name='translation_engines_get_current_build',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/current-build',
+        expected=[TranslationBuild]),
+    'translation_engines_cancel_build': Operation(
+        name='translation_engines_cancel_build',
+        http_method='POST',
+        url_template='/api/v1/translation/engines/{id}/current-build/cancel',
+        expected=[TranslationBuild]),
+    'translation_engines_get_model_download_url': Operation(
+        name='translation_engines_get_model_download_url',
+        http_method='GET',
+        url_template='/api/v1/translation/engines/{id}/model-download-url',
+        expected=[ModelDownloadURL]),
+    'translation_engine_types_get_queue': Operation(
+        name='translation_engine_types_get_queue',
+        http_method='GET',
+        url_template='/api/v1/translation/engine-types/{engineType}/queues',
+        expected=[Queue]),
+    'translation_engine_types_get_language_info': Operation(
+        name='translation_engine_types_get_language_info',
+        http_method='GET',
+        url_template='/api/v1/translation/engine-types/{engineType}/languages/{language}',
+        expected=[LanguageInfo]),
+    'webhooks_get_all': Operation(
+        name='webhooks_get_all',
+        http_method='GET',
+        url_template='/api/v1/hooks',
+        expected=[list, Webhook]),
+    'webhooks_create': Operation(
+        name='webhooks_create',
+        http_method='POST',
+        url_template='/api/v1/hooks',
+        expected=None),
+    'webhooks_get': Operation(
+        name='webhooks_get',
+        http_method='GET',
+        url_template='/api/v1/hooks/{id}',
+        expected=[Webhook]),
+    'webhooks_delete': Operation(
+        name='webhooks_delete',
+        http_method='DELETE',
+        url_template='/api/v1/hooks/{id}',
+        expected=None),
+    'word_alignment_engines_get_all': Operation(
+        name='word_alignment_engines_get_all',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines',
+        expected=[list, WordAlignmentEngine]),
+    'word_alignment_engines_create': Operation(
+        name='word_alignment_engines_create',
+        http_method='POST',
+        url_template='/api/v1/word-alignment/engines',
+        expected=None),
+    'word_alignment_engines_get': Operation(
+        name='word_alignment_engines_get',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}',
+        expected=[WordAlignmentEngine]),
+    'word_alignment_engines_delete': Operation(
+        name='word_alignment_engines_delete',
+        http_method='DELETE',
+        url_template='/api/v1/word-alignment/engines/{id}',
+        expected=None),
+    'word_alignment_engines_align': Operation(
+        name='word_alignment_engines_align',
+        http_method='POST',
+        url_template='/api/v1/word-alignment/engines/{id}/align',
+        expected=[WordAlignmentResult]),
+    'word_alignment_engines_add_parallel_corpus': Operation(
+        name='word_alignment_engines_add_parallel_corpus',
+        http_method='POST',
+        url_template='/api/v1/word-alignment/engines/{id}/parallel-corpora',
+        expected=None),
+    'word_alignment_engines_get_all_parallel_corpora': Operation(
+        name='word_alignment_engines_get_all_parallel_corpora',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}/parallel-corpora',
+        expected=[list, WordAlignmentParallelCorpus]),
+    'word_alignment_engines_update_parallel_corpus': Operation(
+        name='word_alignment_engines_update_parallel_corpus',
+        http_method='PATCH',
+        url_template='/api/v1/word-alignment/engines/{id}/parallel-corpora/{parallelCorpusId}',
+        expected=[WordAlignmentParallelCorpus]),
+    'word_alignment_engines_get_parallel_corpus': Operation(
+        name='word_alignment_engines_get_parallel_corpus',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}/parallel-corpora/{parallelCorpusId}',
+        expected=[WordAlignmentParallelCorpus]),
+    'word_alignment_engines_delete_parallel_corpus': Operation(
+        name='word_alignment_engines_delete_parallel_corpus',
+        http_method='DELETE',
+        url_template='/api/v1/word-alignment/engines/{id}/parallel-corpora/{parallelCorpusId}',
+        expected=None),
+    'word_alignment_engines_get_all_word_alignments': Operation(
+        name='word_alignment_engines_get_all_word_alignments',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}/corpora/{corpusId}/word-alignments',
+        expected=[list, WordAlignment]),
+    'word_alignment_engines_get_all_builds': Operation(
+        name='word_alignment_engines_get_all_builds',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}/builds',
+        expected=[list, WordAlignmentBuild]),
+    'word_alignment_engines_start_build': Operation(
+        name='word_alignment_engines_start_build',
+        http_method='POST',
+        url_template='/api/v1/word-alignment/engines/{id}/builds',
+        expected=None),
+    'word_alignment_engines_get_build': Operation(
+        name='word_alignment_engines_get_build',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}/builds/{buildId}',
+        expected=[WordAlignmentBuild]),
+    'word_alignment_engines_get_current_build': Operation(
+        name='word_alignment_engines_get_current_build',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engines/{id}/current-build',
+        expected=[WordAlignmentBuild]),
+    'word_alignment_engines_cancel_build': Operation(
+        name='word_alignment_engines_cancel_build',
+        http_method='POST',
+        url_template='/api/v1/word-alignment/engines/{id}/current-build/cancel',
+        expected=[WordAlignmentBuild]),
+    'word_alignment_engine_types_get_queue': Operation(
+        name='word_alignment_engine_types_get_queue',
+        http_method='GET',
+        url_template='/api/v1/word-alignment/engine-types/{engineType}/queues',
+        expected=[Queue]),
+}  # type: Dict[str, Operation]
+
+
+class RemoteCallerOperations:
+    """
+    Remote calls of the Serval API.
+
+    The client class provides `_to_jsonable(obj, expected)`, which converts request bodies, and
+    `_call(operation, url, params=None, json=None, data=None, files=None)`, which sends the
+    request and returns the converted response.
+    """
+
+    def _call(
+            self,
+            operation: Operation,
+            url: str,
+            params: Optional[Dict[str, str]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, str]] = None,
+            files: Optional[Dict[str, BinaryIO]] = None) -> Any:
+        raise NotImplementedError()
+
+    def _to_jsonable(self, obj: Any, expected: List[type]) -> Any:
+        raise NotImplementedError()
+
+    def status_get_health(self) -> 'HealthReport':
+        """
+        Provides an indication about the health of the API
+
+        :return: The API health status
+        """
+        url = self.url_prefix + '/api/v1/status/health'
+
+        return self._call(
+            OPERATIONS['status_get_health'],
+            url,
+        )
+
+    def status_get_ping(self) -> 'HealthReport':
+        """
+        Provides an indication about the health of the API
+
+        :return: The API health status
+        """
+        url = self.url_prefix + '/api/v1/status/ping'
+
+        return self._call(
+            OPERATIONS['status_get_ping'],
+            url,
+        )
+
+    def status_get_deployment_info(self) -> 'DeploymentInfo':
+        """
+        Provides the version of the application
+
+        :return: Application Version
+        """
+        url = self.url_prefix + '/api/v1/status/deployment-info'
+
+        return self._call(
+            OPERATIONS['status_get_deployment_info'],
+            url,
+        )
+
+    def corpora_get_all(self) -> List['Corpus']:
+        """
+        Send a get request to /api/v1/corpora.
+
+        :return: A list of all corpora owned by the client
+        """
+        url = self.url_prefix + '/api/v1/corpora'
+
+        return self._call(
+            OPERATIONS['corpora_get_all'],
+            url,
+        )
+
+    def corpora_create(
+            self,
+            corpus_config: 'CorpusConfig') -> bytes:
+        """
+        Send a post request to /api/v1/corpora.
+
+        :param corpus_config:
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/corpora'
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[CorpusConfig])
+
+        return self._call(
+            OPERATIONS['corpora_create'],
+            url,
+            json=data,
+        )
+
+    def corpora_get(
+            self,
+            id: str) -> 'Corpus':
+        """
+        Send a get request to /api/v1/corpora/{id}.
+
+        :param id: The unique identifier for the corpus
+
+        :return: The corpus exists
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/corpora/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['corpora_get'],
+            url,
+        )
+
+    def corpora_update(
+            self,
+            id: str,
+            files: List['CorpusFileConfig']) -> 'Corpus':
+        """
+        Send a patch request to /api/v1/corpora/{id}.
+
+        :param id: The unique identifier for the corpus
+        :param files: Tuples of the ids of the new corpus files and the associated text ids
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/corpora/',
+            str(id)])
+
+        data = self._to_jsonable(
+            files,
+            expected=[list, CorpusFileConfig])
+
+        return self._call(
+            OPERATIONS['corpora_update'],
+            url,
+            json=data,
+        )
+
+    def corpora_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/corpora/{id}.
+
+        :param id: The unique identifier for the corpus
+
+        :return: The corpus was deleted successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/corpora/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['corpora_delete'],
+            url,
+        )
+
+    def data_files_get_all(
+            self,
+            format: Optional[str] = None) -> List['DataFile']:
+        """
+        Send a get request to /api/v1/files.
+
+        :param format: Only return files of this format (optional).
+
+        :return: A list of all files owned by the client
+        """
+        url = self.url_prefix + '/api/v1/files'
+
+        params = {}  # type: Dict[str, str]
+
+        if format is not None:
+            params['format'] = format
+
+        return self._call(
+            OPERATIONS['data_files_get_all'],
+            url,
+            params=params,
+        )
+
+    def data_files_create(
+            self,
+            file: BinaryIO,
+            format: str,
+            name: Optional[str] = None) -> bytes:
+        """
+        Sample request:
+
+            POST /files
+            {
+               "format": "text",
+               "name": "myTeam:myProject:myFile.txt"
+            }
+
+        :param file: The file to upload.  Max size: 100MB
+        :param format:
+            File format options:
+            * **Text**: One translation unit (a.k.a., verse) per line
+              * If a line contains a tab, characters before the tab are used as a unique identifier for the line, characters after the tab are understood as the content of the verse, and if there is another tab following the verse content, characters after this second tab are assumed to be column codes like "ss" etc. for sectioning and other formatting. See this example of a tab-delimited text file:
+                > verse_001_005 (tab) Ὑπομνῆσαι δὲ ὑμᾶς βούλομαι , εἰδότας ὑμᾶς ἅπαξ τοῦτο
+                > verse_001_006 (tab) Ἀγγέλους τε τοὺς μὴ τηρήσαντας τὴν ἑαυτῶν ἀρχήν , ἀλλὰ (tab) ss
+                > verse_001_007 (tab) Ὡς Σόδομα καὶ Γόμορρα , καὶ αἱ περὶ αὐτὰς πόλεις (tab) ss
+              * Otherwise, *no tabs* should be used in the file. A unique identifier will be generated for each translation unit based on the line number.
+            * **Paratext**: A complete, zipped Paratext project backup: that is, a .zip archive of files including the USFM files and "Settings.xml" file. To generate a zipped backup for a project in Paratext, navigate to "Paratext/Advanced/Backup project to file..." and follow the dialogue.
+              * USFM files in Paratext projects have unique identifiers assigned per segment for scripture and non-scripture content according to [this guide](https://github.com/sillsdev/serval/wiki/USFM-Parsing-and-Translation)
+        :param name:
+            A name to help identify and distinguish the file.
+            Recommendation: Create a multi-part name to distinguish between projects, uses, languages, etc.
+            The name does not have to be unique.
+            Example: myTranslationTeam:myProject:myLanguage:myFile.txt
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/files'
+
+        data = {}  # type: Dict[str, str]
+
+        data['format'] = format
+
+        if name is not None:
+            data['name'] = name
+
+        files = {}  # type: Dict[str, BinaryIO]
+
+        files['file'] = file
+
+        return self._call(
+            OPERATIONS['data_files_create'],
+            url,
+            data=data,
+            files=files,
+        )
+
+    def data_files_get(
+            self,
+            id: str) -> 'DataFile':
+        """
+        Send a get request to /api/v1/files/{id}.
+
+        :param id: The unique identifier for the file
+
+        :return: The file exists
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['data_files_get'],
+            url,
+        )
+
+    def data_files_update(
+            self,
+            id: str,
+            file: BinaryIO) -> 'DataFile':
+        """
+        Send a patch request to /api/v1/files/{id}.
+
+        :param id: The existing file's unique id
+        :param file: The updated file
+
+        :return: The file was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id)])
+
+        files = {}  # type: Dict[str, BinaryIO]
+
+        files['file'] = file
+
+        return self._call(
+            OPERATIONS['data_files_update'],
+            url,
+            files=files,
+        )
+
+    def data_files_delete(
+            self,
+            id: str) -> bytes:
+        """
+        If a file is in a corpus and the file is deleted, it will be automatically removed from that corpus.
+        If a build job has started before the file was deleted, the file will be used for the build job, even
+        though it will no longer be accessible through the API.
+
+        :param id: The existing file's unique id
+
+        :return: The file was deleted successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['data_files_delete'],
+            url,
+        )
+
+    def data_files_download(
+            self,
+            id: str) -> BinaryIO:
+        """
+        Send a post request to /api/v1/files/{id}/contents.
+
+        :param id: The unique identifier for the file
+
+        :return: The file exists
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id),
+            '/contents'])
+
+        return self._call(
+            OPERATIONS['data_files_download'],
+            url,
+        )
+
+    def translation_builds_get_all_builds_created_after(
+            self,
+            created_after: Optional[str] = None) -> List['TranslationBuild']:
+        """
+        Send a get request to /api/v1/translation/builds.
+
+        :param created_after: The date and time in UTC that the builds were created after (optional).
+
+        :return: The engines
+        """
+        url = self.url_prefix + '/api/v1/translation/builds'
+
+        params = {}  # type: Dict[str, str]
+
+        if created_after is not None:
+            params['created-after'] = created_after
+
+        return self._call(
+            OPERATIONS['translation_builds_get_all_builds_created_after'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_get_all(self) -> List['TranslationEngine']:
+        """
+        Send a get request to /api/v1/translation/engines.
+
+        :return: The engines
+        """
+        url = self.url_prefix + '/api/v1/translation/engines'
+
+        return self._call(
+            OPERATIONS['translation_engines_get_all'],
+            url,
+        )
+
+    def translation_engines_create(
+            self,
+            engine_config: 'TranslationEngineConfig') -> bytes:
+        """
+        ## Parameters
+        * **`name`**: (optional) A name to help identify and distinguish the translation engine.
+          * Recommendation: Create a multi-part name to distinguish between projects, uses, etc.
+          * The name does not have to be unique, as the engine is uniquely identified by the auto-generated id
+        * **`sourceLanguage`**: The source language code (a valid [IETF language tag](https://en.wikipedia.org/wiki/IETF_language_tag) is recommended)
+        * **`targetLanguage`**: The target language code (a valid IETF language tag is recommended)
+        * **`type`**: **`smt-transfer`** or **`nmt`** or **`echo`**
+        * **`isModelPersisted`**: (optional) - see below
+        ### smt-transfer
+        The Statistical Machine Translation Transfer Learning engine is primarily used for translation suggestions. Typical endpoints: translate, get-word-graph, train-segment
+        * **`isModelPersisted`**: (default to `true`) All models are persistent and can be updated with train-segment.  False is not supported.
+        ### nmt
+        The Neural Machine Translation engine is primarily used for pretranslations.  It is fine-tuned from Meta's NLLB-200. Valid IETF language tags provided to Serval will be converted to [NLLB-200 codes](https://github.com/facebookresearch/flores/tree/main/flores200#languages-in-flores-200).  See more about language tag resolution [here](https://github.com/sillsdev/serval/wiki/FLORES%E2%80%90200-Language-Code-Resolution-for-NMT-Engine).
+        * **`isModelPersisted`**: (default to `false`) Whether the model can be downloaded by the client after it has been successfully built.
+
+        If you use a language among NLLB's supported languages, Serval will utilize everything the NLLB-200 model already knows about that language when translating. If the language you are working with is not among NLLB's supported languages, the language code will have no effect.
+
+        Typical endpoints: pretranslate
+        ### echo
+        The echo engine has full coverage of all nmt and smt-transfer endpoints. Endpoints like create and build return empty responses. Endpoints like translate and get-word-graph echo the sent content back to the user in a format that mocks nmt or smt-transfer. For example, translating a segment "test" with the echo engine would yield a translation response with translation "test". This engine is useful for debugging and testing purposes.
+        ## Sample request:
+
+            {
+              "name": "myTeam:myProject:myEngine",
+              "sourceLanguage": "el",
+              "targetLanguage": "en",
+              "type": "nmt"
+              "isModelPersisted": true
+            }
+
+        :param engine_config: The translation engine configuration (see above)
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/translation/engines'
+
+        data = self._to_jsonable(
+            engine_config,
+            expected=[TranslationEngineConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_create'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get(
+            self,
+            id: str) -> 'TranslationEngine':
+        """
+        Send a get request to /api/v1/translation/engines/{id}.
+
+        :param id: The translation engine id
+
+        :return: The translation engine
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_get'],
+            url,
+        )
+
+    def translation_engines_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/translation/engines/{id}.
+
+        :param id: The translation engine id
+
+        :return: The engine was successfully deleted.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_delete'],
+            url,
+        )
+
+    def translation_engines_update(
+            self,
+            id: str,
+            request: 'TranslationEngineUpdateConfig') -> bytes:
+        """
+        ## Sample request:
+
+            {
+              "sourceLanguage": "en",
+              "targetLanguage": "en"
+            }
+
+        :param id: The translation engine id
+        :param request:
+
+        :return: The engine language was successfully updated.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id)])
+
+        data = self._to_jsonable(
+            request,
+            expected=[TranslationEngineUpdateConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_update'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_translate(
+            self,
+            id: str,
+            segment: str) -> 'TranslationResult':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The translation result
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/translate'])
+
+        data = segment
+
+        return self._call(
+            OPERATIONS['translation_engines_translate'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_translate_n(
+            self,
+            id: str,
+            n: int,
+            segment: str) -> List['TranslationResult']:
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate/{n}.
+
+        :param id: The translation engine id
+        :param n: The number of translations to generate
+        :param segment: The source segment
+
+        :return: The translation results
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/translate/',
+            str(n)])
+
+        data = segment
+
+        return self._call(
+            OPERATIONS['translation_engines_translate_n'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get_word_graph(
+            self,
+            id: str,
+            segment: str) -> 'WordGraph':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/get-word-graph.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The word graph result
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/get-word-graph'])
+
+        data = segment
+
+        return self._call(
+            OPERATIONS['translation_engines_get_word_graph'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_train_segment(
+            self,
+            id: str,
+            segment_pair: 'SegmentPair') -> bytes:
+        """
+        A segment pair consists of a source and target segment as well as a boolean flag `sentenceStart`
+        that should be set to `true` if this segment pair forms the beginning of a sentence. (This information
+        will be used to reconstruct proper capitalization when training/inferencing).
+
+        :param id: The translation engine id
+        :param segment_pair: The segment pair
+
+        :return: The engine was trained successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/train-segment'])
+
+        data = self._to_jsonable(
+            segment_pair,
+            expected=[SegmentPair])
+
+        return self._call(
+            OPERATIONS['translation_engines_train_segment'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_add_corpus(
+            self,
+            id: str,
+            corpus_config: 'TranslationCorpusConfig') -> bytes:
+        """
+        ## Parameters
+        * **name**: A name to help identify and distinguish the corpus from other corpora
+          * The name does not have to be unique since the corpus is uniquely identified by an auto-generated id
+        * **`sourceLanguage`**: The source language code (See documentation on endpoint /translation/engines/ - "Create a new translation engine" for details on language codes).
+          * Normally, this is the same as the engine's `sourceLanguage`.  This may change for future engines as a means of transfer learning.
+        * **`targetLanguage`**: The target language code (See documentation on endpoint /translation/engines/ - "Create a new translation engine" for details on language codes).
+        * **`sourceFiles`**: The source files associated with the corpus
+          * **`fileId`**: The unique id referencing the uploaded file
+          * **`textId`**: The client-defined name to associate source and target files.
+            * If the text ids in the source files and target files match, they will be used to train the engine.
+            * If selected for pretranslation when building, all source files that have no target file, or lines of text in a source file that have missing or blank lines in the target file will be pretranslated.
+            * If a text id is used more than once in source files, the sources will be randomly and evenly mixed for training.
+            * For pretranslating, multiple sources with the same text id will be combined, but the first source will always take precedence (no random mixing).
+            * For Paratext projects, text id will be ignored - multiple Paratext source projects will always be mixed (as if they have the same text id).
+        * **`targetFiles`**: The target files associated with the corpus
+          * Same as `sourceFiles`, except only a single instance of a text id or a single Paratext project is supported.  There is no mixing or combining of multiple targets.
+
+        :param id: The translation engine id
+        :param corpus_config: The corpus configuration (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora'])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationCorpusConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_add_corpus'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get_all_corpora(
+            self,
+            id: str) -> List['TranslationCorpus']:
+        """
+        Send a get request to /api/v1/translation/engines/{id}/corpora.
+
+        :param id: The translation engine id
+
+        :return: The corpora
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora'])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_all_corpora'],
+            url,
+        )
+
+    def translation_engines_update_corpus(
+            self,
+            id: str,
+            corpus_id: str,
+            corpus_config: 'TranslationCorpusUpdateConfig') -> 'TranslationCorpus':
+        """
+        See posting a new corpus for details of use. Will completely replace corpus' file associations.
+        Will not affect jobs already queued or running. Will not affect existing pretranslations until new build is complete.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id
+        :param corpus_config: The corpus configuration
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id)])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationCorpusUpdateConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_update_corpus'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get_corpus(
+            self,
+            id: str,
+            corpus_id: str) -> 'TranslationCorpus':
+        """
+        Send a get request to /api/v1/translation/engines/{id}/corpora/{corpusId}.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id
+
+        :return: The corpus configuration
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_corpus'],
+            url,
+        )
+
+    def translation_engines_delete_corpus(
+            self,
+            id: str,
+            corpus_id: str,
+            delete_files: Optional[bool] = None) -> bytes:
+        """
+        Removing a corpus will remove all pretranslations associated with that corpus.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id
+        :param delete_files: If `true`, all files associated with the corpus will be deleted as well (even if they are associated with other corpora). If false, no files will be deleted.
+
+        :return: The corpus was deleted successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id)])
+
+        params = {}  # type: Dict[str, str]
+
+        if delete_files is not None:
+            params['delete-files'] = json.dumps(delete_files)
+
+        return self._call(
+            OPERATIONS['translation_engines_delete_corpus'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_get_all_corpus_pretranslations(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: Optional[str] = None) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Pretranslations can be filtered by text id if provided.
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id or parallel corpus id
+        :param text_id: The text id (optional)
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/pretranslations'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._call(
+            OPERATIONS['translation_engines_get_all_corpus_pretranslations'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_get_corpus_pretranslations_by_text_id(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: str) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id or parallel corpus id
+        :param text_id: The text id
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/pretranslations/',
+            str(text_id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_corpus_pretranslations_by_text_id'],
+            url,
+        )
+
+    def translation_engines_get_corpus_pretranslated_usfm(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: str,
+            text_origin: Optional[str] = None,
+            template: Optional[str] = None,
+            paragraph_marker_behavior: Optional[str] = None,
+            embed_behavior: Optional[str] = None,
+            style_marker_behavior: Optional[str] = None,
+            quotation_mark_behavior: Optional[str] = None) -> str:
+        r"""
+        The text that populates the USFM structure can be controlled by the `text-origin` parameter:
+        * `PreferExisting`: The existing and pretranslated texts are merged into the USFM, preferring existing text. **This is the default**.
+        * `PreferPretranslated`: The existing and pretranslated texts are merged into the USFM, preferring pretranslated text.
+        * `OnlyExisting`: Return the existing target USFM file with no modifications (except updating the USFM id if needed).
+        * `OnlyPretranslated`: Only the pretranslated text is returned; all existing text in the target USFM is removed.
+
+        The source or target book can be used as the USFM template for the pretranslated text. The template can be controlled by the `template` parameter:
+        * `Auto`: The target book is used as the template if it exists; otherwise, the source book is used. **This is the default**.
+        * `Source`: The source book is used as the template.
+        * `Target`: The target book is used as the template.
+
+        The intra-segment USFM markers are handled in the following way:
+        * Each verse and non-verse text segment is stripped of all intra-segment USFM.
+        * Reference (\r) and remark (\rem) markers are not translated but carried through from the source to the target.
+
+        Preserving or stripping different types of USFM markers can be controlled by the `paragraph-marker-behavior`, `embed-behavior`, and `style-marker-behavior` parameters.
+        * `PushToEnd`: The USFM markers (or the entire embed) are preserved and placed at the end of the verse. **This is the default for paragraph markers**.
+        * `TryToPlace`: The USFM markers (or the entire embed) are placed in approximately the right location within the verse. **This option is only available for paragraph markers. Quality of placement may differ from language to language. Only works when `template` is set to `Source`**.
+        * `Strip`: The USFM markers (or the entire embed) are removed. **This is the default for embeds and style markers**.
+
+        Quote normalization behavior is controlled by the `quote-normalization-behavior` parameter options:
+        * `Normalized`: The quotes in the pretranslated USFM are normalized quotes (typically straight quotes: ', ") in the style of the source data. **This is the default**.
+        * `Denormalized`: The quotes in the pretranslated USFM are denormalized into the style of the target data. Quote denormalization may not be successful in all contexts. A remark will be added to the USFM listing the chapters that were successfully denormalized.
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+        The USFM parsing and marker types used are defined here: [this wiki](https://github.com/sillsdev/serval/wiki/USFM-Parsing-and-Translation).
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id or parallel corpus id
+        :param text_id: The text id
+        :param text_origin: The source[s] of the data to populate the USFM file with.
+        :param template: The source or target book to use as the USFM template.
+        :param paragraph_marker_behavior: The behavior of paragraph markers.
+        :param embed_behavior: The behavior of embed markers.
+        :param style_marker_behavior: The behavior of style markers.
+        :param quotation_mark_behavior: The normalization behavior of quotes.
+
+        :return: The book in USFM format
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/pretranslations/',
+            str(text_id),
+            '/usfm'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_origin is not None:
+            params['text-origin'] = text_origin
+
+        if template is not None:
+            params['template'] = template
+
+        if paragraph_marker_behavior is not None:
+            params['paragraph-marker-behavior'] = paragraph_marker_behavior
+
+        if embed_behavior is not None:
+            params['embed-behavior'] = embed_behavior
+
+        if style_marker_behavior is not None:
+            params['style-marker-behavior'] = style_marker_behavior
+
+        if quotation_mark_behavior is not None:
+            params['quotation-mark-behavior'] = quotation_mark_behavior
+
+        return self._call(
+            OPERATIONS['translation_engines_get_corpus_pretranslated_usfm'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_add_parallel_corpus(
+            self,
+            id: str,
+            corpus_config: 'TranslationParallelCorpusConfig') -> bytes:
+        """
+        ## Parameters
+        * **`sourceCorpusIds`**: The source corpora associated with the parallel corpus
+        * **`targetCorpusIds`**: The target corpora associated with the parallel corpus
+
+        :param id: The translation engine id
+        :param corpus_config: The corpus configuration (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationParallelCorpusConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_add_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get_all_parallel_corpora(
+            self,
+            id: str) -> List['TranslationParallelCorpus']:
+        """
+        Send a get request to /api/v1/translation/engines/{id}/parallel-corpora.
+
+        :param id: The translation engine id
+
+        :return: The parallel corpora
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_all_parallel_corpora'],
+            url,
+        )
+
+    def translation_engines_update_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            corpus_config: 'TranslationParallelCorpusUpdateConfig') -> 'TranslationParallelCorpus':
+        """
+        Will completely replace the parallel corpus' file associations. Will not affect jobs already queued or running. Will not affect existing pretranslations until new build is complete.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param corpus_config: The corpus configuration
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationParallelCorpusUpdateConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_update_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> 'TranslationParallelCorpus':
+        """
+        Send a get request to /api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus configuration
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_parallel_corpus'],
+            url,
+        )
+
+    def translation_engines_delete_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> bytes:
+        """
+        Removing a parallel corpus will remove all pretranslations associated with that corpus.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus was deleted successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_delete_parallel_corpus'],
+            url,
+        )
+
+    def translation_engines_get_all_pretranslations(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: Optional[str] = None) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Pretranslations can be filtered by text id if provided.
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id (optional)
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._call(
+            OPERATIONS['translation_engines_get_all_pretranslations'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_get_pretranslations_by_text_id(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: str) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations/',
+            str(text_id)])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_pretranslations_by_text_id'],
+            url,
+        )
+
+    def translation_engines_get_pretranslated_usfm(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: str,
+            text_origin: Optional[str] = None,
+            template: Optional[str] = None,
+            paragraph_marker_behavior: Optional[str] = None,
+            embed_behavior: Optional[str] = None,
+            style_marker_behavior: Optional[str] = None,
+            quotation_mark_behavior: Optional[str] = None) -> str:
+        r"""
+        The text that populates the USFM structure can be controlled by the `text-origin` parameter:
+        * `PreferExisting`: The existing and pretranslated texts are merged into the USFM, preferring existing text. **This is the default**.
+        * `PreferPretranslated`: The existing and pretranslated texts are merged into the USFM, preferring pretranslated text.
+        * `OnlyExisting`: Return the existing target USFM file with no modifications (except updating the USFM id if needed).
+        * `OnlyPretranslated`: Only the pretranslated text is returned; all existing text in the target USFM is removed.
+
+        The source or target book can be used as the USFM template for the pretranslated text. The template can be controlled by the `template` parameter:
+        * `Auto`: The target book is used as the template if it exists; otherwise, the source book is used. **This is the default**.
+        * `Source`: The source book is used as the template.
+        * `Target`: The target book is used as the template.
+
+        The intra-segment USFM markers are handled in the following way:
+        * Each verse and non-verse text segment is stripped of all intra-segment USFM.
+        * Reference (\r) and remark (\rem) markers are not translated but carried through from the source to the target.
+
+        Preserving or stripping different types of USFM markers can be controlled by the `paragraph-marker-behavior`, `embed-behavior`, and `style-marker-behavior` parameters.
+        * `PushToEnd`: The USFM markers (or the entire embed) are preserved and placed at the end of the verse. **This is the default for paragraph markers and embeds**.
+        * `TryToPlace`: The USFM markers (or the entire embed) are placed in approximately the right location within the verse. **This option is only available for paragraph markers. Quality of placement may differ from language to language.**.
+        * `Strip`: The USFM markers (or the entire embed) are removed. **This is the default for style markers**.
+
+        Quote normalization behavior is controlled by the `quote-normalization-behavior` parameter options:
+        * `Normalized`: The quotes in the pretranslated USFM are normalized quotes (typically straight quotes: ', ") in the style of the source data. **This is the default**.
+        * `Denormalized`: The quotes in the pretranslated USFM are denormalized into the style of the target data. Quote denormalization may not be successful in all contexts. A remark will be added to the USFM listing the chapters that were successfully denormalized.
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+        The USFM parsing and marker types used are defined here: [this wiki](https://github.com/sillsdev/serval/wiki/USFM-Parsing-and-Translation).
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id
+        :param text_origin: The source[s] of the data to populate the USFM file with.
+        :param template: The source or target book to use as the USFM template.
+        :param paragraph_marker_behavior: The behavior of paragraph markers.
+        :param embed_behavior: The behavior of embed markers.
+        :param style_marker_behavior: The behavior of style markers.
+        :param quotation_mark_behavior: The normalization behavior of quotes.
+
+        :return: The book in USFM format
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations/',
+            str(text_id),
+            '/usfm'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_origin is not None:
+            params['text-origin'] = text_origin
+
+        if template is not None:
+            params['template'] = template
+
+        if paragraph_marker_behavior is not None:
+            params['paragraph-marker-behavior'] = paragraph_marker_behavior
+
+        if embed_behavior is not None:
+            params['embed-behavior'] = embed_behavior
+
+        if style_marker_behavior is not None:
+            params['style-marker-behavior'] = style_marker_behavior
+
+        if quotation_mark_behavior is not None:
+            params['quotation-mark-behavior'] = quotation_mark_behavior
+
+        return self._call(
+            OPERATIONS['translation_engines_get_pretranslated_usfm'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_get_all_builds(
+            self,
+            id: str) -> List['TranslationBuild']:
+        """
+        Send a get request to /api/v1/translation/engines/{id}/builds.
+
+        :param id: The translation engine id
+
+        :return: The build jobs
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/builds'])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_all_builds'],
+            url,
+        )
+
+    def translation_engines_start_build(
+            self,
+            id: str,
+            build_config: 'TranslationBuildConfig') -> bytes:
+        """
+        Specify the corpora and text ids/scripture ranges within those corpora to train on. Only one type of corpus may be used: either (legacy) corpora (see /translation/engines/{id}/corpora) or parallel corpora (see /translation/engines/{id}/parallel-corpora).
+        Specifying a corpus:
+        * A (legacy) corpus is selected by specifying `corpusId` and a parallel corpus is selected by specifying `parallelCorpusId`.
+        * A parallel corpus can be further filtered by specifying particular corpusIds in `sourceFilters` or `targetFilters`.
+
+        Filtering by text id or chapter:
+        * Paratext projects can be filtered by [book using the `textIds`](https://github.com/sillsdev/libpalaso/blob/master/SIL.Scripture/Canon.cs).
+        * Filters can also be supplied via the `scriptureRange` parameter as ranges of biblical text. See [here](https://github.com/sillsdev/serval/wiki/Filtering-Paratext-Project-Data-with-a-Scripture-Range).
+        * All Paratext project filtering follows original versification. See [here](https://github.com/sillsdev/serval/wiki/Versification-in-Serval) for more information.
+
+        Filter - train on all or none
+        * If `trainOn` or `pretranslate` is not provided, all corpora will be used for training or pretranslation respectively
+        * If a corpus is selected for training or pretranslation and neither `scriptureRange` nor `textIds` is defined, all of the selected corpus will be used.
+        * If a corpus is selected for training or pretranslation and an empty `scriptureRange` or `textIds` is defined, none of the selected corpus will be used.
+        * If a corpus is selected for training or pretranslation but no further filters are provided, all selected corpora will be used for training or pretranslation respectively.
+
+        Specify the corpora and text ids/scripture ranges within those corpora to pretranslate. When a corpus is selected for pretranslation,
+        the following text will be pretranslated:
+        * Text segments that are in the source but do not exist in the target.
+        * Text segments that are in the source and the target, but because of `trainOn` filtering, have not been trained on.
+        If the engine does not support pretranslation, these fields have no effect.
+        Pretranslating uses the same filtering as training.
+
+        The `options` parameter of the build config provides the ability to pass build configuration parameters as a JSON object.
+        See [nmt job settings documentation](https://github.com/sillsdev/serval/wiki/NMT-Build-Options) about configuring job parameters.
+        See [smt-transfer job settings documentation](https://github.com/sillsdev/serval/wiki/SMT-Transfer-Build-Options) about configuring job parameters.
+        See [keyterms parsing documentation](https://github.com/sillsdev/serval/wiki/Paratext-Key-Terms-Parsing) on how to use keyterms for training.
+
+        Note that when using a parallel corpus:
+        * If, within a single parallel corpus, multiple source corpora have data for the same text ids (for text files or Paratext Projects) or books (for Paratext Projects only using the scripture range), those sources will be mixed where they overlap by randomly choosing from each source per line/verse.
+        * If, within a single parallel corpus, multiple target corpora have data for the same text ids (for text files or Paratext Projects) or books (for Paratext Projects only using the scripture range), only the first of the targets that includes that text id/book will be used for that text id/book.
+
+        :param id: The translation engine id
+        :param build_config: The build config (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/builds'])
+
+        data = self._to_jsonable(
+            build_config,
+            expected=[TranslationBuildConfig])
+
+        return self._call(
+            OPERATIONS['translation_engines_start_build'],
+            url,
+            json=data,
+        )
+
+    def translation_engines_get_build(
+            self,
+            id: str,
+            build_id: str,
+            min_revision: Optional[int] = None) -> 'TranslationBuild':
+        """
+        If the `minRevision` is not defined, the current build, at whatever state it is,
+        will be immediately returned.  If `minRevision` is defined, Serval will wait for
+        up to 40 seconds for the engine to build to the `minRevision` specified, else
+        will timeout.
+        A use case is to actively query the state of the current build, where the subsequent
+        request sets the `minRevision` to the returned `revision` + 1 and timeouts are handled gracefully.
+        This method should use request throttling.
+        Note: Within the returned build, progress is a value between 0 and 1.
+
+        :param id: The translation engine id
+        :param build_id: The build job id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/builds/',
+            str(build_id)])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return self._call(
+            OPERATIONS['translation_engines_get_build'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_get_current_build(
+            self,
+            id: str,
+            min_revision: Optional[int] = None) -> 'TranslationBuild':
+        """
+        See documentation on endpoint /translation/engines/{id}/builds/{id} - "Get a Build Job" for details on using `minRevision`.
+
+        :param id: The translation engine id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/current-build'])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return self._call(
+            OPERATIONS['translation_engines_get_current_build'],
+            url,
+            params=params,
+        )
+
+    def translation_engines_cancel_build(
+            self,
+            id: str) -> 'TranslationBuild':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/current-build/cancel.
+
+        :param id: The translation engine id
+
+        :return: The build job was cancelled successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/current-build/cancel'])
+
+        return self._call(
+            OPERATIONS['translation_engines_cancel_build'],
+            url,
+        )
+
+    def translation_engines_get_model_download_url(
+            self,
+            id: str) -> 'ModelDownloadURL':
+        """
+        If an nmt build was successful and `isModelPersisted` is `true` for the engine,
+        then the model from the most recent successful build can be downloaded.
+
+        The endpoint will return a URL that can be used to download the model for up to 1 hour
+        after the request is made.  If the URL is not used within that time, a new request will need to be made.
+
+        The download itself is created by g-zipping together the folder containing the fine tuned model
+        with all necessary supporting files.  This zipped folder is then named by the pattern:
+         * <engine_id>_<model_revision>.tar.gz
+
+        :param id: The translation engine id
+
+        :return: The url to download the model.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/model-download-url'])
+
+        return self._call(
+            OPERATIONS['translation_engines_get_model_download_url'],
+            url,
+        )
+
+    def translation_engine_types_get_queue(
+            self,
+            engine_type: str) -> 'Queue':
+        """
+        Send a get request to /api/v1/translation/engine-types/{engineType}/queues.
+
+        :param engine_type: A valid engine type: smt-transfer, nmt, or echo
+
+        :return: Queue information for the specified engine type
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engine-types/',
+            str(engine_type),
+            '/queues'])
+
+        return self._call(
+            OPERATIONS['translation_engine_types_get_queue'],
+            url,
+        )
+
+    def translation_engine_types_get_language_info(
+            self,
+            engine_type: str,
+            language: str) -> 'LanguageInfo':
+        """
+        This endpoint exists primarily to support `nmt` model-training since `echo` and `smt-transfer` engines support all languages equally. Given a language tag, it provides the ISO 639-3 code that the tag maps to internally
+        and whether it is supported in the NLLB 200 model without training.  This is useful for determining if a language is a good candidate for a source language.
+        **Base Models available**
+        * **NLLB-200**: This is the only base NMT translation model currently available.
+          * The languages supported by the base model can be found [here](https://github.com/facebookresearch/flores/blob/main/nllb_seed/README.md).
+        Response format:
+        * **`engineType`**: See above
+        * **`isNative`**: Whether the base translation model supports this language without fine-tuning.
+        * **`internalCode`**: The translation model's internal language code. See more details about how the language tag is mapped to an internal code [here](https://github.com/sillsdev/serval/wiki/FLORES%E2%80%90200-Language-Code-Resolution-for-NMT-Engine).
+
+        :param engine_type: A valid engine type: nmt, echo, or smt-transfer
+        :param language: The language to retrieve information on.
+
+        :return: Language information for the specified engine type
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engine-types/',
+            str(engine_type),
+            '/languages/',
+            str(language)])
+
+        return self._call(
+            OPERATIONS['translation_engine_types_get_language_info'],
+            url,
+        )
+
+    def webhooks_get_all(self) -> List['Webhook']:
+        """
+        Send a get request to /api/v1/hooks.
+
+        :return: The webhooks.
+        """
+        url = self.url_prefix + '/api/v1/hooks'
+
+        return self._call(
+            OPERATIONS['webhooks_get_all'],
+            url,
+        )
+
+    def webhooks_create(
+            self,
+            hook_config: 'WebhookConfig') -> bytes:
+        """
+        Send a post request to /api/v1/hooks.
+
+        :param hook_config: The webhook configuration.
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/hooks'
+
+        data = self._to_jsonable(
+            hook_config,
+            expected=[WebhookConfig])
+
+        return self._call(
+            OPERATIONS['webhooks_create'],
+            url,
+            json=data,
+        )
+
+    def webhooks_get(
+            self,
+            id: str) -> 'Webhook':
+        """
+        Send a get request to /api/v1/hooks/{id}.
+
+        :param id: The webhook id.
+
+        :return: The webhook.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/hooks/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['webhooks_get'],
+            url,
+        )
+
+    def webhooks_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/hooks/{id}.
+
+        :param id: The webhook id.
+
+        :return: The webhook was successfully deleted.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/hooks/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['webhooks_delete'],
+            url,
+        )
+
+    def word_alignment_engines_get_all(self) -> List['WordAlignmentEngine']:
+        """
+        Send a get request to /api/v1/word-alignment/engines.
+
+        :return: The engines
+        """
+        url = self.url_prefix + '/api/v1/word-alignment/engines'
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_all'],
+            url,
+        )
+
+    def word_alignment_engines_create(
+            self,
+            engine_config: 'WordAlignmentEngineConfig') -> bytes:
+        """
+        ## Parameters
+        * **`name`**: (optional) A name to help identify and distinguish the file.
+          * Recommendation: Create a multi-part name to distinguish between projects, uses, etc.
+          * The name does not have to be unique, as the engine is uniquely identified by the auto-generated id
+        * **`sourceLanguage`**: The source language code (a valid [IETF language tag](https://en.wikipedia.org/wiki/IETF_language_tag) is recommended)
+        * **`targetLanguage`**: The target language code (a valid IETF language tag is recommended)
+        * **type**: **`statistical`** or **`echo-word-alignment`**
+        ### statistical
+        The Statistical engine is based off of the [Thot library](https://github.com/sillsdev/thot) and contains IBM-1, IBM-2, IBM-3, IBM-4, FastAlign and HMM algorithms.
+        ### echo-word-alignment
+        The echo-word-alignment engine has full coverage of all endpoints. Endpoints like create and build return empty responses.
+        Endpoints like align echo the sent content back to the user in the proper format. This engine is useful for debugging and testing purposes.
+        ## Sample request:
+
+            {
+              "name": "myTeam:myProject:myEngine",
+              "sourceLanguage": "el",
+              "targetLanguage": "en",
+              "type": "statistical"
+            }
+
+        :param engine_config: The engine configuration (see above)
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/word-alignment/engines'
+
+        data = self._to_jsonable(
+            engine_config,
+            expected=[WordAlignmentEngineConfig])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_create'],
+            url,
+            json=data,
+        )
+
+    def word_alignment_engines_get(
+            self,
+            id: str) -> 'WordAlignmentEngine':
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}.
+
+        :param id: The engine id
+
+        :return: The engine
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get'],
+            url,
+        )
+
+    def word_alignment_engines_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/word-alignment/engines/{id}.
+
+        :param id: The engine id
+
+        :return: The engine was successfully deleted.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id)])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_delete'],
+            url,
+        )
+
+    def word_alignment_engines_align(
+            self,
+            id: str,
+            word_alignment_request: 'WordAlignmentRequest') -> 'WordAlignmentResult':
+        """
+        Send a post request to /api/v1/word-alignment/engines/{id}/align.
+
+        :param id: The engine id
+        :param word_alignment_request: The source and target segment
+
+        :return: The word alignment result
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/align'])
+
+        data = self._to_jsonable(
+            word_alignment_request,
+            expected=[WordAlignmentRequest])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_align'],
+            url,
+            json=data,
+        )
+
+    def word_alignment_engines_add_parallel_corpus(
+            self,
+            id: str,
+            corpus_config: 'WordAlignmentParallelCorpusConfig') -> bytes:
+        """
+        ## Parameters
+        * **`sourceCorpusIds`**: The source corpora associated with the parallel corpus
+        * **`targetCorpusIds`**: The target corpora associated with the parallel corpus
+
+        :param id: The engine id
+        :param corpus_config: The corpus configuration (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[WordAlignmentParallelCorpusConfig])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_add_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    def word_alignment_engines_get_all_parallel_corpora(
+            self,
+            id: str) -> List['WordAlignmentParallelCorpus']:
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}/parallel-corpora.
+
+        :param id: The engine id
+
+        :return: The parallel corpora
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_all_parallel_corpora'],
+            url,
+        )
+
+    def word_alignment_engines_update_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            corpus_config: 'WordAlignmentParallelCorpusUpdateConfig') -> 'WordAlignmentParallelCorpus':
+        """
+        Will completely replace the parallel corpus' file associations. Will not affect jobs already queued or running. Will not affect existing word graphs until new build is complete.
+
+        :param id: The engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param corpus_config: The corpus configuration
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[WordAlignmentParallelCorpusUpdateConfig])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_update_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    def word_alignment_engines_get_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> 'WordAlignmentParallelCorpus':
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}/parallel-corpora/{parallelCorpusId}.
+
+        :param id: The engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus configuration
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_parallel_corpus'],
+            url,
+        )
+
+    def word_alignment_engines_delete_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> bytes:
+        """
+        Removing a parallel corpus will remove all word alignments associated with that corpus.
+
+        :param id: The engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus was deleted successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_delete_parallel_corpus'],
+            url,
+        )
+
+    def word_alignment_engines_get_all_word_alignments(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: Optional[str] = None) -> List['WordAlignment']:
+        """
+        Word alignments are arranged in a list of dictionaries with the following fields per word alignment:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`sourceTokens`**: the tokenized source segment
+        * **`targetTokens`**: the tokenized target segment
+        * **`alignment`**: a list of aligned word pairs with associated scores
+
+        Word alignments can be filtered by text id if provided.
+        Only word alignments for the most recent successful build of the engine are returned.
+
+        :param id: The engine id
+        :param corpus_id: The corpus id
+        :param text_id: The text id (optional)
+
+        :return: The word alignments
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/word-alignments'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_all_word_alignments'],
+            url,
+            params=params,
+        )
+
+    def word_alignment_engines_get_all_builds(
+            self,
+            id: str) -> List['WordAlignmentBuild']:
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}/builds.
+
+        :param id: The engine id
+
+        :return: The build jobs
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/builds'])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_all_builds'],
+            url,
+        )
+
+    def word_alignment_engines_start_build(
+            self,
+            id: str,
+            build_config: 'WordAlignmentBuildConfig') -> bytes:
+        """
+        Specify the corpora and textIds to train on. If no `trainOn` field is provided, all corpora will be used. Only parallel corpora are supported.
+        Paratext projects can be filtered by [book using the `textIds`](https://github.com/sillsdev/libpalaso/blob/master/SIL.Scripture/Canon.cs).
+        Filters can also be supplied via `scriptureRange` parameter as ranges of biblical text. See [here](https://github.com/sillsdev/serval/wiki/Filtering-Paratext-Project-Data-with-a-Scripture-Range)
+        All Paratext project filtering follows original versification. See [here](https://github.com/sillsdev/serval/wiki/Versification-in-Serval) for more information.
+
+        Specify the corpora or text ids to word align on.
+        When a corpus or text id is selected for word align on, only text segments that are in both the source and the target will be aligned.
+
+        The `options` parameter of the build config provides the ability to pass build configuration parameters as a JSON object.
+        See [statistical alignment job settings documentation](https://github.com/sillsdev/serval/wiki/Statistical-Alignment-Build-Options) about configuring job parameters.
+
+        :param id: The engine id
+        :param build_config: The build config (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/builds'])
+
+        data = self._to_jsonable(
+            build_config,
+            expected=[WordAlignmentBuildConfig])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_start_build'],
+            url,
+            json=data,
+        )
+
+    def word_alignment_engines_get_build(
+            self,
+            id: str,
+            build_id: str,
+            min_revision: Optional[int] = None) -> 'WordAlignmentBuild':
+        """
+        If the `minRevision` is not defined, the current build, at whatever state it is,
+        will be immediately returned.  If `minRevision` is defined, Serval will wait for
+        up to 40 seconds for the engine to build to the `minRevision` specified, else
+        will timeout.
+        A use case is to actively query the state of the current build, where the subsequent
+        request sets the `minRevision` to the returned `revision` + 1 and timeouts are handled gracefully.
+        This method should use request throttling.
+        Note: Within the returned build, progress is a value between 0 and 1.
+
+        :param id: The engine id
+        :param build_id: The build job id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/builds/',
+            str(build_id)])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_build'],
+            url,
+            params=params,
+        )
+
+    def word_alignment_engines_get_current_build(
+            self,
+            id: str,
+            min_revision: Optional[int] = None) -> 'WordAlignmentBuild':
+        """
+        See documentation on endpoint /word-alignment/engines/{id}/builds/{id} - "Get a Build Job" for details on using `minRevision`.
+
+        :param id: The engine id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/current-build'])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_get_current_build'],
+            url,
+            params=params,
+        )
+
+    def word_alignment_engines_cancel_build(
+            self,
+            id: str) -> 'WordAlignmentBuild':
+        """
+        Send a post request to /api/v1/word-alignment/engines/{id}/current-build/cancel.
+
+        :param id: The engine id
+
+        :return: The build job was cancelled successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/current-build/cancel'])
+
+        return self._call(
+            OPERATIONS['word_alignment_engines_cancel_build'],
+            url,
+        )
+
+    def word_alignment_engine_types_get_queue(
+            self,
+            engine_type: str) -> 'Queue':
+        """
+        Send a get request to /api/v1/word-alignment/engine-types/{engineType}/queues.
+
+        :param engine_type: A valid engine type: statistical or echo-word-alignment
+
+        :return: Queue information for the specified engine type
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engine-types/',
+            str(engine_type),
+            '/queues'])
+
+        return self._call(
+            OPERATIONS['word_alignment_engine_types_get_queue'],
+            url,
+        )
+
+
+class AsyncRemoteCallerOperations:
+    """
+    Remote calls of the Serval API.
+
+    The client class provides `_to_jsonable(obj, expected)`, which converts request bodies, and
+    `_call(operation, url, params=None, json=None, data=None, files=None)`, which sends the
+    request and returns the converted response.
+    """
+
+    async def _call(
+            self,
+            operation: Operation,
+            url: str,
+            params: Optional[Dict[str, str]] = None,
+            json: Any = None,
+            data: Optional[Dict[str, str]] = None,
+            files: Optional[Dict[str, BinaryIO]] = None) -> Any:
+        raise NotImplementedError()
+
+    def _to_jsonable(self, obj: Any, expected: List[type]) -> Any:
+        raise NotImplementedError()
+
+    async def status_get_health(self) -> 'HealthReport':
+        """
+        Provides an indication about the health of the API
+
+        :return: The API health status
+        """
+        url = self.url_prefix + '/api/v1/status/health'
+
+        return await self._call(
+            OPERATIONS['status_get_health'],
+            url,
+        )
+
+    async def status_get_ping(self) -> 'HealthReport':
+        """
+        Provides an indication about the health of the API
+
+        :return: The API health status
+        """
+        url = self.url_prefix + '/api/v1/status/ping'
+
+        return await self._call(
+            OPERATIONS['status_get_ping'],
+            url,
+        )
+
+    async def status_get_deployment_info(self) -> 'DeploymentInfo':
+        """
+        Provides the version of the application
+
+        :return: Application Version
+        """
+        url = self.url_prefix + '/api/v1/status/deployment-info'
+
+        return await self._call(
+            OPERATIONS['status_get_deployment_info'],
+            url,
+        )
+
+    async def corpora_get_all(self) -> List['Corpus']:
+        """
+        Send a get request to /api/v1/corpora.
+
+        :return: A list of all corpora owned by the client
+        """
+        url = self.url_prefix + '/api/v1/corpora'
+
+        return await self._call(
+            OPERATIONS['corpora_get_all'],
+            url,
+        )
+
+    async def corpora_create(
+            self,
+            corpus_config: 'CorpusConfig') -> bytes:
+        """
+        Send a post request to /api/v1/corpora.
+
+        :param corpus_config:
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/corpora'
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[CorpusConfig])
+
+        return await self._call(
+            OPERATIONS['corpora_create'],
+            url,
+            json=data,
+        )
+
+    async def corpora_get(
+            self,
+            id: str) -> 'Corpus':
+        """
+        Send a get request to /api/v1/corpora/{id}.
+
+        :param id: The unique identifier for the corpus
+
+        :return: The corpus exists
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/corpora/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['corpora_get'],
+            url,
+        )
+
+    async def corpora_update(
+            self,
+            id: str,
+            files: List['CorpusFileConfig']) -> 'Corpus':
+        """
+        Send a patch request to /api/v1/corpora/{id}.
+
+        :param id: The unique identifier for the corpus
+        :param files: Tuples of the ids of the new corpus files and the associated text ids
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/corpora/',
+            str(id)])
+
+        data = self._to_jsonable(
+            files,
+            expected=[list, CorpusFileConfig])
+
+        return await self._call(
+            OPERATIONS['corpora_update'],
+            url,
+            json=data,
+        )
+
+    async def corpora_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/corpora/{id}.
+
+        :param id: The unique identifier for the corpus
+
+        :return: The corpus was deleted successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/corpora/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['corpora_delete'],
+            url,
+        )
+
+    async def data_files_get_all(
+            self,
+            format: Optional[str] = None) -> List['DataFile']:
+        """
+        Send a get request to /api/v1/files.
+
+        :param format: Only return files of this format (optional).
+
+        :return: A list of all files owned by the client
+        """
+        url = self.url_prefix + '/api/v1/files'
+
+        params = {}  # type: Dict[str, str]
+
+        if format is not None:
+            params['format'] = format
+
+        return await self._call(
+            OPERATIONS['data_files_get_all'],
+            url,
+            params=params,
+        )
+
+    async def data_files_create(
+            self,
+            file: BinaryIO,
+            format: str,
+            name: Optional[str] = None) -> bytes:
+        """
+        Sample request:
+
+            POST /files
+            {
+               "format": "text",
+               "name": "myTeam:myProject:myFile.txt"
+            }
+
+        :param file: The file to upload.  Max size: 100MB
+        :param format:
+            File format options:
+            * **Text**: One translation unit (a.k.a., verse) per line
+              * If a line contains a tab, characters before the tab are used as a unique identifier for the line, characters after the tab are understood as the content of the verse, and if there is another tab following the verse content, characters after this second tab are assumed to be column codes like "ss" etc. for sectioning and other formatting. See this example of a tab-delimited text file:
+                > verse_001_005 (tab) Ὑπομνῆσαι δὲ ὑμᾶς βούλομαι , εἰδότας ὑμᾶς ἅπαξ τοῦτο
+                > verse_001_006 (tab) Ἀγγέλους τε τοὺς μὴ τηρήσαντας τὴν ἑαυτῶν ἀρχήν , ἀλλὰ (tab) ss
+                > verse_001_007 (tab) Ὡς Σόδομα καὶ Γόμορρα , καὶ αἱ περὶ αὐτὰς πόλεις (tab) ss
+              * Otherwise, *no tabs* should be used in the file. A unique identifier will be generated for each translation unit based on the line number.
+            * **Paratext**: A complete, zipped Paratext project backup: that is, a .zip archive of files including the USFM files and "Settings.xml" file. To generate a zipped backup for a project in Paratext, navigate to "Paratext/Advanced/Backup project to file..." and follow the dialogue.
+              * USFM files in Paratext projects have unique identifiers assigned per segment for scripture and non-scripture content according to [this guide](https://github.com/sillsdev/serval/wiki/USFM-Parsing-and-Translation)
+        :param name:
+            A name to help identify and distinguish the file.
+            Recommendation: Create a multi-part name to distinguish between projects, uses, languages, etc.
+            The name does not have to be unique.
+            Example: myTranslationTeam:myProject:myLanguage:myFile.txt
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/files'
+
+        data = {}  # type: Dict[str, str]
+
+        data['format'] = format
+
+        if name is not None:
+            data['name'] = name
+
+        files = {}  # type: Dict[str, BinaryIO]
+
+        files['file'] = file
+
+        return await self._call(
+            OPERATIONS['data_files_create'],
+            url,
+            data=data,
+            files=files,
+        )
+
+    async def data_files_get(
+            self,
+            id: str) -> 'DataFile':
+        """
+        Send a get request to /api/v1/files/{id}.
+
+        :param id: The unique identifier for the file
+
+        :return: The file exists
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['data_files_get'],
+            url,
+        )
+
+    async def data_files_update(
+            self,
+            id: str,
+            file: BinaryIO) -> 'DataFile':
+        """
+        Send a patch request to /api/v1/files/{id}.
+
+        :param id: The existing file's unique id
+        :param file: The updated file
+
+        :return: The file was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id)])
+
+        files = {}  # type: Dict[str, BinaryIO]
+
+        files['file'] = file
+
+        return await self._call(
+            OPERATIONS['data_files_update'],
+            url,
+            files=files,
+        )
+
+    async def data_files_delete(
+            self,
+            id: str) -> bytes:
+        """
+        If a file is in a corpus and the file is deleted, it will be automatically removed from that corpus.
+        If a build job has started before the file was deleted, the file will be used for the build job, even
+        though it will no longer be accessible through the API.
+
+        :param id: The existing file's unique id
+
+        :return: The file was deleted successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['data_files_delete'],
+            url,
+        )
+
+    async def data_files_download(
+            self,
+            id: str) -> BinaryIO:
+        """
+        Send a post request to /api/v1/files/{id}/contents.
+
+        :param id: The unique identifier for the file
+
+        :return: The file exists
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/files/',
+            str(id),
+            '/contents'])
+
+        return await self._call(
+            OPERATIONS['data_files_download'],
+            url,
+        )
+
+    async def translation_builds_get_all_builds_created_after(
+            self,
+            created_after: Optional[str] = None) -> List['TranslationBuild']:
+        """
+        Send a get request to /api/v1/translation/builds.
+
+        :param created_after: The date and time in UTC that the builds were created after (optional).
+
+        :return: The engines
+        """
+        url = self.url_prefix + '/api/v1/translation/builds'
+
+        params = {}  # type: Dict[str, str]
+
+        if created_after is not None:
+            params['created-after'] = created_after
+
+        return await self._call(
+            OPERATIONS['translation_builds_get_all_builds_created_after'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_get_all(self) -> List['TranslationEngine']:
+        """
+        Send a get request to /api/v1/translation/engines.
+
+        :return: The engines
+        """
+        url = self.url_prefix + '/api/v1/translation/engines'
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_all'],
+            url,
+        )
+
+    async def translation_engines_create(
+            self,
+            engine_config: 'TranslationEngineConfig') -> bytes:
+        """
+        ## Parameters
+        * **`name`**: (optional) A name to help identify and distinguish the translation engine.
+          * Recommendation: Create a multi-part name to distinguish between projects, uses, etc.
+          * The name does not have to be unique, as the engine is uniquely identified by the auto-generated id
+        * **`sourceLanguage`**: The source language code (a valid [IETF language tag](https://en.wikipedia.org/wiki/IETF_language_tag) is recommended)
+        * **`targetLanguage`**: The target language code (a valid IETF language tag is recommended)
+        * **`type`**: **`smt-transfer`** or **`nmt`** or **`echo`**
+        * **`isModelPersisted`**: (optional) - see below
+        ### smt-transfer
+        The Statistical Machine Translation Transfer Learning engine is primarily used for translation suggestions. Typical endpoints: translate, get-word-graph, train-segment
+        * **`isModelPersisted`**: (default to `true`) All models are persistent and can be updated with train-segment.  False is not supported.
+        ### nmt
+        The Neural Machine Translation engine is primarily used for pretranslations.  It is fine-tuned from Meta's NLLB-200. Valid IETF language tags provided to Serval will be converted to [NLLB-200 codes](https://github.com/facebookresearch/flores/tree/main/flores200#languages-in-flores-200).  See more about language tag resolution [here](https://github.com/sillsdev/serval/wiki/FLORES%E2%80%90200-Language-Code-Resolution-for-NMT-Engine).
+        * **`isModelPersisted`**: (default to `false`) Whether the model can be downloaded by the client after it has been successfully built.
+
+        If you use a language among NLLB's supported languages, Serval will utilize everything the NLLB-200 model already knows about that language when translating. If the language you are working with is not among NLLB's supported languages, the language code will have no effect.
+
+        Typical endpoints: pretranslate
+        ### echo
+        The echo engine has full coverage of all nmt and smt-transfer endpoints. Endpoints like create and build return empty responses. Endpoints like translate and get-word-graph echo the sent content back to the user in a format that mocks nmt or smt-transfer. For example, translating a segment "test" with the echo engine would yield a translation response with translation "test". This engine is useful for debugging and testing purposes.
+        ## Sample request:
+
+            {
+              "name": "myTeam:myProject:myEngine",
+              "sourceLanguage": "el",
+              "targetLanguage": "en",
+              "type": "nmt"
+              "isModelPersisted": true
+            }
+
+        :param engine_config: The translation engine configuration (see above)
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/translation/engines'
+
+        data = self._to_jsonable(
+            engine_config,
+            expected=[TranslationEngineConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_create'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get(
+            self,
+            id: str) -> 'TranslationEngine':
+        """
+        Send a get request to /api/v1/translation/engines/{id}.
+
+        :param id: The translation engine id
+
+        :return: The translation engine
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get'],
+            url,
+        )
+
+    async def translation_engines_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/translation/engines/{id}.
+
+        :param id: The translation engine id
+
+        :return: The engine was successfully deleted.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_delete'],
+            url,
+        )
+
+    async def translation_engines_update(
+            self,
+            id: str,
+            request: 'TranslationEngineUpdateConfig') -> bytes:
+        """
+        ## Sample request:
+
+            {
+              "sourceLanguage": "en",
+              "targetLanguage": "en"
+            }
+
+        :param id: The translation engine id
+        :param request:
+
+        :return: The engine language was successfully updated.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id)])
+
+        data = self._to_jsonable(
+            request,
+            expected=[TranslationEngineUpdateConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_update'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_translate(
+            self,
+            id: str,
+            segment: str) -> 'TranslationResult':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The translation result
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/translate'])
+
+        data = segment
+
+        return await self._call(
+            OPERATIONS['translation_engines_translate'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_translate_n(
+            self,
+            id: str,
+            n: int,
+            segment: str) -> List['TranslationResult']:
+        """
+        Send a post request to /api/v1/translation/engines/{id}/translate/{n}.
+
+        :param id: The translation engine id
+        :param n: The number of translations to generate
+        :param segment: The source segment
+
+        :return: The translation results
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/translate/',
+            str(n)])
+
+        data = segment
+
+        return await self._call(
+            OPERATIONS['translation_engines_translate_n'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get_word_graph(
+            self,
+            id: str,
+            segment: str) -> 'WordGraph':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/get-word-graph.
+
+        :param id: The translation engine id
+        :param segment: The source segment
+
+        :return: The word graph result
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/get-word-graph'])
+
+        data = segment
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_word_graph'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_train_segment(
+            self,
+            id: str,
+            segment_pair: 'SegmentPair') -> bytes:
+        """
+        A segment pair consists of a source and target segment as well as a boolean flag `sentenceStart`
+        that should be set to `true` if this segment pair forms the beginning of a sentence. (This information
+        will be used to reconstruct proper capitalization when training/inferencing).
+
+        :param id: The translation engine id
+        :param segment_pair: The segment pair
+
+        :return: The engine was trained successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/train-segment'])
+
+        data = self._to_jsonable(
+            segment_pair,
+            expected=[SegmentPair])
+
+        return await self._call(
+            OPERATIONS['translation_engines_train_segment'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_add_corpus(
+            self,
+            id: str,
+            corpus_config: 'TranslationCorpusConfig') -> bytes:
+        """
+        ## Parameters
+        * **name**: A name to help identify and distinguish the corpus from other corpora
+          * The name does not have to be unique since the corpus is uniquely identified by an auto-generated id
+        * **`sourceLanguage`**: The source language code (See documentation on endpoint /translation/engines/ - "Create a new translation engine" for details on language codes).
+          * Normally, this is the same as the engine's `sourceLanguage`.  This may change for future engines as a means of transfer learning.
+        * **`targetLanguage`**: The target language code (See documentation on endpoint /translation/engines/ - "Create a new translation engine" for details on language codes).
+        * **`sourceFiles`**: The source files associated with the corpus
+          * **`fileId`**: The unique id referencing the uploaded file
+          * **`textId`**: The client-defined name to associate source and target files.
+            * If the text ids in the source files and target files match, they will be used to train the engine.
+            * If selected for pretranslation when building, all source files that have no target file, or lines of text in a source file that have missing or blank lines in the target file will be pretranslated.
+            * If a text id is used more than once in source files, the sources will be randomly and evenly mixed for training.
+            * For pretranslating, multiple sources with the same text id will be combined, but the first source will always take precedence (no random mixing).
+            * For Paratext projects, text id will be ignored - multiple Paratext source projects will always be mixed (as if they have the same text id).
+        * **`targetFiles`**: The target files associated with the corpus
+          * Same as `sourceFiles`, except only a single instance of a text id or a single Paratext project is supported.  There is no mixing or combining of multiple targets.
+
+        :param id: The translation engine id
+        :param corpus_config: The corpus configuration (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora'])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationCorpusConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_add_corpus'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get_all_corpora(
+            self,
+            id: str) -> List['TranslationCorpus']:
+        """
+        Send a get request to /api/v1/translation/engines/{id}/corpora.
+
+        :param id: The translation engine id
+
+        :return: The corpora
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora'])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_all_corpora'],
+            url,
+        )
+
+    async def translation_engines_update_corpus(
+            self,
+            id: str,
+            corpus_id: str,
+            corpus_config: 'TranslationCorpusUpdateConfig') -> 'TranslationCorpus':
+        """
+        See posting a new corpus for details of use. Will completely replace corpus' file associations.
+        Will not affect jobs already queued or running. Will not affect existing pretranslations until new build is complete.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id
+        :param corpus_config: The corpus configuration
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id)])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationCorpusUpdateConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_update_corpus'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get_corpus(
+            self,
+            id: str,
+            corpus_id: str) -> 'TranslationCorpus':
+        """
+        Send a get request to /api/v1/translation/engines/{id}/corpora/{corpusId}.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id
+
+        :return: The corpus configuration
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_corpus'],
+            url,
+        )
+
+    async def translation_engines_delete_corpus(
+            self,
+            id: str,
+            corpus_id: str,
+            delete_files: Optional[bool] = None) -> bytes:
+        """
+        Removing a corpus will remove all pretranslations associated with that corpus.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id
+        :param delete_files: If `true`, all files associated with the corpus will be deleted as well (even if they are associated with other corpora). If false, no files will be deleted.
+
+        :return: The corpus was deleted successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id)])
+
+        params = {}  # type: Dict[str, str]
+
+        if delete_files is not None:
+            params['delete-files'] = json.dumps(delete_files)
+
+        return await self._call(
+            OPERATIONS['translation_engines_delete_corpus'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_get_all_corpus_pretranslations(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: Optional[str] = None) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Pretranslations can be filtered by text id if provided.
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id or parallel corpus id
+        :param text_id: The text id (optional)
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/pretranslations'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_all_corpus_pretranslations'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_get_corpus_pretranslations_by_text_id(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: str) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id or parallel corpus id
+        :param text_id: The text id
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/pretranslations/',
+            str(text_id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_corpus_pretranslations_by_text_id'],
+            url,
+        )
+
+    async def translation_engines_get_corpus_pretranslated_usfm(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: str,
+            text_origin: Optional[str] = None,
+            template: Optional[str] = None,
+            paragraph_marker_behavior: Optional[str] = None,
+            embed_behavior: Optional[str] = None,
+            style_marker_behavior: Optional[str] = None,
+            quotation_mark_behavior: Optional[str] = None) -> str:
+        r"""
+        The text that populates the USFM structure can be controlled by the `text-origin` parameter:
+        * `PreferExisting`: The existing and pretranslated texts are merged into the USFM, preferring existing text. **This is the default**.
+        * `PreferPretranslated`: The existing and pretranslated texts are merged into the USFM, preferring pretranslated text.
+        * `OnlyExisting`: Return the existing target USFM file with no modifications (except updating the USFM id if needed).
+        * `OnlyPretranslated`: Only the pretranslated text is returned; all existing text in the target USFM is removed.
+
+        The source or target book can be used as the USFM template for the pretranslated text. The template can be controlled by the `template` parameter:
+        * `Auto`: The target book is used as the template if it exists; otherwise, the source book is used. **This is the default**.
+        * `Source`: The source book is used as the template.
+        * `Target`: The target book is used as the template.
+
+        The intra-segment USFM markers are handled in the following way:
+        * Each verse and non-verse text segment is stripped of all intra-segment USFM.
+        * Reference (\r) and remark (\rem) markers are not translated but carried through from the source to the target.
+
+        Preserving or stripping different types of USFM markers can be controlled by the `paragraph-marker-behavior`, `embed-behavior`, and `style-marker-behavior` parameters.
+        * `PushToEnd`: The USFM markers (or the entire embed) are preserved and placed at the end of the verse. **This is the default for paragraph markers**.
+        * `TryToPlace`: The USFM markers (or the entire embed) are placed in approximately the right location within the verse. **This option is only available for paragraph markers. Quality of placement may differ from language to language. Only works when `template` is set to `Source`**.
+        * `Strip`: The USFM markers (or the entire embed) are removed. **This is the default for embeds and style markers**.
+
+        Quote normalization behavior is controlled by the `quote-normalization-behavior` parameter options:
+        * `Normalized`: The quotes in the pretranslated USFM are normalized quotes (typically straight quotes: ', ") in the style of the source data. **This is the default**.
+        * `Denormalized`: The quotes in the pretranslated USFM are denormalized into the style of the target data. Quote denormalization may not be successful in all contexts. A remark will be added to the USFM listing the chapters that were successfully denormalized.
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+        The USFM parsing and marker types used are defined here: [this wiki](https://github.com/sillsdev/serval/wiki/USFM-Parsing-and-Translation).
+
+        :param id: The translation engine id
+        :param corpus_id: The corpus id or parallel corpus id
+        :param text_id: The text id
+        :param text_origin: The source[s] of the data to populate the USFM file with.
+        :param template: The source or target book to use as the USFM template.
+        :param paragraph_marker_behavior: The behavior of paragraph markers.
+        :param embed_behavior: The behavior of embed markers.
+        :param style_marker_behavior: The behavior of style markers.
+        :param quotation_mark_behavior: The normalization behavior of quotes.
+
+        :return: The book in USFM format
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/pretranslations/',
+            str(text_id),
+            '/usfm'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_origin is not None:
+            params['text-origin'] = text_origin
+
+        if template is not None:
+            params['template'] = template
+
+        if paragraph_marker_behavior is not None:
+            params['paragraph-marker-behavior'] = paragraph_marker_behavior
+
+        if embed_behavior is not None:
+            params['embed-behavior'] = embed_behavior
+
+        if style_marker_behavior is not None:
+            params['style-marker-behavior'] = style_marker_behavior
+
+        if quotation_mark_behavior is not None:
+            params['quotation-mark-behavior'] = quotation_mark_behavior
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_corpus_pretranslated_usfm'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_add_parallel_corpus(
+            self,
+            id: str,
+            corpus_config: 'TranslationParallelCorpusConfig') -> bytes:
+        """
+        ## Parameters
+        * **`sourceCorpusIds`**: The source corpora associated with the parallel corpus
+        * **`targetCorpusIds`**: The target corpora associated with the parallel corpus
+
+        :param id: The translation engine id
+        :param corpus_config: The corpus configuration (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationParallelCorpusConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_add_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get_all_parallel_corpora(
+            self,
+            id: str) -> List['TranslationParallelCorpus']:
+        """
+        Send a get request to /api/v1/translation/engines/{id}/parallel-corpora.
+
+        :param id: The translation engine id
+
+        :return: The parallel corpora
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_all_parallel_corpora'],
+            url,
+        )
+
+    async def translation_engines_update_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            corpus_config: 'TranslationParallelCorpusUpdateConfig') -> 'TranslationParallelCorpus':
+        """
+        Will completely replace the parallel corpus' file associations. Will not affect jobs already queued or running. Will not affect existing pretranslations until new build is complete.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param corpus_config: The corpus configuration
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[TranslationParallelCorpusUpdateConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_update_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> 'TranslationParallelCorpus':
+        """
+        Send a get request to /api/v1/translation/engines/{id}/parallel-corpora/{parallelCorpusId}.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus configuration
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_parallel_corpus'],
+            url,
+        )
+
+    async def translation_engines_delete_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> bytes:
+        """
+        Removing a parallel corpus will remove all pretranslations associated with that corpus.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus was deleted successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_delete_parallel_corpus'],
+            url,
+        )
+
+    async def translation_engines_get_all_pretranslations(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: Optional[str] = None) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Pretranslations can be filtered by text id if provided.
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id (optional)
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_all_pretranslations'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_get_pretranslations_by_text_id(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: str) -> List['Pretranslation']:
+        """
+        Pretranslations are arranged in a list of dictionaries with the following fields per pretranslation:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`translation`**: the text of the pretranslation
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id
+
+        :return: The pretranslations
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations/',
+            str(text_id)])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_pretranslations_by_text_id'],
+            url,
+        )
+
+    async def translation_engines_get_pretranslated_usfm(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            text_id: str,
+            text_origin: Optional[str] = None,
+            template: Optional[str] = None,
+            paragraph_marker_behavior: Optional[str] = None,
+            embed_behavior: Optional[str] = None,
+            style_marker_behavior: Optional[str] = None,
+            quotation_mark_behavior: Optional[str] = None) -> str:
+        r"""
+        The text that populates the USFM structure can be controlled by the `text-origin` parameter:
+        * `PreferExisting`: The existing and pretranslated texts are merged into the USFM, preferring existing text. **This is the default**.
+        * `PreferPretranslated`: The existing and pretranslated texts are merged into the USFM, preferring pretranslated text.
+        * `OnlyExisting`: Return the existing target USFM file with no modifications (except updating the USFM id if needed).
+        * `OnlyPretranslated`: Only the pretranslated text is returned; all existing text in the target USFM is removed.
+
+        The source or target book can be used as the USFM template for the pretranslated text. The template can be controlled by the `template` parameter:
+        * `Auto`: The target book is used as the template if it exists; otherwise, the source book is used. **This is the default**.
+        * `Source`: The source book is used as the template.
+        * `Target`: The target book is used as the template.
+
+        The intra-segment USFM markers are handled in the following way:
+        * Each verse and non-verse text segment is stripped of all intra-segment USFM.
+        * Reference (\r) and remark (\rem) markers are not translated but carried through from the source to the target.
+
+        Preserving or stripping different types of USFM markers can be controlled by the `paragraph-marker-behavior`, `embed-behavior`, and `style-marker-behavior` parameters.
+        * `PushToEnd`: The USFM markers (or the entire embed) are preserved and placed at the end of the verse. **This is the default for paragraph markers and embeds**.
+        * `TryToPlace`: The USFM markers (or the entire embed) are placed in approximately the right location within the verse. **This option is only available for paragraph markers. Quality of placement may differ from language to language.**.
+        * `Strip`: The USFM markers (or the entire embed) are removed. **This is the default for style markers**.
+
+        Quote normalization behavior is controlled by the `quote-normalization-behavior` parameter options:
+        * `Normalized`: The quotes in the pretranslated USFM are normalized quotes (typically straight quotes: ', ") in the style of the source data. **This is the default**.
+        * `Denormalized`: The quotes in the pretranslated USFM are denormalized into the style of the target data. Quote denormalization may not be successful in all contexts. A remark will be added to the USFM listing the chapters that were successfully denormalized.
+
+        Only pretranslations for the most recent successful build of the engine are returned.
+        The USFM parsing and marker types used are defined here: [this wiki](https://github.com/sillsdev/serval/wiki/USFM-Parsing-and-Translation).
+
+        :param id: The translation engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param text_id: The text id
+        :param text_origin: The source[s] of the data to populate the USFM file with.
+        :param template: The source or target book to use as the USFM template.
+        :param paragraph_marker_behavior: The behavior of paragraph markers.
+        :param embed_behavior: The behavior of embed markers.
+        :param style_marker_behavior: The behavior of style markers.
+        :param quotation_mark_behavior: The normalization behavior of quotes.
+
+        :return: The book in USFM format
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id),
+            '/pretranslations/',
+            str(text_id),
+            '/usfm'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_origin is not None:
+            params['text-origin'] = text_origin
+
+        if template is not None:
+            params['template'] = template
+
+        if paragraph_marker_behavior is not None:
+            params['paragraph-marker-behavior'] = paragraph_marker_behavior
+
+        if embed_behavior is not None:
+            params['embed-behavior'] = embed_behavior
+
+        if style_marker_behavior is not None:
+            params['style-marker-behavior'] = style_marker_behavior
+
+        if quotation_mark_behavior is not None:
+            params['quotation-mark-behavior'] = quotation_mark_behavior
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_pretranslated_usfm'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_get_all_builds(
+            self,
+            id: str) -> List['TranslationBuild']:
+        """
+        Send a get request to /api/v1/translation/engines/{id}/builds.
+
+        :param id: The translation engine id
+
+        :return: The build jobs
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/builds'])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_all_builds'],
+            url,
+        )
+
+    async def translation_engines_start_build(
+            self,
+            id: str,
+            build_config: 'TranslationBuildConfig') -> bytes:
+        """
+        Specify the corpora and text ids/scripture ranges within those corpora to train on. Only one type of corpus may be used: either (legacy) corpora (see /translation/engines/{id}/corpora) or parallel corpora (see /translation/engines/{id}/parallel-corpora).
+        Specifying a corpus:
+        * A (legacy) corpus is selected by specifying `corpusId` and a parallel corpus is selected by specifying `parallelCorpusId`.
+        * A parallel corpus can be further filtered by specifying particular corpusIds in `sourceFilters` or `targetFilters`.
+
+        Filtering by text id or chapter:
+        * Paratext projects can be filtered by [book using the `textIds`](https://github.com/sillsdev/libpalaso/blob/master/SIL.Scripture/Canon.cs).
+        * Filters can also be supplied via the `scriptureRange` parameter as ranges of biblical text. See [here](https://github.com/sillsdev/serval/wiki/Filtering-Paratext-Project-Data-with-a-Scripture-Range).
+        * All Paratext project filtering follows original versification. See [here](https://github.com/sillsdev/serval/wiki/Versification-in-Serval) for more information.
+
+        Filter - train on all or none
+        * If `trainOn` or `pretranslate` is not provided, all corpora will be used for training or pretranslation respectively
+        * If a corpus is selected for training or pretranslation and neither `scriptureRange` nor `textIds` is defined, all of the selected corpus will be used.
+        * If a corpus is selected for training or pretranslation and an empty `scriptureRange` or `textIds` is defined, none of the selected corpus will be used.
+        * If a corpus is selected for training or pretranslation but no further filters are provided, all selected corpora will be used for training or pretranslation respectively.
+
+        Specify the corpora and text ids/scripture ranges within those corpora to pretranslate. When a corpus is selected for pretranslation,
+        the following text will be pretranslated:
+        * Text segments that are in the source but do not exist in the target.
+        * Text segments that are in the source and the target, but because of `trainOn` filtering, have not been trained on.
+        If the engine does not support pretranslation, these fields have no effect.
+        Pretranslating uses the same filtering as training.
+
+        The `options` parameter of the build config provides the ability to pass build configuration parameters as a JSON object.
+        See [nmt job settings documentation](https://github.com/sillsdev/serval/wiki/NMT-Build-Options) about configuring job parameters.
+        See [smt-transfer job settings documentation](https://github.com/sillsdev/serval/wiki/SMT-Transfer-Build-Options) about configuring job parameters.
+        See [keyterms parsing documentation](https://github.com/sillsdev/serval/wiki/Paratext-Key-Terms-Parsing) on how to use keyterms for training.
+
+        Note that when using a parallel corpus:
+        * If, within a single parallel corpus, multiple source corpora have data for the same text ids (for text files or Paratext Projects) or books (for Paratext Projects only using the scripture range), those sources will be mixed where they overlap by randomly choosing from each source per line/verse.
+        * If, within a single parallel corpus, multiple target corpora have data for the same text ids (for text files or Paratext Projects) or books (for Paratext Projects only using the scripture range), only the first of the targets that includes that text id/book will be used for that text id/book.
+
+        :param id: The translation engine id
+        :param build_config: The build config (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/builds'])
+
+        data = self._to_jsonable(
+            build_config,
+            expected=[TranslationBuildConfig])
+
+        return await self._call(
+            OPERATIONS['translation_engines_start_build'],
+            url,
+            json=data,
+        )
+
+    async def translation_engines_get_build(
+            self,
+            id: str,
+            build_id: str,
+            min_revision: Optional[int] = None) -> 'TranslationBuild':
+        """
+        If the `minRevision` is not defined, the current build, at whatever state it is,
+        will be immediately returned.  If `minRevision` is defined, Serval will wait for
+        up to 40 seconds for the engine to build to the `minRevision` specified, else
+        will timeout.
+        A use case is to actively query the state of the current build, where the subsequent
+        request sets the `minRevision` to the returned `revision` + 1 and timeouts are handled gracefully.
+        This method should use request throttling.
+        Note: Within the returned build, progress is a value between 0 and 1.
+
+        :param id: The translation engine id
+        :param build_id: The build job id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/builds/',
+            str(build_id)])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_build'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_get_current_build(
+            self,
+            id: str,
+            min_revision: Optional[int] = None) -> 'TranslationBuild':
+        """
+        See documentation on endpoint /translation/engines/{id}/builds/{id} - "Get a Build Job" for details on using `minRevision`.
+
+        :param id: The translation engine id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/current-build'])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_current_build'],
+            url,
+            params=params,
+        )
+
+    async def translation_engines_cancel_build(
+            self,
+            id: str) -> 'TranslationBuild':
+        """
+        Send a post request to /api/v1/translation/engines/{id}/current-build/cancel.
+
+        :param id: The translation engine id
+
+        :return: The build job was cancelled successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/current-build/cancel'])
+
+        return await self._call(
+            OPERATIONS['translation_engines_cancel_build'],
+            url,
+        )
+
+    async def translation_engines_get_model_download_url(
+            self,
+            id: str) -> 'ModelDownloadURL':
+        """
+        If an nmt build was successful and `isModelPersisted` is `true` for the engine,
+        then the model from the most recent successful build can be downloaded.
+
+        The endpoint will return a URL that can be used to download the model for up to 1 hour
+        after the request is made.  If the URL is not used within that time, a new request will need to be made.
+
+        The download itself is created by g-zipping together the folder containing the fine tuned model
+        with all necessary supporting files.  This zipped folder is then named by the pattern:
+         * <engine_id>_<model_revision>.tar.gz
+
+        :param id: The translation engine id
+
+        :return: The url to download the model.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engines/',
+            str(id),
+            '/model-download-url'])
+
+        return await self._call(
+            OPERATIONS['translation_engines_get_model_download_url'],
+            url,
+        )
+
+    async def translation_engine_types_get_queue(
+            self,
+            engine_type: str) -> 'Queue':
+        """
+        Send a get request to /api/v1/translation/engine-types/{engineType}/queues.
+
+        :param engine_type: A valid engine type: smt-transfer, nmt, or echo
+
+        :return: Queue information for the specified engine type
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engine-types/',
+            str(engine_type),
+            '/queues'])
+
+        return await self._call(
+            OPERATIONS['translation_engine_types_get_queue'],
+            url,
+        )
+
+    async def translation_engine_types_get_language_info(
+            self,
+            engine_type: str,
+            language: str) -> 'LanguageInfo':
+        """
+        This endpoint exists primarily to support `nmt` model-training since `echo` and `smt-transfer` engines support all languages equally. Given a language tag, it provides the ISO 639-3 code that the tag maps to internally
+        and whether it is supported in the NLLB 200 model without training.  This is useful for determining if a language is a good candidate for a source language.
+        **Base Models available**
+        * **NLLB-200**: This is the only base NMT translation model currently available.
+          * The languages supported by the base model can be found [here](https://github.com/facebookresearch/flores/blob/main/nllb_seed/README.md).
+        Response format:
+        * **`engineType`**: See above
+        * **`isNative`**: Whether the base translation model supports this language without fine-tuning.
+        * **`internalCode`**: The translation model's internal language code. See more details about how the language tag is mapped to an internal code [here](https://github.com/sillsdev/serval/wiki/FLORES%E2%80%90200-Language-Code-Resolution-for-NMT-Engine).
+
+        :param engine_type: A valid engine type: nmt, echo, or smt-transfer
+        :param language: The language to retrieve information on.
+
+        :return: Language information for the specified engine type
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/translation/engine-types/',
+            str(engine_type),
+            '/languages/',
+            str(language)])
+
+        return await self._call(
+            OPERATIONS['translation_engine_types_get_language_info'],
+            url,
+        )
+
+    async def webhooks_get_all(self) -> List['Webhook']:
+        """
+        Send a get request to /api/v1/hooks.
+
+        :return: The webhooks.
+        """
+        url = self.url_prefix + '/api/v1/hooks'
+
+        return await self._call(
+            OPERATIONS['webhooks_get_all'],
+            url,
+        )
+
+    async def webhooks_create(
+            self,
+            hook_config: 'WebhookConfig') -> bytes:
+        """
+        Send a post request to /api/v1/hooks.
+
+        :param hook_config: The webhook configuration.
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/hooks'
+
+        data = self._to_jsonable(
+            hook_config,
+            expected=[WebhookConfig])
+
+        return await self._call(
+            OPERATIONS['webhooks_create'],
+            url,
+            json=data,
+        )
+
+    async def webhooks_get(
+            self,
+            id: str) -> 'Webhook':
+        """
+        Send a get request to /api/v1/hooks/{id}.
+
+        :param id: The webhook id.
+
+        :return: The webhook.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/hooks/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['webhooks_get'],
+            url,
+        )
+
+    async def webhooks_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/hooks/{id}.
+
+        :param id: The webhook id.
+
+        :return: The webhook was successfully deleted.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/hooks/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['webhooks_delete'],
+            url,
+        )
+
+    async def word_alignment_engines_get_all(self) -> List['WordAlignmentEngine']:
+        """
+        Send a get request to /api/v1/word-alignment/engines.
+
+        :return: The engines
+        """
+        url = self.url_prefix + '/api/v1/word-alignment/engines'
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_all'],
+            url,
+        )
+
+    async def word_alignment_engines_create(
+            self,
+            engine_config: 'WordAlignmentEngineConfig') -> bytes:
+        """
+        ## Parameters
+        * **`name`**: (optional) A name to help identify and distinguish the file.
+          * Recommendation: Create a multi-part name to distinguish between projects, uses, etc.
+          * The name does not have to be unique, as the engine is uniquely identified by the auto-generated id
+        * **`sourceLanguage`**: The source language code (a valid [IETF language tag](https://en.wikipedia.org/wiki/IETF_language_tag) is recommended)
+        * **`targetLanguage`**: The target language code (a valid IETF language tag is recommended)
+        * **type**: **`statistical`** or **`echo-word-alignment`**
+        ### statistical
+        The Statistical engine is based off of the [Thot library](https://github.com/sillsdev/thot) and contains IBM-1, IBM-2, IBM-3, IBM-4, FastAlign and HMM algorithms.
+        ### echo-word-alignment
+        The echo-word-alignment engine has full coverage of all endpoints. Endpoints like create and build return empty responses.
+        Endpoints like align echo the sent content back to the user in the proper format. This engine is useful for debugging and testing purposes.
+        ## Sample request:
+
+            {
+              "name": "myTeam:myProject:myEngine",
+              "sourceLanguage": "el",
+              "targetLanguage": "en",
+              "type": "statistical"
+            }
+
+        :param engine_config: The engine configuration (see above)
+
+        :return:
+        """
+        url = self.url_prefix + '/api/v1/word-alignment/engines'
+
+        data = self._to_jsonable(
+            engine_config,
+            expected=[WordAlignmentEngineConfig])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_create'],
+            url,
+            json=data,
+        )
+
+    async def word_alignment_engines_get(
+            self,
+            id: str) -> 'WordAlignmentEngine':
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}.
+
+        :param id: The engine id
+
+        :return: The engine
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get'],
+            url,
+        )
+
+    async def word_alignment_engines_delete(
+            self,
+            id: str) -> bytes:
+        """
+        Send a delete request to /api/v1/word-alignment/engines/{id}.
+
+        :param id: The engine id
+
+        :return: The engine was successfully deleted.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id)])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_delete'],
+            url,
+        )
+
+    async def word_alignment_engines_align(
+            self,
+            id: str,
+            word_alignment_request: 'WordAlignmentRequest') -> 'WordAlignmentResult':
+        """
+        Send a post request to /api/v1/word-alignment/engines/{id}/align.
+
+        :param id: The engine id
+        :param word_alignment_request: The source and target segment
+
+        :return: The word alignment result
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/align'])
+
+        data = self._to_jsonable(
+            word_alignment_request,
+            expected=[WordAlignmentRequest])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_align'],
+            url,
+            json=data,
+        )
+
+    async def word_alignment_engines_add_parallel_corpus(
+            self,
+            id: str,
+            corpus_config: 'WordAlignmentParallelCorpusConfig') -> bytes:
+        """
+        ## Parameters
+        * **`sourceCorpusIds`**: The source corpora associated with the parallel corpus
+        * **`targetCorpusIds`**: The target corpora associated with the parallel corpus
+
+        :param id: The engine id
+        :param corpus_config: The corpus configuration (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[WordAlignmentParallelCorpusConfig])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_add_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    async def word_alignment_engines_get_all_parallel_corpora(
+            self,
+            id: str) -> List['WordAlignmentParallelCorpus']:
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}/parallel-corpora.
+
+        :param id: The engine id
+
+        :return: The parallel corpora
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora'])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_all_parallel_corpora'],
+            url,
+        )
+
+    async def word_alignment_engines_update_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str,
+            corpus_config: 'WordAlignmentParallelCorpusUpdateConfig') -> 'WordAlignmentParallelCorpus':
+        """
+        Will completely replace the parallel corpus' file associations. Will not affect jobs already queued or running. Will not affect existing word graphs until new build is complete.
+
+        :param id: The engine id
+        :param parallel_corpus_id: The parallel corpus id
+        :param corpus_config: The corpus configuration
+
+        :return: The corpus was updated successfully
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        data = self._to_jsonable(
+            corpus_config,
+            expected=[WordAlignmentParallelCorpusUpdateConfig])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_update_parallel_corpus'],
+            url,
+            json=data,
+        )
+
+    async def word_alignment_engines_get_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> 'WordAlignmentParallelCorpus':
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}/parallel-corpora/{parallelCorpusId}.
+
+        :param id: The engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus configuration
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_parallel_corpus'],
+            url,
+        )
+
+    async def word_alignment_engines_delete_parallel_corpus(
+            self,
+            id: str,
+            parallel_corpus_id: str) -> bytes:
+        """
+        Removing a parallel corpus will remove all word alignments associated with that corpus.
+
+        :param id: The engine id
+        :param parallel_corpus_id: The parallel corpus id
+
+        :return: The parallel corpus was deleted successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/parallel-corpora/',
+            str(parallel_corpus_id)])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_delete_parallel_corpus'],
+            url,
+        )
+
+    async def word_alignment_engines_get_all_word_alignments(
+            self,
+            id: str,
+            corpus_id: str,
+            text_id: Optional[str] = None) -> List['WordAlignment']:
+        """
+        Word alignments are arranged in a list of dictionaries with the following fields per word alignment:
+        * **`textId`**: The text id of the source file defined when the corpus was created.
+        * **`refs`** (a list of strings): A list of references including:
+          * The references defined in the source file per line, if any.
+          * An auto-generated reference of `[textId]:[lineNumber]`, 1 indexed.
+        * **`sourceTokens`**: the tokenized source segment
+        * **`targetTokens`**: the tokenized target segment
+        * **`alignment`**: a list of aligned word pairs with associated scores
+
+        Word alignments can be filtered by text id if provided.
+        Only word alignments for the most recent successful build of the engine are returned.
+
+        :param id: The engine id
+        :param corpus_id: The corpus id
+        :param text_id: The text id (optional)
+
+        :return: The word alignments
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/corpora/',
+            str(corpus_id),
+            '/word-alignments'])
+
+        params = {}  # type: Dict[str, str]
+
+        if text_id is not None:
+            params['text-id'] = text_id
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_all_word_alignments'],
+            url,
+            params=params,
+        )
+
+    async def word_alignment_engines_get_all_builds(
+            self,
+            id: str) -> List['WordAlignmentBuild']:
+        """
+        Send a get request to /api/v1/word-alignment/engines/{id}/builds.
+
+        :param id: The engine id
+
+        :return: The build jobs
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/builds'])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_all_builds'],
+            url,
+        )
+
+    async def word_alignment_engines_start_build(
+            self,
+            id: str,
+            build_config: 'WordAlignmentBuildConfig') -> bytes:
+        """
+        Specify the corpora and textIds to train on. If no `trainOn` field is provided, all corpora will be used. Only parallel corpora are supported.
+        Paratext projects can be filtered by [book using the `textIds`](https://github.com/sillsdev/libpalaso/blob/master/SIL.Scripture/Canon.cs).
+        Filters can also be supplied via `scriptureRange` parameter as ranges of biblical text. See [here](https://github.com/sillsdev/serval/wiki/Filtering-Paratext-Project-Data-with-a-Scripture-Range)
+        All Paratext project filtering follows original versification. See [here](https://github.com/sillsdev/serval/wiki/Versification-in-Serval) for more information.
+
+        Specify the corpora or text ids to word align on.
+        When a corpus or text id is selected for word align on, only text segments that are in both the source and the target will be aligned.
+
+        The `options` parameter of the build config provides the ability to pass build configuration parameters as a JSON object.
+        See [statistical alignment job settings documentation](https://github.com/sillsdev/serval/wiki/Statistical-Alignment-Build-Options) about configuring job parameters.
+
+        :param id: The engine id
+        :param build_config: The build config (see remarks)
+
+        :return:
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/builds'])
+
+        data = self._to_jsonable(
+            build_config,
+            expected=[WordAlignmentBuildConfig])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_start_build'],
+            url,
+            json=data,
+        )
+
+    async def word_alignment_engines_get_build(
+            self,
+            id: str,
+            build_id: str,
+            min_revision: Optional[int] = None) -> 'WordAlignmentBuild':
+        """
+        If the `minRevision` is not defined, the current build, at whatever state it is,
+        will be immediately returned.  If `minRevision` is defined, Serval will wait for
+        up to 40 seconds for the engine to build to the `minRevision` specified, else
+        will timeout.
+        A use case is to actively query the state of the current build, where the subsequent
+        request sets the `minRevision` to the returned `revision` + 1 and timeouts are handled gracefully.
+        This method should use request throttling.
+        Note: Within the returned build, progress is a value between 0 and 1.
+
+        :param id: The engine id
+        :param build_id: The build job id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/builds/',
+            str(build_id)])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_build'],
+            url,
+            params=params,
+        )
+
+    async def word_alignment_engines_get_current_build(
+            self,
+            id: str,
+            min_revision: Optional[int] = None) -> 'WordAlignmentBuild':
+        """
+        See documentation on endpoint /word-alignment/engines/{id}/builds/{id} - "Get a Build Job" for details on using `minRevision`.
+
+        :param id: The engine id
+        :param min_revision: The minimum revision
+
+        :return: The build job
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/current-build'])
+
+        params = {}  # type: Dict[str, str]
+
+        if min_revision is not None:
+            params['min-revision'] = json.dumps(min_revision)
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_get_current_build'],
+            url,
+            params=params,
+        )
+
+    async def word_alignment_engines_cancel_build(
+            self,
+            id: str) -> 'WordAlignmentBuild':
+        """
+        Send a post request to /api/v1/word-alignment/engines/{id}/current-build/cancel.
+
+        :param id: The engine id
+
+        :return: The build job was cancelled successfully.
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engines/',
+            str(id),
+            '/current-build/cancel'])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engines_cancel_build'],
+            url,
+        )
+
+    async def word_alignment_engine_types_get_queue(
+            self,
+            engine_type: str) -> 'Queue':
+        """
+        Send a get request to /api/v1/word-alignment/engine-types/{engineType}/queues.
+
+        :param engine_type: A valid engine type: statistical or echo-word-alignment
+
+        :return: Queue information for the specified engine type
+        """
+        url = "".join([
+            self.url_prefix,
+            '/api/v1/word-alignment/engine-types/',
+            str(engine_type),
+            '/queues'])
+
+        return await self._call(
+            OPERATIONS['word_alignment_engine_types_get_queue'],
+            url,
+        )
@@ -0,0 +1,919 @@
+#!/usr/bin/env python3
+"""
+Hand-written machinery of the Serval client.
+
+`serval_client_module` is generated by swagger_to; everything here is maintained by hand and is
+used by the `RemoteCaller` of `serval_client`: streaming of request and response bodies,
+batching, the result cache, JSON codecs, retries with a circuit breaker, trusted conversion,
+the description of the operations and request metrics. None of it depends on the generated
+model classes.
+"""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import asyncio
+import codecs
+import collections
+import email.utils
+import inspect
+import json
+import os
+import random
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+import typing
+from typing import Any, Awaitable, BinaryIO, Callable, Collection, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import requests
+import urllib3.fields
+
+
+# Size of the chunks in which streamed request and response bodies are transferred.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _iter_multipart(
+        data: Dict[str, str],
+        files: Dict[str, BinaryIO],
+        boundary: str,
+        chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Generates a multipart/form-data body, reading the files in chunks.
+
+    `requests` reads uploaded files into memory as a whole, which does not scale to large files.
+    A generator body is sent with chunked transfer encoding instead.
+
+    :param data: form fields
+    :param files: files to upload by field name
+    :param boundary: multipart boundary
+    :param chunk_size: number of bytes read from a file at a time
+    :return: iterator over the parts of the body
+    """
+    for name, value in data.items():
+        field = urllib3.fields.RequestField(name=name, data=value)
+        field.make_multipart()
+        yield '--{}\r\n{}'.format(boundary, field.render_headers()).encode('utf-8')
+        yield value.encode('utf-8') + b'\r\n'
+
+    for name, file in files.items():
+        # Same filename as `requests` would send.
+        filename = getattr(file, 'name', None)
+        if isinstance(filename, str) and filename and filename[0] != '<' and filename[-1] != '>':
+            filename = os.path.basename(filename)
+        else:
+            filename = name
+
+        field = urllib3.fields.RequestField(name=name, data=b'', filename=filename)
+        field.make_multipart(content_type='application/octet-stream')
+        yield '--{}\r\n{}'.format(boundary, field.render_headers()).encode('utf-8')
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        yield b'\r\n'
+
+    yield '--{}--\r\n'.format(boundary).encode('utf-8')
+
+
+class _JsonArrayParser:
+    """
+    Incrementally parses the elements of a top-level JSON array.
+
+    Chunks of the response body are fed as they arrive, and every element that is complete
+    is returned right away, so only the current element needs to be held in memory.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Feeds the next chunk of the body.
+
+        :param chunk: raw bytes of the body
+        :return: the elements completed by this chunk
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signals the end of the body.
+
+        :return: the remaining elements
+        """
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        items = self._parse(final=True)
+        if not self._finished:
+            raise ValueError('Unexpected end of the JSON array.')
+        return items
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []  # type: List[Any]
+        buf = self._buffer
+        pos = 0
+        while not self._finished:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos == len(buf):
+                break
+
+            if not self._started:
+                if buf[pos] != '[':
+                    raise ValueError('Expected a JSON array, but got: {!r}'.format(buf[pos:pos + 20]))
+                self._started = True
+                pos += 1
+                continue
+
+            if buf[pos] == ']':
+                self._finished = True
+                pos += 1
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+
+            # A scalar that is not followed by a delimiter might continue in the next chunk.
+            if end == len(buf) or buf[end] not in ' \t\r\n,]':
+                if final:
+                    raise ValueError('Unexpected end of the JSON array.')
+                break
+
+            items.append(item)
+            pos = end
+
+        self._buffer = buf[pos:]
+        return items
+
+
+def _iter_json_array(resp: requests.Response, chunk_size: int) -> Iterator[Any]:
+    """
+    Iterates over the elements of the JSON array streamed in the response body.
+
+    :param resp: response opened with `stream=True`
+    :param chunk_size: number of bytes read from the body at a time
+    :return: iterator over the parsed elements
+    """
+    parser = _JsonArrayParser()
+    for chunk in resp.iter_content(chunk_size=chunk_size):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class SegmentResult:
+    """Outcome of one segment of a batched call such as `translation_engines_translate_many`."""
+
+    def __init__(
+            self,
+            segment: str,
+            result: Any = None,
+            error: Optional[Exception] = None,
+            latency: float = 0.0) -> None:
+        """Initializes with the given values."""
+        # The source segment
+        self.segment = segment
+
+        # The result of the call, or None if it failed
+        self.result = result
+
+        # The exception raised by the call, or None if it succeeded
+        self.error = error
+
+        # Seconds from sending the request until the result was converted
+        self.latency = latency
+
+    @property
+    def ok(self) -> bool:
+        """Tells whether the call for this segment succeeded."""
+        return self.error is None
+
+
+def _call_segment(call: Callable[[str], Any], segment: str) -> SegmentResult:
+    start = time.perf_counter()
+    try:
+        result = call(segment)
+    except Exception as e:
+        return SegmentResult(segment, error=e, latency=time.perf_counter() - start)
+    return SegmentResult(segment, result=result, latency=time.perf_counter() - start)
+
+
+def _call_many(
+        call: Callable[[str], Any],
+        segments: Sequence[str],
+        concurrency: int) -> List[SegmentResult]:
+    """
+    Calls `call` for every segment with up to `concurrency` requests in flight.
+
+    :param call: issues the request for a single segment
+    :param segments: the source segments
+    :param concurrency: maximum number of requests in flight
+    :return: one result per segment, in the order of the segments
+    """
+    if concurrency <= 1 or len(segments) <= 1:
+        return [_call_segment(call, segment) for segment in segments]
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(segments))) as executor:
+        return list(executor.map(lambda segment: _call_segment(call, segment), segments))
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of translation results and word graphs, shared by a RemoteCaller.
+
+    Entries are keyed by the model revision of the engine, which is looked up at most once per
+    `revision_ttl` seconds, so results of an older model are not returned once a newer build has
+    been noticed. Until then, i.e. for up to `revision_ttl` seconds after a build completed,
+    results of the previous model can still be returned, unless the build is followed with a
+    `serval_build_watcher.BuildWatcher`, which drops the entries of the engine as soon as it sees
+    the build complete. Training a segment through the caller drops the entries of that engine
+    as well. Cached results are shared between callers and must not be modified.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            ttl: Optional[float] = 600.0,
+            revision_ttl: float = 30.0) -> None:
+        """
+        Initializes an empty cache.
+
+        :param maxsize: maximum number of results kept
+        :param ttl: seconds a result is kept, or None to keep it until evicted
+        :param revision_ttl: seconds the model revision of an engine is trusted before it is fetched again
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.revision_ttl = revision_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict[Hashable, Tuple[float, Any]]
+        self._revisions = {}  # type: Dict[str, Tuple[float, int]]
+        # Bumped on invalidation, so that results of requests already in flight are not reused.
+        self._generations = {}  # type: Dict[str, int]
+
+    def known_version(self, engine_id: str) -> Tuple[Optional[int], int]:
+        """
+        Returns what is known locally about the version of the engine.
+
+        :param engine_id: the engine id
+        :return: the model revision, or None if it is not known or has expired, and the number of
+            local invalidations of the engine
+        """
+        now = time.monotonic()
+        with self._lock:
+            known = self._revisions.get(engine_id)
+            generation = self._generations.get(engine_id, 0)
+        if known is not None and known[0] > now:
+            return known[1], generation
+        return None, generation
+
+    def record_revision(self, engine_id: str, revision: int) -> None:
+        """Remembers the model revision fetched from the server, dropping results of older models."""
+        with self._lock:
+            known = self._revisions.get(engine_id)
+            self._revisions[engine_id] = (time.monotonic() + self.revision_ttl, revision)
+            if known is not None and known[1] != revision:
+                self._drop_engine(engine_id)
+
+    def engine_version(self, engine_id: str, fetch: Callable[[], int]) -> Tuple[int, int]:
+        """
+        Returns the version of the engine that cache keys are built from.
+
+        :param engine_id: the engine id
+        :param fetch: returns the current model revision of the engine from the server
+        :return: the model revision, calling `fetch` if it is not known or has expired, and the
+            number of local invalidations of the engine
+        """
+        revision, generation = self.known_version(engine_id)
+        if revision is None:
+            revision = fetch()
+            self.record_revision(engine_id, revision)
+        return revision, generation
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Looks up a result and counts the hit or miss.
+
+        :param key: cache key
+        :return: whether the key was found, and the cached result
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores a result, evicting the least recently used ones beyond `maxsize`."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _drop_engine(self, engine_id: str) -> None:
+        # Keys start with the engine id, see RemoteCaller._cached in serval_client.
+        for key in [key for key in self._entries if key[0] == engine_id]:
+            del self._entries[key]
+
+    def invalidate_engine(self, engine_id: str) -> None:
+        """Drops the results and the known model revision of the engine."""
+        with self._lock:
+            self._revisions.pop(engine_id, None)
+            self._generations[engine_id] = self._generations.get(engine_id, 0) + 1
+            self._drop_engine(engine_id)
+
+    def clear(self) -> None:
+        """Drops all results and revisions; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._revisions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit and miss counters and the number of cached results."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+class JsonCodec:
+    """Encodes request bodies to and decodes response bodies from JSON bytes."""
+
+    def __init__(
+            self,
+            name: str,
+            loads: Callable[[bytes], Any],
+            dumps: Callable[[Any], bytes]) -> None:
+        """Initializes with the given values."""
+        self.name = name
+
+        # Parses the raw body bytes
+        self.loads = loads
+
+        # Serializes to UTF-8 encoded bytes
+        self.dumps = dumps
+
+
+def _stdlib_json_codec() -> JsonCodec:
+    return JsonCodec(
+        'json',
+        json.loads,
+        lambda obj: json.dumps(obj, allow_nan=False).encode('utf-8'))
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    return JsonCodec('orjson', orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec.json
+
+    return JsonCodec('msgspec', msgspec.json.decode, msgspec.json.encode)
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson
+
+    return JsonCodec(
+        'ujson',
+        ujson.loads,
+        lambda obj: ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8'))
+
+
+# Codec factories by name, fastest first.
+_JSON_CODECS = collections.OrderedDict([
+    ('orjson', _orjson_codec),
+    ('msgspec', _msgspec_codec),
+    ('ujson', _ujson_codec),
+    ('json', _stdlib_json_codec),
+])  # type: collections.OrderedDict[str, Callable[[], JsonCodec]]
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Returns a JSON codec.
+
+    :param name: one of 'orjson', 'msgspec', 'ujson' or 'json' (the standard library); if None,
+        the fastest installed one is used, falling back to the standard library
+    :return: the codec
+    """
+    if name is not None:
+        if name not in _JSON_CODECS:
+            raise ValueError('Unknown JSON codec {!r}, expected one of: {}'.format(name, ', '.join(_JSON_CODECS)))
+        return _JSON_CODECS[name]()
+
+    for factory in _JSON_CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    raise AssertionError('The standard library codec is always available.')
+
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request if the circuit breaker of the host stays open too long."""
+
+
+class _CircuitBreaker:
+    """
+    Tracks consecutive failures of one host.
+
+    After `failure_threshold` failures in a row the circuit opens and requests are held back.
+    Once `reset_timeout` seconds have passed, a single trial request is let through: if it
+    succeeds the circuit closes, otherwise it opens again.
+    """
+
+    # Seconds between checks of the other requests while the trial request is in flight.
+    TRIAL_POLL_INTERVAL = 0.5
+
+    def __init__(self, host: str, failure_threshold: int, reset_timeout: float) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None  # type: Optional[float]
+        self._trial_in_flight = False
+
+    def wait_time(self) -> float:
+        """
+        Returns how long to wait before asking again, or 0.0 if a request may be sent now.
+
+        :return: seconds until the circuit may let a request through
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            if self._trial_in_flight:
+                return self.TRIAL_POLL_INTERVAL
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0:
+                return remaining
+            self._trial_in_flight = True
+            return 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Lets another trial request through after one ended without an outcome for the host."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+# Methods that can be repeated without changing the result, see RFC 9110, section 9.2.2.
+_IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with exponential backoff and opens a circuit breaker per host.
+
+    Only idempotent requests are retried: GET, HEAD, OPTIONS, PUT and DELETE, plus the
+    read-only POSTs (file downloads, translate, get-word-graph and align). Requests with a streamed body are
+    never retried, since the body cannot be sent again. Every 5xx response and connection
+    error counts as a failure of the host. While its circuit breaker is open, requests wait
+    for it to let them through, for at most `max_circuit_wait` seconds.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 4,
+            backoff_base: float = 0.5,
+            backoff_max: float = 30.0,
+            retry_statuses: Iterable[int] = (429, 502, 503, 504),
+            max_retry_after: float = 120.0,
+            failure_threshold: int = 5,
+            reset_timeout: float = 30.0,
+            max_circuit_wait: float = 60.0) -> None:
+        """
+        Initializes with the given values.
+
+        :param max_attempts: maximum number of times a request is sent
+        :param backoff_base: upper bound in seconds of the first random backoff, doubled on every retry
+        :param backoff_max: upper bound in seconds of any random backoff
+        :param retry_statuses: response status codes that are retried
+        :param max_retry_after: longest wait in seconds that a Retry-After header is followed for
+        :param failure_threshold: consecutive failures of a host that open its circuit breaker
+        :param reset_timeout: seconds an open circuit breaker waits before letting a trial request through
+        :param max_circuit_wait: longest wait in seconds for an open circuit breaker before CircuitOpenError is raised
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_circuit_wait = max_circuit_wait
+        self._lock = threading.Lock()
+        self._breakers = {}  # type: Dict[str, _CircuitBreaker]
+
+    def _breaker(self, url: str) -> _CircuitBreaker:
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = _CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def backoff(self, attempt: int) -> float:
+        """Returns a random delay before the given retry (full jitter)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def retry_after(self, resp: Any) -> Optional[float]:
+        """Returns the delay requested by the Retry-After header of the response, if any."""
+        value = resp.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                date = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            delay = date.timestamp() - time.time()
+        return min(max(delay, 0.0), self.max_retry_after)
+
+    def retryable(self, method: str, idempotent: Optional[bool], body: Any) -> bool:
+        """
+        Tells whether a request may be sent again.
+
+        :param method: HTTP method
+        :param idempotent: whether the request may be repeated; if None, it is derived from the method
+        :param body: body of the request; a streamed body cannot be sent again
+        :return: whether failed attempts of the request are retried
+        """
+        if not isinstance(body, (type(None), bytes, str, dict, list, tuple)):
+            return False
+        return idempotent if idempotent is not None else method.upper() in _IDEMPOTENT_METHODS
+
+    def _circuit_wait(self, breaker: _CircuitBreaker, waited: float) -> float:
+        """Returns how long to wait for the circuit breaker, or 0.0 if the request may be sent now."""
+        wait = breaker.wait_time()
+        if wait > 0:
+            if waited >= self.max_circuit_wait:
+                raise CircuitOpenError('The circuit breaker for {} is open.'.format(breaker.host))
+            wait = min(wait, self.max_circuit_wait - waited)
+        return wait
+
+    def _after_error(self, breaker: _CircuitBreaker, retryable: bool, attempt: int) -> Optional[float]:
+        """Records a connection error; returns the delay before the next attempt, or None to give up."""
+        breaker.record_failure()
+        if not retryable or attempt + 1 >= self.max_attempts:
+            return None
+        return self.backoff(attempt)
+
+    def _after_response(
+            self,
+            breaker: _CircuitBreaker,
+            retryable: bool,
+            attempt: int,
+            status: int,
+            resp: Any) -> Optional[float]:
+        """Records a response; returns the delay before the next attempt, or None to return it."""
+        if status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if not retryable or status not in self.retry_statuses or attempt + 1 >= self.max_attempts:
+            return None
+        delay = self.retry_after(resp)
+        return delay if delay is not None else self.backoff(attempt)
+
+    def send(
+            self,
+            session: requests.Session,
+            method: str,
+            url: str,
+            idempotent: Optional[bool] = None,
+            on_attempt: Optional[Callable[[], None]] = None,
+            **kwargs: Any) -> requests.Response:
+        """
+        Sends the request, retrying it according to the policy.
+
+        :param session: session to send the request with
+        :param method: HTTP method
+        :param url: URL of the request
+        :param idempotent: whether the request may be repeated; if None, it is derived from the method
+        :param on_attempt: called every time the request is about to be sent
+        :param kwargs: further arguments of `requests.Session.request`
+        :return: the response of the last attempt
+        """
+        retryable = self.retryable(method, idempotent, kwargs.get('data'))
+        breaker = self._breaker(url)
+        attempt = 0
+        circuit_wait = 0.0
+        while True:
+            wait = self._circuit_wait(breaker, circuit_wait)
+            if wait > 0:
+                time.sleep(wait)
+                circuit_wait += wait
+                continue
+            if on_attempt is not None:
+                on_attempt()
+            try:
+                resp = session.request(method=method, url=url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                delay = self._after_error(breaker, retryable, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+            else:
+                delay = self._after_response(breaker, retryable, attempt, resp.status_code, resp)
+                if delay is None:
+                    return resp
+                resp.close()
+            attempt += 1
+            time.sleep(delay)
+
+    async def send_async(
+            self,
+            send: Callable[[], Awaitable[Any]],
+            url: str,
+            retryable: bool,
+            transient_errors: Tuple[type, ...]) -> Any:
+        """
+        Sends a request of an asyncio client, retrying it according to the policy.
+
+        :param send: sends the request once and returns the `aiohttp.ClientResponse`
+        :param url: URL of the request
+        :param retryable: whether the request may be sent again, see `retryable`
+        :param transient_errors: exceptions of the client that count as connection errors
+        :return: the response of the last attempt
+        """
+        breaker = self._breaker(url)
+        attempt = 0
+        circuit_wait = 0.0
+        while True:
+            wait = self._circuit_wait(breaker, circuit_wait)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                circuit_wait += wait
+                continue
+            try:
+                resp = await send()
+            except transient_errors:
+                delay = self._after_error(breaker, retryable, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+            else:
+                delay = self._after_response(breaker, retryable, attempt, resp.status, resp)
+                if delay is None:
+                    return resp
+                resp.release()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+def _without_none(tp: Any) -> Any:
+    """Returns X for Optional[X], and the type itself otherwise."""
+    if typing.get_origin(tp) is typing.Union:
+        inner_type, = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+        return inner_type
+    return tp
+
+
+def _camel_case(name: str) -> str:
+    return re.sub(r'_([a-z0-9])', lambda match: match.group(1).upper(), name)
+
+
+class TrustedConverters:
+    """
+    Converts parsed JSON to model objects without any checks.
+
+    A converter function is generated for every model class from the type hints of its
+    constructor; the JSON properties are the camel-cased parameter names.
+    """
+
+    def __init__(self, model_types: Collection[type]) -> None:
+        """
+        Initializes with the given values.
+
+        :param model_types: the model classes; the converters are compiled on first use
+        """
+        self._model_types = model_types
+        self._namespace = {}  # type: Dict[str, Any]
+        self._converters = {}  # type: Dict[Tuple[type, ...], Callable[[Any], Any]]
+
+    def _expression(self, tp: Any, value: str, depth: int = 0) -> str:
+        """Returns a Python expression that converts the parsed JSON `value` to `tp`."""
+        if tp is float:
+            return 'float({})'.format(value)
+
+        if tp in (bool, int, str) or tp is Any:
+            return value
+
+        origin = typing.get_origin(tp)
+        if origin is list:
+            item_type, = typing.get_args(tp)
+            if item_type in (bool, int, str):
+                # The parsed list already holds the right values.
+                return value
+            item = 'item{}'.format(depth)
+            return '[{} for {} in {}]'.format(self._expression(item_type, item, depth + 1), item, value)
+
+        if origin is dict:
+            _, value_type = typing.get_args(tp)
+            key, item = 'key{}'.format(depth), 'item{}'.format(depth)
+            return '{{{}: {} for {}, {} in {}.items()}}'.format(
+                key, self._expression(value_type, item, depth + 1), key, item, value)
+
+        if origin is typing.Union:
+            inner = self._expression(_without_none(tp), value, depth)
+            if inner == value:
+                return value
+            return '({} if {} is not None else None)'.format(inner, value)
+
+        if tp in self._model_types:
+            return '_trusted_{}({})'.format(tp.__name__, value)
+
+        raise ValueError('Unexpected type: {}'.format(tp))
+
+    def _compile(self) -> None:
+        """Generates a converter for every model class from its constructor."""
+        namespace = {'Any': Any}  # type: Dict[str, Any]
+        sources = []
+        for cls in self._model_types:
+            namespace[cls.__name__] = cls
+            hints = typing.get_type_hints(cls.__init__)
+            args = []
+            for name, parameter in inspect.signature(cls.__init__).parameters.items():
+                if name == 'self':
+                    continue
+                key = _camel_case(name)
+                if parameter.default is inspect.Parameter.empty:
+                    args.append(self._expression(hints[name], 'obj[{!r}]'.format(key)))
+                else:
+                    # Bind the optional property to a local name, so that it is only looked up once.
+                    local = 'v_{}'.format(name)
+                    expression = self._expression(_without_none(hints[name]), local)
+                    if expression == local:
+                        args.append('obj.get({!r})'.format(key))
+                    else:
+                        args.append('({} if ({} := obj.get({!r})) is not None else None)'.format(
+                            expression, local, key))
+            sources.append('def _trusted_{}(obj):\n    return {}(\n        {})\n'.format(
+                cls.__name__, cls.__name__, ',\n        '.join(args)))
+        exec(compile('\n'.join(sources), '<trusted converters>', 'exec'), namespace)
+        self._namespace.update(namespace)
+
+    def from_obj(self, obj: Any, expected: List[type]) -> Any:
+        """
+        Converts the parsed JSON along the expected types like `from_obj`, but without checking it.
+
+        :param obj: to be converted
+        :param expected: list of types representing the (nested) structure
+        :return: the converted object
+        """
+        key = tuple(expected)
+        converter = self._converters.get(key)
+        if converter is None:
+            if not self._namespace:
+                self._compile()
+            tp = expected[-1]
+            for container in reversed(expected[:-1]):
+                tp = typing.List[tp] if container is list else typing.Dict[str, tp]
+            converter = eval('lambda obj: ' + self._expression(tp, 'obj'), self._namespace)
+            self._converters[key] = converter
+        return converter(obj)
+
+
+class Operation:
+    """
+    A remote call of the API, as described by the generated client.
+
+    :ivar name: name of the client method, e.g. 'translation_engines_translate'
+    :ivar http_method: HTTP method in upper case
+    :ivar url_template: path of the request with the path parameters as camel-cased names in
+        braces, as in the server routes, e.g. '/api/v1/translation/engines/{id}/translate/{n}'
+    :ivar expected: types the response is converted along (see `from_obj`), or None if the
+        body is returned as it is
+    :ivar stream: whether the body is returned as a stream instead of being read
+    """
+
+    __slots__ = ('name', 'http_method', 'url_template', 'expected', 'stream')
+
+    def __init__(
+            self,
+            name: str,
+            http_method: str,
+            url_template: str,
+            expected: Optional[List[Any]],
+            stream: bool = False) -> None:
+        self.name = name
+        self.http_method = http_method
+        self.url_template = url_template
+        self.expected = expected
+        self.stream = stream
+
+    def __repr__(self) -> str:
+        return 'Operation({!r}, {} {})'.format(self.name, self.http_method, self.url_template)
+
+
+class RequestMetrics:
+    """
+    Measurements of one HTTP request made by a RemoteCaller method, as passed to its hooks.
+
+    :ivar method: name of the RemoteCaller method, e.g. 'translation_engines_translate'
+    :ivar url_template: path of the request with the ids replaced by the camel-cased parameter
+        names as in the server routes, e.g. '/api/v1/translation/engines/{id}/translate/{n}'
+    :ivar http_method: HTTP method in upper case
+    :ivar status: status code of the response, or None if no response was received
+    :ivar bytes_out: size of the request body, or None if it was streamed without a known size
+    :ivar bytes_in: size of the response body, or None if it was streamed without a known size
+    :ivar ttfb: seconds from sending the request until the response headers arrived
+    :ivar latency: seconds spent in the method call, including retries and deserialization
+        (for iter_* methods, only the time spent producing items)
+    :ivar deserialize: seconds spent converting the parsed JSON to model objects (0 for the
+        iter_* methods, which convert while streaming)
+    :ivar error: class name of the exception raised by the call, if any
+    :ivar attempts: number of times the request was sent, including retries (0 if it never was,
+        e.g. because the circuit breaker stayed open)
+    """
+
+    __slots__ = ('method', 'url_template', 'http_method', 'status', 'bytes_out', 'bytes_in',
+                 'ttfb', 'latency', 'deserialize', 'error', 'attempts')
+
+    def __init__(
+            self,
+            method: str,
+            url_template: str,
+            http_method: str,
+            status: Optional[int] = None,
+            bytes_out: Optional[int] = None,
+            bytes_in: Optional[int] = None,
+            ttfb: Optional[float] = None,
+            latency: float = 0.0,
+            deserialize: float = 0.0,
+            error: Optional[str] = None,
+            attempts: int = 0) -> None:
+        self.method = method
+        self.url_template = url_template
+        self.http_method = http_method
+        self.status = status
+        self.bytes_out = bytes_out
+        self.bytes_in = bytes_in
+        self.ttfb = ttfb
+        self.latency = latency
+        self.deserialize = deserialize
+        self.error = error
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return 'RequestMetrics({})'.format(', '.join(
+            '{}={!r}'.format(name, getattr(self, name)) for name in self.__slots__))
+
+
+def _body_size(body: Any) -> Optional[int]:
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray, str)):
+        return len(body)
+    return None
+
+
+def _content_length(resp: requests.Response) -> Optional[int]:
+    value = resp.headers.get('Content-Length')
+    return int(value) if value is not None and value.isdigit() else None
@@ -0,0 +1,163 @@
+"""
+Columnar representations of the high-volume models of the Serval client.
+
+Large alignment and word graph listings can be kept as typed arrays instead of model objects;
+see serval_arrays for the NumPy export built on them.
+"""
+
+# pylint: skip-file
+# pydocstyle: add-ignore=D105,D107,D401
+
+import array
+import math
+from typing import Any, Iterable, List, Mapping
+
+from serval_client_module import AlignedWordPair, WordGraphArc
+
+
+class AlignedWordPairColumns:
+    """
+    Columnar representation of aligned word pairs, with one typed array per field.
+
+    Uses a fraction of the memory of the equivalent AlignedWordPair objects. A missing score is
+    stored as NaN.
+    """
+
+    __slots__ = ('source_index', 'target_index', 'score')
+
+    def __init__(self) -> None:
+        """Initializes empty columns."""
+        self.source_index = array.array('i')
+        self.target_index = array.array('i')
+        self.score = array.array('d')
+
+    def __len__(self) -> int:
+        return len(self.source_index)
+
+    def append(self, pair: 'AlignedWordPair') -> None:
+        """Appends the values of the pair."""
+        self.source_index.append(pair.source_index)
+        self.target_index.append(pair.target_index)
+        self.score.append(pair.score if pair.score is not None else math.nan)
+
+    def append_jsonable(self, obj: Mapping[str, Any]) -> None:
+        """Appends a pair from its parsed JSON without creating an AlignedWordPair."""
+        self.source_index.append(obj['sourceIndex'])
+        self.target_index.append(obj['targetIndex'])
+        score = obj.get('score')
+        self.score.append(score if score is not None else math.nan)
+
+    def extend(self, pairs: Iterable['AlignedWordPair']) -> None:
+        """Appends the values of the pairs."""
+        for pair in pairs:
+            self.append(pair)
+
+    def __getitem__(self, index: int) -> 'AlignedWordPair':
+        score = self.score[index]
+        return AlignedWordPair(
+            source_index=self.source_index[index],
+            target_index=self.target_index[index],
+            score=None if math.isnan(score) else score)
+
+    def to_list(self) -> List['AlignedWordPair']:
+        """Converts the columns back to AlignedWordPair objects."""
+        return [self[i] for i in range(len(self))]
+
+    @classmethod
+    def from_list(cls, pairs: Iterable['AlignedWordPair']) -> 'AlignedWordPairColumns':
+        """Creates the columns from AlignedWordPair objects."""
+        columns = cls()
+        columns.extend(pairs)
+        return columns
+
+
+class WordGraphArcColumns:
+    """
+    Columnar representation of word graph arcs.
+
+    Scalar fields are stored in one typed array each. The per-token fields (target tokens,
+    confidences and sources) and the alignments of all arcs are concatenated; the tokens of arc
+    `i` are at `token_offsets[i]:token_offsets[i + 1]` and its aligned pairs at
+    `alignment_offsets[i]:alignment_offsets[i + 1]`.
+    """
+
+    __slots__ = (
+        'prev_state', 'next_state', 'score', 'source_segment_start', 'source_segment_end',
+        'token_offsets', 'target_tokens', 'confidences', 'sources', 'alignment_offsets', 'alignment')
+
+    def __init__(self) -> None:
+        """Initializes empty columns."""
+        self.prev_state = array.array('i')
+        self.next_state = array.array('i')
+        self.score = array.array('d')
+        self.source_segment_start = array.array('i')
+        self.source_segment_end = array.array('i')
+        self.token_offsets = array.array('i', [0])
+        self.target_tokens = []  # type: List[str]
+        self.confidences = array.array('d')
+        self.sources = []  # type: List[List[str]]
+        self.alignment_offsets = array.array('i', [0])
+        self.alignment = AlignedWordPairColumns()
+
+    def __len__(self) -> int:
+        return len(self.prev_state)
+
+    def append(self, arc: 'WordGraphArc') -> None:
+        """Appends the values of the arc."""
+        self.prev_state.append(arc.prev_state)
+        self.next_state.append(arc.next_state)
+        self.score.append(arc.score)
+        self.source_segment_start.append(arc.source_segment_start)
+        self.source_segment_end.append(arc.source_segment_end)
+        self.target_tokens.extend(arc.target_tokens)
+        self.confidences.extend(arc.confidences)
+        self.sources.extend(arc.sources)
+        self.token_offsets.append(len(self.target_tokens))
+        self.alignment.extend(arc.alignment)
+        self.alignment_offsets.append(len(self.alignment))
+
+    def append_jsonable(self, obj: Mapping[str, Any]) -> None:
+        """Appends an arc from its parsed JSON without creating a WordGraphArc."""
+        self.prev_state.append(obj['prevState'])
+        self.next_state.append(obj['nextState'])
+        self.score.append(obj['score'])
+        self.source_segment_start.append(obj['sourceSegmentStart'])
+        self.source_segment_end.append(obj['sourceSegmentEnd'])
+        self.target_tokens.extend(obj['targetTokens'])
+        self.confidences.extend(obj['confidences'])
+        self.sources.extend(obj['sources'])
+        self.token_offsets.append(len(self.target_tokens))
+        for pair in obj['alignment']:
+            self.alignment.append_jsonable(pair)
+        self.alignment_offsets.append(len(self.alignment))
+
+    def extend(self, arcs: Iterable['WordGraphArc']) -> None:
+        """Appends the values of the arcs."""
+        for arc in arcs:
+            self.append(arc)
+
+    def __getitem__(self, index: int) -> 'WordGraphArc':
+        tokens = slice(self.token_offsets[index], self.token_offsets[index + 1])
+        return WordGraphArc(
+            prev_state=self.prev_state[index],
+            next_state=self.next_state[index],
+            score=self.score[index],
+            target_tokens=self.target_tokens[tokens],
+            confidences=self.confidences[tokens].tolist(),
+            source_segment_start=self.source_segment_start[index],
+            source_segment_end=self.source_segment_end[index],
+            alignment=[
+                self.alignment[i]
+                for i in range(self.alignment_offsets[index], self.alignment_offsets[index + 1])],
+            sources=self.sources[tokens])
+
+    def to_list(self) -> List['WordGraphArc']:
+        """Converts the columns back to WordGraphArc objects."""
+        return [self[i] for i in range(len(self))]
+
+    @classmethod
+    def from_list(cls, arcs: Iterable['WordGraphArc']) -> 'WordGraphArcColumns':
+        """Creates the columns from WordGraphArc objects."""
+        columns = cls()
+        columns.extend(arcs)
+        return columns
@@ -0,0 +1,259 @@
+"""
+In-process aggregation of the per-request metrics reported by RemoteCaller hooks.
+
+`MetricsAggregator` is a hook: pass it to `RemoteCaller(hooks=[aggregator])` and every request
+is added to fixed-bucket histograms keyed by client method, route, HTTP method and status.
+The histograms can be printed as a table or exported in the Prometheus text format, e.g. to a
+file read by the node_exporter textfile collector. The latency buckets and the http_route
+labels are those of the server's ASP.NET Core instrumentation (http_server_request_duration_seconds),
+so the client's view of an endpoint can be compared with what the server reports for it.
+"""
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from serval_client_support import RequestMetrics
+
+# The default buckets of the OpenTelemetry HTTP duration histograms.
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0
+)
+# Deserialization is usually much faster than the request, so finer buckets are used for it.
+DESERIALIZE_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, as in the Prometheus exposition format."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        # The last count is the +Inf bucket.
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        i = 0
+        while i < len(self.bounds) and value > self.bounds[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile by linear interpolation within its bucket, like histogram_quantile."""
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count > 0 and seen + count >= rank:
+                if i == len(self.bounds):
+                    # Values above the largest bound are only known to be larger than it.
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Returns the `le` label and cumulative count of every bucket."""
+        result = []
+        total = 0
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            total += count
+            result.append(("+Inf" if bound == math.inf else repr(bound), total))
+        return result
+
+
+class _Series:
+    def __init__(self):
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.ttfb = Histogram(DURATION_BUCKETS)
+        self.deserialize = Histogram(DESERIALIZE_BUCKETS)
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.attempts = 0
+
+
+# method, route, HTTP method, status ("" if no response was received), error
+SeriesKey = Tuple[str, str, str, str, str]
+
+
+def server_route(url_template: str) -> str:
+    """Returns the http_route label the server reports for a request to the URL template."""
+    route = url_template.lstrip("/")
+    if route.startswith("api/v1/"):
+        route = "api/v{version:apiVersion}/" + route[len("api/v1/") :]
+    return route
+
+
+class MetricsAggregator:
+    """RemoteCaller hook that aggregates the request metrics into histograms (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[SeriesKey, _Series] = {}
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        key = (
+            metrics.method,
+            server_route(metrics.url_template),
+            metrics.http_method,
+            str(metrics.status) if metrics.status is not None else "",
+            metrics.error or "",
+        )
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.duration.observe(metrics.latency)
+            if metrics.ttfb is not None:
+                series.ttfb.observe(metrics.ttfb)
+            series.deserialize.observe(metrics.deserialize)
+            series.bytes_out += metrics.bytes_out or 0
+            series.bytes_in += metrics.bytes_in or 0
+            series.attempts += metrics.attempts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def summary(self) -> List[Dict]:
+        """Returns one JSON-able dict per series with the request count, bytes and estimated percentiles."""
+        result = []
+        with self._lock:
+            for (method, route, http_method, status, error), series in sorted(
+                self._series.items()
+            ):
+                entry = {
+                    "method": method,
+                    "route": route,
+                    "httpMethod": http_method,
+                    "status": status,
+                    "error": error,
+                    "requests": series.duration.count,
+                    "attempts": series.attempts,
+                    "bytesOut": series.bytes_out,
+                    "bytesIn": series.bytes_in,
+                    "deserializeMeanMs": round(
+                        series.deserialize.sum / series.deserialize.count * 1000, 3
+                    ),
+                }
+                for name, histogram in (("latency", series.duration), ("ttfb", series.ttfb)):
+                    for label, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+                        entry[f"{name}{label.upper()}Ms"] = round(
+                            histogram.quantile(q) * 1000, 3
+                        )
+                result.append(entry)
+        return result
+
+    def format_table(self) -> str:
+        lines = [
+            f"{'METHOD':<48} {'STATUS':>6} {'COUNT':>7} {'P50 MS':>9} {'P90 MS':>9} "
+            f"{'P99 MS':>9} {'TTFB P50':>9} {'DESER MS':>9} {'KB IN':>9}"
+        ]
+        for entry in self.summary():
+            status = entry["status"] or entry["error"] or "-"
+            lines.append(
+                f"{entry['method']:<48} {status:>6} {entry['requests']:>7} "
+                f"{entry['latencyP50Ms']:>9.1f} {entry['latencyP90Ms']:>9.1f} "
+                f"{entry['latencyP99Ms']:>9.1f} {entry['ttfbP50Ms']:>9.1f} "
+                f"{entry['deserializeMeanMs']:>9.2f} {entry['bytesIn'] / 1024:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def prometheus_text(self, extra_labels: Optional[Dict[str, str]] = None) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        :param extra_labels: labels added to every sample, e.g. {"job": "load-testing"}
+        """
+        families = [
+            (
+                "serval_client_request_duration_seconds",
+                "histogram",
+                "Duration of Serval API calls as seen by the client, including deserialization.",
+                lambda s: s.duration,
+            ),
+            (
+                "serval_client_time_to_first_byte_seconds",
+                "histogram",
+                "Time from sending a request until the response headers arrived.",
+                lambda s: s.ttfb,
+            ),
+            (
+                "serval_client_deserialize_seconds",
+                "histogram",
+                "Time spent converting responses to model objects.",
+                lambda s: s.deserialize,
+            ),
+            (
+                "serval_client_request_attempts_total",
+                "counter",
+                "Number of times the requests were sent, including retries.",
+                lambda s: s.attempts,
+            ),
+            (
+                "serval_client_request_bytes_total",
+                "counter",
+                "Size of the request bodies.",
+                lambda s: s.bytes_out,
+            ),
+            (
+                "serval_client_response_bytes_total",
+                "counter",
+                "Size of the response bodies.",
+                lambda s: s.bytes_in,
+            ),
+        ]
+        with self._lock:
+            series = sorted(self._series.items())
+            lines = []
+            for name, kind, help_text, value in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for (method, route, http_method, status, error), s in series:
+                    labels = {
+                        **(extra_labels or {}),
+                        "method": method,
+                        "http_route": route,
+                        "http_request_method": http_method,
+                        "http_response_status_code": status,
+                        "error_type": error,
+                    }
+                    if kind == "counter":
+                        lines.append(f"{name}{_format_labels(labels)} {value(s)}")
+                        continue
+                    histogram = value(s)
+                    if histogram.count == 0:
+                        continue
+                    for le, count in histogram.cumulative():
+                        lines.append(
+                            f"{name}_bucket{_format_labels({**labels, 'le': le})} {count}"
+                        )
+                    lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_textfile(
+        self, path: str, extra_labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Writes the metrics to a .prom file, replacing it atomically so that readers never see a partial file."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text(extra_labels))
+        os.replace(tmp_path, path)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    # Empty labels are equivalent to missing ones in Prometheus, so they are left out.
+    items = [f'{k}="{_escape_label_value(v)}"' for k, v in labels.items() if v != ""]
+    return "{" + ",".join(items) + "}" if items else ""
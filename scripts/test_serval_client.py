@@ -0,0 +1,88 @@
+import io
+import unittest
+from typing import Any, List
+
+import requests
+import urllib3
+
+from serval_client import RemoteCaller
+from serval_client_support import RequestMetrics, RetryPolicy
+
+
+class ScriptedAdapter(requests.adapters.BaseAdapter):
+    """Answers the requests with the given statuses in turn, streaming `body` with a 200."""
+
+    def __init__(self, statuses: List[int], body: bytes):
+        super().__init__()
+        self.statuses = list(statuses)
+        self.body = body
+        self.requests = []  # type: List[requests.PreparedRequest]
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        self.requests.append(request)
+        status = self.statuses.pop(0)
+        body = self.body if status == 200 else b""
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers["Retry-After"] = "0"
+        resp.raw = urllib3.HTTPResponse(body=io.BytesIO(body), status=status, preload_content=False)
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(adapter: ScriptedAdapter, hooks: Any = None) -> RemoteCaller:
+    session = requests.Session()
+    session.mount("http://", adapter)
+    return RemoteCaller(
+        url_prefix="http://serval.test", session=session, retry_policy=RetryPolicy(), hooks=hooks
+    )
+
+
+class DownloadRetryTest(unittest.TestCase):
+    def test_download_is_retried_after_503(self):
+        adapter = ScriptedAdapter([503, 200], b"\\id MAT")
+        with make_client(adapter).data_files_download("file1") as f:
+            self.assertEqual(f.read(), b"\\id MAT")
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertEqual(adapter.requests[1].method, "POST")
+        self.assertEqual(adapter.requests[1].url, "http://serval.test/api/v1/files/file1/contents")
+
+    def test_download_fails_once_the_attempts_are_used_up(self):
+        adapter = ScriptedAdapter([503] * RetryPolicy().max_attempts, b"")
+        with self.assertRaises(requests.HTTPError):
+            make_client(adapter).data_files_download("file1")
+        self.assertEqual(len(adapter.requests), RetryPolicy().max_attempts)
+
+    def test_create_is_not_retried(self):
+        adapter = ScriptedAdapter([503, 200], b"{}")
+        with self.assertRaises(requests.HTTPError):
+            make_client(adapter).data_files_create(io.BytesIO(b"text"), "Text")
+        self.assertEqual(len(adapter.requests), 1)
+
+
+class MetricsHookTest(unittest.TestCase):
+    def test_attempts_are_counted(self):
+        reported = []  # type: List[RequestMetrics]
+        adapter = ScriptedAdapter([503, 503, 200], b"\\id MAT")
+        with make_client(adapter, hooks=[reported.append]).data_files_download("file1") as f:
+            f.read()
+        self.assertEqual(len(reported), 1)
+        self.assertEqual(reported[0].attempts, 3)
+        self.assertEqual(reported[0].status, 200)
+
+    def test_failing_hook_does_not_fail_the_call(self):
+        def hook(metrics: RequestMetrics) -> None:
+            raise RuntimeError("hook failed")
+
+        adapter = ScriptedAdapter([200], b"\\id MAT")
+        with self.assertLogs("serval_client", level="ERROR"):
+            with make_client(adapter, hooks=[hook]).data_files_download("file1") as f:
+                self.assertEqual(f.read(), b"\\id MAT")
+
+
+if __name__ == "__main__":
+    unittest.main()
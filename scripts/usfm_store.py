@@ -0,0 +1,308 @@
+#! /usr/bin/python3
+"""
+Content-addressed store of the Paratext projects pulled by pull_all_usfm.py.
+
+Every project zip is extracted once. Each file is stored under the SHA-256 of its contents
+(`objects/ab/cdef...`), so files shared by several projects or revisions are stored once.
+An SQLite index maps the projects to their files, books and Settings.xml metadata, so that a
+book can be opened with a single indexed lookup instead of scanning the archives:
+
+    with UsfmStore("usfm_store") as store:
+        path = store.book_path("BSB", "MAT")
+
+Projects are only extracted again when their revision or zip size changes.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from zipfile import ZipFile
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    short_name TEXT,
+    revision INTEGER,
+    zip_size INTEGER NOT NULL,
+    settings TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_name ON projects (name);
+CREATE INDEX IF NOT EXISTS projects_short_name ON projects (short_name);
+CREATE TABLE IF NOT EXISTS files (
+    project_id TEXT NOT NULL REFERENCES projects (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    object TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    book TEXT,
+    PRIMARY KEY (project_id, name)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS files_book ON files (project_id, book);
+"""
+
+_BOOK_ID = re.compile(rb"\\id\s+([A-Z0-9]{3})\b")
+
+
+@dataclass
+class ExtractedFile:
+    name: str
+    object: str
+    size: int
+    book: Optional[str]
+
+
+@dataclass
+class ExtractedProject:
+    settings: Dict[str, str]
+    files: List[ExtractedFile] = field(default_factory=list)
+
+
+def parse_settings(data: bytes) -> Dict[str, str]:
+    """Returns the simple elements of a Settings.xml and the attributes of its Naming element."""
+    root = ET.fromstring(data)
+    settings = {}
+    for element in root:
+        if len(element) == 0 and not element.attrib:
+            settings[element.tag] = element.text or ""
+    naming = root.find("Naming")
+    if naming is not None:
+        settings["FileNamePrePart"] = naming.get("PrePart", "")
+        settings["FileNamePostPart"] = naming.get("PostPart", "")
+        settings["FileNameBookNameForm"] = naming.get("BookNameForm", "")
+    return settings
+
+
+def _is_book_file(name: str, settings: Dict[str, str]) -> bool:
+    if "FileNamePostPart" in settings:
+        return name.startswith(settings.get("FileNamePrePart", "")) and name.endswith(
+            settings["FileNamePostPart"]
+        )
+    return name.lower().endswith((".sfm", ".usfm"))
+
+
+def book_id(data: bytes) -> Optional[str]:
+    """Returns the book id of the \\id marker at the start of a USFM file."""
+    match = _BOOK_ID.search(data, 0, 1024)
+    return match.group(1).decode("ascii") if match is not None else None
+
+
+class UsfmStore:
+    """Content-addressed store of Paratext projects with an SQLite index (thread-safe)."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite", check_same_thread=False
+        )
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(_SCHEMA)
+
+    def _put_object(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.objects_dir / digest[:2] / digest[2:]
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.part")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return f"{digest[:2]}/{digest[2:]}"
+
+    def extract(self, zip_path: str) -> ExtractedProject:
+        """Stores the files of a project zip; the index is not changed."""
+        with ZipFile(zip_path) as zip_file:
+            names = [info.filename for info in zip_file.infolist() if not info.is_dir()]
+            settings = {}
+            if "Settings.xml" in names:
+                settings = parse_settings(zip_file.read("Settings.xml"))
+            project = ExtractedProject(settings)
+            books = set()
+            for name in names:
+                data = zip_file.read(name)
+                book = book_id(data) if _is_book_file(name, settings) else None
+                if book in books:
+                    # Keep the first file of a book; the other is not a book file then.
+                    book = None
+                if book is not None:
+                    books.add(book)
+                project.files.append(
+                    ExtractedFile(name, self._put_object(data), len(data), book)
+                )
+        return project
+
+    def is_current(self, project_id: str, revision: Optional[int], zip_size: int) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT revision, zip_size FROM projects WHERE id = ?", (project_id,)
+            ).fetchone()
+        return row is not None and tuple(row) == (revision, zip_size)
+
+    def add_project(
+        self,
+        project_id: str,
+        name: str,
+        zip_path: str,
+        revision: Optional[int] = None,
+    ) -> None:
+        """Extracts a project and replaces its index entries."""
+        extracted = self.extract(zip_path)
+        zip_size = os.path.getsize(zip_path)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+            self._db.execute(
+                "INSERT INTO projects (id, name, short_name, revision, zip_size, settings) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    project_id,
+                    name,
+                    extracted.settings.get("Name"),
+                    revision,
+                    zip_size,
+                    json.dumps(extracted.settings),
+                ),
+            )
+            self._db.executemany(
+                "INSERT INTO files (project_id, name, object, size, book) VALUES (?, ?, ?, ?, ?)",
+                [(project_id, f.name, f.object, f.size, f.book) for f in extracted.files],
+            )
+
+    def remove_project(self, project_id: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+
+    def _project_id(self, project: str) -> Optional[str]:
+        """Resolves a project id, file name or Paratext short name to the id."""
+        row = self._db.execute(
+            "SELECT id FROM projects WHERE id = ? OR name = ? OR short_name = ? ORDER BY id = ? DESC LIMIT 1",
+            (project, project, project, project),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def project_ids(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT id FROM projects")]
+
+    def settings(self, project: str) -> Optional[Dict[str, str]]:
+        """Returns the Settings.xml metadata of a project, given by id, file name or short name."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT settings FROM projects WHERE id = ?", (self._project_id(project),)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def book_path(self, project: str, book: str) -> Optional[Path]:
+        """
+        Returns the path of a book of a project, given by id, file name or short name.
+
+        :return: the path, or None if the project has no such book
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT object FROM files WHERE project_id = ? AND book = ?",
+                (self._project_id(project), book),
+            ).fetchone()
+        return self.objects_dir / row[0] if row is not None else None
+
+    def books(self, project: str) -> Dict[str, Tuple[Path, int]]:
+        """Returns the path and size of every book of a project, given by id, file name or short name."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT book, object, size FROM files WHERE project_id = ? AND book IS NOT NULL",
+                (self._project_id(project),),
+            ).fetchall()
+        return {book: (self.objects_dir / obj, size) for book, obj, size in rows}
+
+    def file_path(self, project: str, name: str) -> Optional[Path]:
+        """Returns the path of any file of a project, e.g. "custom.vrs"."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT object FROM files WHERE project_id = ? AND name = ?",
+                (self._project_id(project), name),
+            ).fetchone()
+        return self.objects_dir / row[0] if row is not None else None
+
+    def collect_garbage(self) -> int:
+        """Deletes the objects that are no longer referenced by any project; returns their number."""
+        with self._lock:
+            referenced = {row[0] for row in self._db.execute("SELECT object FROM files")}
+        removed = 0
+        for path in self.objects_dir.glob("*/*"):
+            if path.suffix == ".part":
+                continue
+            if f"{path.parent.name}/{path.name}" not in referenced:
+                path.unlink()
+                removed += 1
+        return removed
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "UsfmStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def sync_store(store: UsfmStore, usfm_dir: str, jobs: int = 4) -> Tuple[int, int]:
+    """
+    Brings the store up to date with the index.json written by pull_all_usfm.py.
+
+    :return: the number of projects extracted and removed
+    """
+    with open(Path(usfm_dir) / "index.json", "r", encoding="utf-8") as f:
+        entries = json.load(f)["files"]
+    changed = [
+        entry
+        for entry in entries
+        if not store.is_current(entry["id"], entry["revision"], entry["size"])
+    ]
+
+    def extract(entry: Dict) -> None:
+        zip_path = str(Path(usfm_dir) / entry["path"])
+        try:
+            store.add_project(entry["id"], entry["name"], zip_path, entry["revision"])
+        except Exception as e:
+            print(f"Failed to extract {entry['name']} because of exception {e}")
+            store.remove_project(entry["id"])
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(extract, changed))
+    ids = {entry["id"] for entry in entries}
+    removed = [id for id in store.project_ids() if id not in ids]
+    for id in removed:
+        store.remove_project(id)
+    store.collect_garbage()
+    return len(changed), len(removed)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract the Paratext projects pulled by pull_all_usfm.py into an indexed store"
+    )
+    parser.add_argument(
+        "--usfm-dir", default="usfm", help="Directory the projects were pulled to"
+    )
+    parser.add_argument(
+        "--store-dir", default="usfm_store", help="Directory of the store"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=4, help="Number of projects to extract concurrently"
+    )
+    args = parser.parse_args()
+    with UsfmStore(args.store_dir) as store:
+        extracted, removed = sync_store(store, args.usfm_dir, args.jobs)
+    print(f"{extracted} projects extracted, {removed} removed")
+
+
+if __name__ == "__main__":
+    main()
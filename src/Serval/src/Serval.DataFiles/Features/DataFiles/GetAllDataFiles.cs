@@ -1,6 +1,6 @@
 namespace Serval.DataFiles.Features.DataFiles;
 
-public record GetAllDataFiles(string Owner) : IRequest<GetAllDataFilesResponse>;
+public record GetAllDataFiles(string Owner, FileFormat? Format = null) : IRequest<GetAllDataFilesResponse>;
 
 public record GetAllDataFilesResponse(IEnumerable<DataFileDto> DataFiles);
 
@@ -9,9 +9,13 @@ public class GetAllDataFilesHandler(IRepository<DataFile> dataFiles, DtoMapper m
 {
     public async Task<GetAllDataFilesResponse> HandleAsync(GetAllDataFiles request, CancellationToken cancellationToken)
     {
-        IEnumerable<DataFileDto> dtos = (
-            await dataFiles.GetAllAsync(f => f.Owner == request.Owner, cancellationToken)
-        ).Select(mapper.Map);
+        IEnumerable<DataFile> result = request.Format is null
+            ? await dataFiles.GetAllAsync(f => f.Owner == request.Owner, cancellationToken)
+            : await dataFiles.GetAllAsync(
+                f => f.Owner == request.Owner && f.Format == request.Format,
+                cancellationToken
+            );
+        IEnumerable<DataFileDto> dtos = result.Select(mapper.Map);
         return new(dtos);
     }
 }
@@ -21,6 +25,8 @@ public partial class DataFilesController
     /// <summary>
     /// Get all files
     /// </summary>
+    /// <param name="format">Only return files of this format (optional).</param>
+    /// <param name="cancellationToken"></param>
     /// <response code="200">A list of all files owned by the client</response>
     /// <response code="401">The client is not authenticated</response>
     /// <response code="403">The authenticated client cannot perform the operation</response>
@@ -32,11 +38,12 @@ public partial class DataFilesController
     [ProducesResponseType(typeof(void), StatusCodes.Status403Forbidden)]
     [ProducesResponseType(typeof(void), StatusCodes.Status503ServiceUnavailable)]
     public async Task<IEnumerable<DataFileDto>> GetAllAsync(
+        [FromQuery(Name = "format")] FileFormat? format,
         [FromServices] IRequestHandler<GetAllDataFiles, GetAllDataFilesResponse> handler,
         CancellationToken cancellationToken
     )
     {
-        GetAllDataFilesResponse response = await handler.HandleAsync(new(Owner), cancellationToken);
+        GetAllDataFilesResponse response = await handler.HandleAsync(new(Owner, format), cancellationToken);
         return response.DataFiles;
     }
 }
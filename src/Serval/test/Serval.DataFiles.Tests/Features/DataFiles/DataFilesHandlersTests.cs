@@ -26,6 +26,29 @@ public class DataFilesHandlersTests
         Assert.That(response.DataFiles.Count(), Is.EqualTo(2));
     }
 
+    [Test]
+    public async Task GetAllDataFiles_Format()
+    {
+        var env = new TestEnvironment();
+        await env.CreateDataFileAsync("df0000000000000000000001");
+        await env.DataFiles.InsertAsync(
+            new DataFile
+            {
+                Id = "df0000000000000000000002",
+                Owner = Owner,
+                Name = "file2",
+                Filename = "file2.zip",
+                Format = FileFormat.Paratext,
+            }
+        );
+        GetAllDataFilesHandler handler = new(env.DataFiles, env.Mapper);
+        GetAllDataFilesResponse response = await handler.HandleAsync(
+            new(Owner, FileFormat.Paratext),
+            CancellationToken.None
+        );
+        Assert.That(response.DataFiles.Select(f => f.Id), Is.EqualTo(new[] { "df0000000000000000000002" }));
+    }
+
     [Test]
     public async Task GetDataFile_FileExists()
     {